@@ -0,0 +1,319 @@
+"""In-process load test of the application with a realistic traffic mix.
+
+Drives the ASGI app from ``APIBuilder.create()`` directly (no sockets) with
+``--concurrency`` concurrent clients. Generation requests pick one of
+``--configs`` project configurations with Zipf-distributed popularity, so a
+few configurations dominate as they do in production; the rest of the mix is
+health probes and docs hits. A share of the traffic (``--abusive-share``)
+comes from a single client that ends up rate limited.
+
+Reports throughput, p50/p95/p99 latency and error rates per route, and the
+peak RSS of the process during the run.
+
+Run with ``python -m benchmarks.load``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import statistics
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from benchmarks.matrix import configuration_matrix
+from src.infrastructure.api import APIBuilder
+from src.infrastructure.schemas.project import ProjectSchema
+
+DEFAULT_MIX = "post_generate=40,get_generate=30,health=15,live=5,docs=10"
+ABUSIVE_CLIENT = "198.51.100.66"
+
+
+@dataclass
+class RouteStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def _parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, weight = item.split("=")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def _configurations(count: int, rng: random.Random) -> List[ProjectSchema]:
+    """``count`` distinct configurations in random popularity order"""
+    schemas = [schema for _, schema in configuration_matrix()]
+    rng.shuffle(schemas)
+    return [
+        schema.model_copy(update={"project_name": f"project_{index}"})
+        for index, schema in enumerate(schemas[:count])
+    ]
+
+
+def _zipf_weights(count: int, exponent: float) -> List[float]:
+    return [1 / rank**exponent for rank in range(1, count + 1)]
+
+
+class RssSampler:
+    """Tracks the peak resident set size from a background thread"""
+
+    def __init__(self, interval: float = 0.05):
+        import psutil
+
+        self.interval = interval
+        self._process = psutil.Process()
+        self.start_rss = self._process.memory_info().rss
+        self.peak_rss = self.start_rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+
+
+class LoadHarness:
+    def __init__(
+        self,
+        app,
+        *,
+        mix: Dict[str, float],
+        configs: List[ProjectSchema],
+        zipf_exponent: float,
+        abusive_share: float,
+        seed: int,
+    ):
+        self.app = app
+        self.routes = list(mix)
+        self.route_weights = list(mix.values())
+        self.configs = configs
+        self.config_weights = _zipf_weights(len(configs), zipf_exponent)
+        self.abusive_share = abusive_share
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+        generator_api = app.state.builder.generator_api
+        self._queries = [
+            generator_api.canonical_query(config.to_project()).encode()
+            for config in configs
+        ]
+        self._bodies = [config.model_dump_json().encode() for config in configs]
+
+    def _next_request(self) -> Tuple[str, str, str, bytes, bytes]:
+        """(route, method, path, query string, body) of the next request"""
+        route = self.rng.choices(self.routes, self.route_weights)[0]
+        if route in ("post_generate", "get_generate"):
+            index = self.rng.choices(range(len(self.configs)), self.config_weights)[0]
+            if route == "post_generate":
+                return route, "POST", "/generator/create", b"", self._bodies[index]
+            return route, "GET", "/generator/create", self._queries[index], b""
+        path = {
+            "health": "/health",
+            "live": "/health/live",
+            "ready": "/health/ready",
+            "docs": "/docs",
+            "openapi": "/openapi.json",
+            "metrics": "/metrics",
+        }[route]
+        return route, "GET", path, b"", b""
+
+    def _client(self) -> str:
+        if self.rng.random() < self.abusive_share:
+            return ABUSIVE_CLIENT
+        return f"10.{self.rng.randrange(256)}.{self.rng.randrange(256)}.1"
+
+    async def _request(
+        self, method: str, path: str, query: bytes, body: bytes, client: str
+    ) -> int:
+        headers = [(b"host", b"load"), (b"x-forwarded-for", client.encode())]
+        if body:
+            headers += [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ]
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query,
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("load", 80),
+            "state": {},
+        }
+        body_sent = False
+        response_done = asyncio.Event()
+        status = 0
+
+        async def receive():
+            nonlocal body_sent
+            if body_sent:
+                await response_done.wait()
+                return {"type": "http.disconnect"}
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_done.set()
+
+        await self.app(scope, receive, send)
+        return status
+
+    async def _worker(self, deadline: float, remaining: List[int]) -> None:
+        while perf_counter() < deadline and remaining[0] > 0:
+            remaining[0] -= 1
+            route, method, path, query, body = self._next_request()
+            client = self._client()
+            start = perf_counter()
+            try:
+                status = await self._request(method, path, query, body, client)
+            except Exception:
+                status = 599
+            stats = self.stats[route]
+            stats.latencies.append(perf_counter() - start)
+            stats.statuses[status] += 1
+
+    async def run(self, concurrency: int, duration: float, requests: int) -> float:
+        """Run the load; returns the elapsed wall time in seconds"""
+        remaining = [requests]
+        start = perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            *(self._worker(deadline, remaining) for _ in range(concurrency))
+        )
+        return perf_counter() - start
+
+
+def _percentile(values: List[float], quantile: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[
+        int(quantile * 100) - 1
+    ]
+
+
+def _report(stats: Dict[str, RouteStats], elapsed: float, rss: RssSampler) -> Dict:
+    routes = {}
+    total = 0
+    for route, route_stats in sorted(stats.items()):
+        count = len(route_stats.latencies)
+        total += count
+        server_errors = sum(n for s, n in route_stats.statuses.items() if s >= 500)
+        routes[route] = {
+            "requests": count,
+            "rps": count / elapsed,
+            "p50_ms": _percentile(route_stats.latencies, 0.50) * 1000,
+            "p95_ms": _percentile(route_stats.latencies, 0.95) * 1000,
+            "p99_ms": _percentile(route_stats.latencies, 0.99) * 1000,
+            "rate_limited": route_stats.statuses.get(429, 0) / count,
+            "error_rate": server_errors / count,
+            "statuses": dict(sorted(route_stats.statuses.items())),
+        }
+    return {
+        "elapsed_s": elapsed,
+        "requests": total,
+        "rps": total / elapsed,
+        "start_rss_mb": rss.start_rss / 2**20,
+        "peak_rss_mb": rss.peak_rss / 2**20,
+        # ru_maxrss is in KiB on Linux; it includes application start-up.
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "routes": routes,
+    }
+
+
+def _print(report: Dict) -> None:
+    print(
+        f"{'route':<15} {'requests':>9} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'429':>7} {'5xx':>7}"
+    )
+    for route, row in report["routes"].items():
+        print(
+            f"{route:<15} {row['requests']:>9} {row['rps']:9.1f} "
+            f"{row['p50_ms']:9.2f} {row['p95_ms']:9.2f} {row['p99_ms']:9.2f} "
+            f"{row['rate_limited']:7.1%} {row['error_rate']:7.1%}"
+        )
+    print(
+        f"\n{report['requests']} requests in {report['elapsed_s']:.1f} s, "
+        f"{report['rps']:.1f} req/s; RSS {report['start_rss_mb']:.0f} MiB at start, "
+        f"{report['peak_rss_mb']:.0f} MiB peak"
+    )
+
+
+async def _main(args: argparse.Namespace) -> Dict:
+    rng = random.Random(args.seed)
+    app = APIBuilder.create()
+    logger.remove()
+    harness = LoadHarness(
+        app,
+        mix=_parse_mix(args.mix),
+        configs=_configurations(args.configs, rng),
+        zipf_exponent=args.zipf,
+        abusive_share=args.abusive_share,
+        seed=args.seed,
+    )
+    async with app.router.lifespan_context(app):
+        with RssSampler() as rss:
+            elapsed = await harness.run(args.concurrency, args.duration, args.requests)
+    return _report(harness.stats, elapsed, rss)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument(
+        "--requests", type=int, default=10**9, help="Stop after this many requests"
+    )
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help="Route weights; routes: post_generate, get_generate, health, live, "
+        "ready, docs, openapi, metrics",
+    )
+    matrix_size = sum(1 for _ in configuration_matrix())
+    parser.add_argument("--configs", type=int, default=64, help=f"Up to {matrix_size}")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--abusive-share", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    if not 1 <= args.configs <= matrix_size:
+        parser.error(f"--configs must be between 1 and {matrix_size}")
+
+    report = asyncio.run(_main(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print(report)
+
+
+if __name__ == "__main__":
+    main()
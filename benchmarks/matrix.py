@@ -0,0 +1,198 @@
+"""Generates every project configuration and checks it against golden hashes.
+
+Every combination of the implemented template types, dependency managers and
+include_* flags is generated. For each configuration the latency (best of
+``--runs``), file count and archive size are reported, and the SHA-256 of
+every generated file is compared with ``benchmarks/golden/matrix.json``, so
+an optimisation of the generation path can be checked byte for byte.
+
+``--record`` rewrites the golden file (only after an intended output
+change). ``--save-timings PATH`` stores the latencies and
+``--compare-timings PATH`` reports the speedup per configuration against
+such a file. Exits with status 1 when any output differs from the golden
+hashes.
+
+Run with ``python -m benchmarks.matrix``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import itertools
+import json
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, List, Tuple
+from zipfile import ZipFile
+
+from loguru import logger
+
+from src.infrastructure.enumerators.dependency_manager import DependencyManager
+from src.infrastructure.enumerators.template_type import TemplateType
+from src.infrastructure.schemas.project import ProjectSchema
+
+ROOT = Path(__file__).resolve().parents[1]
+GOLDEN_PATH = ROOT / "benchmarks" / "golden" / "matrix.json"
+
+TEMPLATE_TYPES = (TemplateType.MINIMAL, TemplateType.BASIC, TemplateType.FULL)
+FLAGS = (
+    "include_dockerfile",
+    "include_docker_compose",
+    "include_black",
+    "include_flake8",
+    "include_pre_commit",
+    "include_conventional_commit",
+)
+
+
+def configuration_matrix(
+    project_name: str = "golden_project",
+) -> Iterator[Tuple[str, ProjectSchema]]:
+    """(key, schema) for every combination of template, manager and flags"""
+    for template_type, manager, *values in itertools.product(
+        TEMPLATE_TYPES, DependencyManager, *([(False, True)] * len(FLAGS))
+    ):
+        flags = {flag: value for flag, value in zip(FLAGS, values)}
+        enabled = [flag.removeprefix("include_") for flag in FLAGS if flags[flag]]
+        key = f"{template_type.value}/{manager.value}/{'+'.join(enabled) or 'none'}"
+        yield key, ProjectSchema(
+            project_name=project_name,
+            template_type=template_type,
+            dependency_manager=manager,
+            **flags,
+        )
+
+
+def _file_hashes(archive: bytes) -> Dict[str, str]:
+    with ZipFile(io.BytesIO(archive)) as zip_file:
+        return {
+            name: hashlib.sha256(zip_file.read(name)).hexdigest()
+            for name in sorted(zip_file.namelist())
+        }
+
+
+async def _generate_all(runs: int) -> Dict[str, Dict]:
+    from src.application.services.project_service import ProjectService
+    from src.infrastructure.generators.jinja_project_generator import (
+        JinjaProjectGenerator,
+    )
+    from src.infrastructure.repositories.jinja_template_repository import (
+        JinjaTemplateRepository,
+    )
+
+    repository = JinjaTemplateRepository(str(ROOT / "src/infrastructure/templates"))
+    repository.preload()
+    service = ProjectService(JinjaProjectGenerator(repository))
+
+    results = {}
+    for key, schema in configuration_matrix():
+        project = schema.to_project()
+        timings = []
+        for _ in range(runs):
+            start = perf_counter()
+            archive = await service.generate_project(project)
+            timings.append(perf_counter() - start)
+        files = _file_hashes(archive)
+        results[key] = {
+            "latency_ms": min(timings) * 1000,
+            "files": files,
+            "archive_bytes": len(archive),
+        }
+    return results
+
+
+def _diff(results: Dict[str, Dict], golden: Dict[str, Dict[str, str]]) -> List[str]:
+    problems = []
+    for key in sorted(golden.keys() - results.keys()):
+        problems.append(f"{key}: configuration no longer generated")
+    for key, result in results.items():
+        expected = golden.get(key)
+        if expected is None:
+            problems.append(f"{key}: no golden hashes recorded")
+            continue
+        files = result["files"]
+        for name in sorted(expected.keys() | files.keys()):
+            if name not in files:
+                problems.append(f"{key}: missing {name}")
+            elif name not in expected:
+                problems.append(f"{key}: unexpected {name}")
+            elif files[name] != expected[name]:
+                problems.append(f"{key}: {name} differs")
+    return problems
+
+
+def _write_json(path: Path, data: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--record", action="store_true", help="Rewrite golden hashes")
+    parser.add_argument("--save-timings", type=Path, default=None)
+    parser.add_argument("--compare-timings", type=Path, default=None)
+    parser.add_argument("--quiet", action="store_true", help="Only print totals")
+    args = parser.parse_args()
+    logger.remove()
+
+    results = asyncio.run(_generate_all(args.runs))
+    previous = (
+        json.loads(args.compare_timings.read_text()) if args.compare_timings else None
+    )
+
+    width = max(len(key) for key in results)
+    if not args.quiet:
+        header = f"{'configuration':<{width}} {'ms':>8} {'files':>6} {'bytes':>8}"
+        print(header + (f" {'speedup':>8}" if previous else ""))
+    speedups = []
+    for key, result in results.items():
+        line = (
+            f"{key:<{width}} {result['latency_ms']:8.2f} {len(result['files']):>6} "
+            f"{result['archive_bytes']:>8}"
+        )
+        if previous and key in previous:
+            speedup = previous[key] / result["latency_ms"]
+            speedups.append(speedup)
+            line += f" {speedup:7.2f}x"
+        if not args.quiet:
+            print(line)
+
+    latencies = [result["latency_ms"] for result in results.values()]
+    print(
+        f"\n{len(results)} configurations, latency median "
+        f"{statistics.median(latencies):.2f} ms, max {max(latencies):.2f} ms, "
+        f"total {sum(latencies):.0f} ms"
+    )
+    if speedups:
+        print(f"speedup geometric mean {statistics.geometric_mean(speedups):.2f}x")
+
+    if args.save_timings:
+        _write_json(
+            args.save_timings,
+            {key: result["latency_ms"] for key, result in results.items()},
+        )
+    if args.record:
+        _write_json(
+            GOLDEN_PATH, {key: result["files"] for key, result in results.items()}
+        )
+        print(f"golden hashes written to {GOLDEN_PATH.relative_to(ROOT)}")
+        return
+
+    if not GOLDEN_PATH.exists():
+        print(f"no golden hashes at {GOLDEN_PATH}; record them with --record")
+        sys.exit(1)
+    problems = _diff(results, json.loads(GOLDEN_PATH.read_text()))
+    for problem in problems:
+        print(problem)
+    if problems:
+        print(f"{len(problems)} difference(s) from the golden output")
+        sys.exit(1)
+    print("all outputs match the golden hashes")
+
+
+if __name__ == "__main__":
+    main()
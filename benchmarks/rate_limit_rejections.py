@@ -0,0 +1,91 @@
+"""Cost of answering a rate-limited request through the full application.
+
+Run with ``python -m benchmarks.rate_limit_rejections``.
+"""
+
+import argparse
+import asyncio
+import json
+from time import perf_counter
+
+from loguru import logger
+
+from src.infrastructure.api import APIBuilder
+
+BODY = json.dumps(
+    {"template_type": "basic", "include_dockerfile": True, "project_name": "x" * 64}
+).encode()
+
+
+def _scope(client: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/generator/create",
+        "raw_path": b"/generator/create",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(BODY)).encode()),
+            (b"x-forwarded-for", client.encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def _request(app, scope: dict, reads: list) -> int:
+    status = 0
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        reads.append(1)
+        return {"type": "http.request", "body": BODY, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _run(number: int) -> None:
+    app = APIBuilder.create()
+    scope = _scope("203.0.113.7")
+    reads: list = []
+
+    status = 200
+    while status != 429:
+        status = await _request(app, scope, reads)
+
+    reads.clear()
+    start = perf_counter()
+    for _ in range(number):
+        await _request(app, scope, reads)
+    per_rejection = (perf_counter() - start) / number * 1e6
+
+    print(f"{'rejected request':<40} {per_rejection:8.2f} us/request")
+    print(f"{'body reads per rejected request':<40} {len(reads) / number:8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+    logger.remove()
+    asyncio.run(_run(args.number))
+
+
+if __name__ == "__main__":
+    main()
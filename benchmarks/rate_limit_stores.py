@@ -0,0 +1,72 @@
+"""Per-check cost of the rate-limit stores.
+
+Run with ``python -m benchmarks.rate_limit_stores``.
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import timeit
+from time import perf_counter
+
+from src.infrastructure.middleware.rate_limiting.shared_store import SharedMemoryStore
+from src.infrastructure.middleware.rate_limiting.store import SlidingWindowStore
+
+
+def _per_check_us(store, number: int, clients: int = 1024) -> float:
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(clients)]
+    state = {"i": 0}
+
+    def check():
+        state["i"] += 1
+        store.increment(keys[state["i"] % clients])
+
+    return timeit.timeit(check, number=number) / number * 1e6
+
+
+def _hammer(path: str, number: int) -> None:
+    store = SharedMemoryStore(60, path=path)
+    for i in range(number):
+        store.increment(f"client-{i % 64}")
+
+
+def _contended_per_check_us(path: str, processes: int, number: int) -> float:
+    workers = [
+        multiprocessing.Process(target=_hammer, args=(path, number))
+        for _ in range(processes)
+    ]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (perf_counter() - start) / (processes * number) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "ratelimit")
+        results = {
+            "sliding_window (in-process)": _per_check_us(
+                SlidingWindowStore(60), args.number
+            ),
+            "shared_memory (1 process)": _per_check_us(
+                SharedMemoryStore(60, path=path), args.number
+            ),
+            f"shared_memory ({args.processes} processes)": _contended_per_check_us(
+                path, args.processes, args.number // args.processes
+            ),
+        }
+
+    for name, per_check in results.items():
+        print(f"{name:<40} {per_check:8.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
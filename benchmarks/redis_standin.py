@@ -0,0 +1,193 @@
+"""Local stand-in for a Redis server, for development and testing only.
+
+It speaks enough of the Redis protocol for ``RedisRateLimitStore``: PING,
+AUTH, SELECT, GET, INCR, INCRBY, EXPIRE, SCRIPT LOAD/FLUSH and EVAL/EVALSHA
+of the sliding-window script, which is executed by an equivalent Python
+function. Like Redis, it starts with no scripts loaded.
+Start it with ``python -m benchmarks.redis_standin``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.infrastructure.middleware.rate_limiting.redis_store import (
+    SLIDING_WINDOW_SCRIPT,
+)
+from src.infrastructure.middleware.rate_limiting.resp import CRLF, RespError
+
+
+def encode_reply(value: Any) -> bytes:
+    if isinstance(value, RespError):
+        return b"-%s\r\n" % str(value).encode()
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, (list, tuple)):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(v) for v in value)
+    raise TypeError(f"Cannot encode {value!r}")
+
+
+class RedisStandInServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        *,
+        clock: Callable[[], float] = time,
+        latency: float = 0.0,
+    ):
+        self.host = host
+        self.port = port
+        self.clock = clock
+        self.latency = latency
+        self._data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self._scripts: Dict[str, Callable[[List[bytes], List[bytes]], Any]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self) -> "RedisStandInServer":
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._clients.values():
+                writer.close()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}"
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                writer.write(encode_reply(self._dispatch(command)))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._clients.pop(task, None)
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+        try:
+            line = await reader.readuntil(CRLF)
+        except asyncio.IncompleteReadError:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(CRLF))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _dispatch(self, command: List[bytes]) -> Any:
+        name, args = command[0].upper(), command[1:]
+        try:
+            if name == b"PING":
+                return "PONG"
+            if name in (b"AUTH", b"SELECT"):
+                return "OK"
+            if name == b"GET":
+                return self._get(args[0])
+            if name == b"INCR":
+                return self._incr(args[0])
+            if name == b"INCRBY":
+                return self._incr(args[0], int(args[1]))
+            if name == b"EXPIRE":
+                return self._expire(args[0], int(args[1]))
+            if name == b"SCRIPT" and args[0].upper() == b"LOAD":
+                return self._load_script(args[1])
+            if name == b"SCRIPT" and args[0].upper() == b"FLUSH":
+                self._scripts.clear()
+                return "OK"
+            if name in (b"EVALSHA", b"EVAL"):
+                sha = args[0].decode()
+                if name == b"EVAL":
+                    sha = self._load_script(args[0]).decode()
+                script = self._scripts.get(sha)
+                if script is None:
+                    return RespError("NOSCRIPT No matching script.")
+                key_count = int(args[1])
+                return script(args[2 : 2 + key_count], args[2 + key_count :])
+            return RespError(f"ERR unknown command '{name.decode()}'")
+        except (IndexError, ValueError) as e:
+            return RespError(f"ERR {str(e)}")
+
+    def _load_script(self, source: bytes) -> bytes:
+        sha = hashlib.sha1(source).hexdigest()
+        if source.decode() != SLIDING_WINDOW_SCRIPT:
+            raise ValueError("the stand-in only runs the sliding-window script")
+        self._scripts[sha] = self._sliding_window
+        return sha.encode()
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._data[key]
+            return None
+        return value
+
+    def _incr(self, key: bytes, amount: int = 1) -> int:
+        current = self._get(key)
+        value = int(current or 0) + amount
+        expires_at = self._data[key][1] if current is not None else None
+        self._data[key] = (str(value).encode(), expires_at)
+        return value
+
+    def _expire(self, key: bytes, seconds: int) -> int:
+        if self._get(key) is None:
+            return 0
+        self._data[key] = (self._data[key][0], self.clock() + seconds)
+        return 1
+
+    def _sliding_window(self, keys: List[bytes], args: List[bytes]) -> List[Any]:
+        cost, ttl = int(args[0]), int(args[1])
+        current = self._incr(keys[0], cost)
+        if current == cost:
+            self._expire(keys[0], ttl)
+        previous = int(self._get(keys[1]) or 0)
+        return [current - cost, previous]
+
+
+async def _serve(host: str, port: int) -> None:
+    server = await RedisStandInServer(host, port).start()
+    print(f"Redis stand-in listening on {server.url}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Redis stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    cli_args = parser.parse_args()
+    asyncio.run(_serve(cli_args.host, cli_args.port))
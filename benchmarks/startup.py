@@ -0,0 +1,99 @@
+"""Cold-start time of a worker, with a per-module import report.
+
+Starts fresh interpreters that import ``src.main`` (building the application)
+and fails with a non-zero exit status when the median cold start exceeds the
+budget (``STARTUP_BUDGET_MS`` unless ``--budget-ms`` is given).
+
+Run with ``python -m benchmarks.startup``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+COLD_START = "import src.main"
+
+
+def _run_ms(code: str) -> float:
+    start = perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=ROOT, capture_output=True
+    )
+    return (perf_counter() - start) * 1000
+
+
+def median_cold_start_ms(runs: int) -> float:
+    return statistics.median(_run_ms(COLD_START) for _ in range(runs))
+
+
+def _import_times() -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) from ``python -X importtime``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", COLD_START],
+        check=True,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        times.append((module.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def _by_package(times: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for module, self_us, _ in times:
+        parts = module.split(".")
+        package = ".".join(parts[:3]) if parts[0] == "src" else parts[0]
+        totals[package] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.budget_ms is None:
+        from src.infrastructure.config.settings import settings
+
+        args.budget_ms = settings.STARTUP_BUDGET_MS
+
+    times = _import_times()
+    print(f"{'package':<50} {'import ms':>10}")
+    for package, self_us in sorted(
+        _by_package(times).items(), key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        print(f"{package:<50} {self_us / 1000:10.1f}")
+
+    print(f"\n{'slowest modules (self)':<50} {'import ms':>10}")
+    for module, self_us, _ in sorted(times, key=lambda item: item[1], reverse=True)[
+        : args.top
+    ]:
+        print(f"{module:<50} {self_us / 1000:10.1f}")
+
+    baseline = statistics.median(_run_ms("pass") for _ in range(args.runs))
+    median = median_cold_start_ms(args.runs)
+    print(
+        f"\ncold start: median {median:.0f} ms over {args.runs} runs "
+        f"(bare interpreter {baseline:.0f} ms), budget {args.budget_ms:.0f} ms"
+    )
+    if median > args.budget_ms:
+        print("cold start exceeds the budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""Microbenchmarks of the generation and middleware hot paths.
+
+Each case reports its best time per call over several repeats. ``--save``
+stores the results as a new baseline in ``benchmarks/baselines``;
+``--compare`` checks them against the most recent baseline (or
+``--baseline PATH``) and exits with status 1 when a case is slower than the
+baseline by more than ``--threshold``. Baselines are only comparable on the
+machine that recorded them.
+
+Run with ``python -m benchmarks.suite``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from time import gmtime, perf_counter, strftime, time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from starlette.requests import Request
+
+from src.infrastructure.commands.basic_template import BasicTemplateCommand
+from src.infrastructure.commands.dependency import DependencyManagementCommand
+from src.infrastructure.commands.docker import DockerCommand
+from src.infrastructure.commands.documentation import DocumentationCommand
+from src.infrastructure.commands.minimal_template import MinimalTemplateCommand
+from src.infrastructure.commands.utils import UtilsCommand
+from src.infrastructure.generators.jinja_project_generator import (
+    JinjaProjectGenerator,
+)
+from src.infrastructure.middleware.logging.constants import (
+    DEFAULT_SENSITIVE_HEADERS,
+)
+from src.infrastructure.middleware.logging.request_logger import RequestLogger
+from src.infrastructure.middleware.logging.utils import mask_sensitive_data
+from src.infrastructure.middleware.rate_limiting.store import (
+    InMemoryStore,
+    SlidingWindowStore,
+    TokenBucketStore,
+)
+from src.infrastructure.repositories.jinja_template_repository import (
+    JinjaTemplateRepository,
+)
+from src.infrastructure.schemas.project import ProjectSchema
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_DIR = ROOT / "benchmarks" / "baselines"
+
+PAYLOAD = {
+    "project_name": "bench_project",
+    "template_type": "basic",
+    "dependency_manager": "poetry",
+    "include_dockerfile": True,
+    "include_docker_compose": True,
+    "include_black": True,
+    "include_flake8": True,
+    "include_pre_commit": True,
+    "include_conventional_commit": True,
+}
+LOGGED_BODY = json.dumps(
+    {**PAYLOAD, "credentials": {"authorization": "Bearer secret", "x-api-key": "k"}}
+).encode()
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    fn: Callable[[], Any]
+    is_async: bool = False
+
+
+def _keys(count: int = 1024) -> List[str]:
+    return [f"10.0.{i // 256}.{i % 256}" for i in range(count)]
+
+
+def _cycling(fn: Callable[[str], Any]) -> Callable[[], Any]:
+    keys = _keys()
+    state = {"i": 0}
+
+    def call():
+        state["i"] += 1
+        return fn(keys[state["i"] % len(keys)])
+
+    return call
+
+
+def _logged_request() -> Request:
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": LOGGED_BODY, "more_body": False}
+
+    return Request(
+        {
+            "type": "http",
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/generator/create",
+            "raw_path": b"/generator/create",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"bench"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(LOGGED_BODY)).encode()),
+                (b"authorization", b"Bearer secret"),
+                (b"user-agent", b"bench"),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        },
+        receive,
+    )
+
+
+def _cases(workdir: Path) -> List[Case]:
+    repository = JinjaTemplateRepository(str(ROOT / "src/infrastructure/templates"))
+    repository.preload()
+    project = ProjectSchema(**PAYLOAD).to_project()
+    context = JinjaProjectGenerator._create_context(project)
+    commands = [
+        MinimalTemplateCommand(repository),
+        BasicTemplateCommand(repository),
+        DockerCommand(repository),
+        DocumentationCommand(repository),
+        DependencyManagementCommand(repository),
+        UtilsCommand(repository),
+    ]
+
+    project_dir = workdir / "project"
+    project_dir.mkdir()
+
+    async def generate_files():
+        for command in commands[1:]:
+            await command.execute(project, context, project_dir)
+
+    asyncio.run(generate_files())
+
+    request_logger = RequestLogger()
+    legacy_store = InMemoryStore()
+    now = time()
+    for key in _keys():
+        for _ in range(50):
+            legacy_store.add_request(key, now)
+
+    cases = [
+        Case(
+            "generator.create_context",
+            lambda: JinjaProjectGenerator._create_context(project),
+        ),
+        Case(
+            "template.render.basic_main",
+            lambda: repository.render_template("basic/main.py.jinja", context),
+        ),
+        Case(
+            "template.render.readme",
+            lambda: repository.render_template("readme/README.poetry.jinja", context),
+        ),
+        Case(
+            "generator.prepare_zip_buffer",
+            lambda: JinjaProjectGenerator._prepare_zip_buffer(project_dir),
+        ),
+        Case(
+            "logging.mask_sensitive_data",
+            lambda: mask_sensitive_data(
+                json.loads(LOGGED_BODY), DEFAULT_SENSITIVE_HEADERS
+            ),
+        ),
+        Case(
+            "logging.request_build_log",
+            lambda: request_logger.build_log(_logged_request()),
+            is_async=True,
+        ),
+        Case(
+            "store.in_memory.add_request",
+            _cycling(InMemoryStore().add_request),
+        ),
+        Case(
+            "store.in_memory.get_requests_count",
+            _cycling(lambda key: legacy_store.get_requests_count(key, 3600)),
+        ),
+        Case(
+            "store.sliding_window.increment", _cycling(SlidingWindowStore(60).increment)
+        ),
+        Case(
+            "store.token_bucket.increment",
+            _cycling(TokenBucketStore(10**9, 60).increment),
+        ),
+    ]
+    for command in commands:
+        output = workdir / command.name
+        output.mkdir()
+        cases.append(
+            Case(
+                f"command.{command.name}.execute",
+                lambda command=command, output=output: command.execute(
+                    project, context, output
+                ),
+                is_async=True,
+            )
+        )
+    return cases
+
+
+async def _run_async(fn: Callable[[], Any], number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        await fn()
+    return perf_counter() - start
+
+
+def _measure(case: Case, loop, min_time: float, repeat: int) -> float:
+    """Best time per call in microseconds"""
+
+    def timed(number: int) -> float:
+        if case.is_async:
+            return loop.run_until_complete(_run_async(case.fn, number))
+        fn = case.fn
+        start = perf_counter()
+        for _ in range(number):
+            fn()
+        return perf_counter() - start
+
+    number = 1
+    while (elapsed := timed(number)) < min_time / 10:
+        number *= 2
+    number = max(1, int(number * min_time / elapsed))
+    return min(timed(number) for _ in range(repeat)) / number * 1e6
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _latest_baseline() -> Optional[Path]:
+    baselines = sorted(BASELINE_DIR.glob("*.json"))
+    return baselines[-1] if baselines else None
+
+
+def _save(results: Dict[str, float]) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    created_at = gmtime()
+    path = BASELINE_DIR / f"{strftime('%Y%m%dT%H%M%SZ', created_at)}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "created_at": strftime("%Y-%m-%dT%H:%M:%SZ", created_at),
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results_us": results,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n"
+    )
+    return path
+
+
+def _compare(results: Dict[str, float], baseline_path: Path, threshold: float) -> bool:
+    """Print the comparison; True when no case regressed beyond the threshold"""
+    baseline = json.loads(baseline_path.read_text())
+    previous = baseline["results_us"]
+    print(
+        f"\ncompared with {baseline_path.name} (commit {baseline.get('commit')}), "
+        f"threshold +{threshold:.0%}"
+    )
+    print(f"{'case':<45} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    regressions = []
+    for name, current in results.items():
+        if name not in previous:
+            print(f"{name:<45} {'-':>12} {current:12.2f} {'new':>8}")
+            continue
+        change = current / previous[name] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<45} {previous[name]:12.2f} {current:12.2f} {change:+8.1%}"
+            + ("  REGRESSED" if regressed else "")
+        )
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed: {', '.join(regressions)}")
+    return not regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", default="", help="Run cases containing this")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="Store a new baseline")
+    parser.add_argument(
+        "--compare", action="store_true", help="Compare with the latest baseline"
+    )
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown before a case fails, as a fraction (0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+    logger.remove()
+
+    baseline_path = args.baseline or (_latest_baseline() if args.compare else None)
+    if args.compare and baseline_path is None:
+        print(f"no baseline in {BASELINE_DIR}; record one with --save")
+        sys.exit(1)
+
+    loop = asyncio.new_event_loop()
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'case':<45} {'us/call':>12}")
+        for case in _cases(Path(workdir)):
+            if args.filter not in case.name:
+                continue
+            results[case.name] = _measure(case, loop, args.min_time, args.repeat)
+            print(f"{case.name:<45} {results[case.name]:12.2f}")
+    loop.close()
+
+    if args.save:
+        print(f"\nbaseline saved to {_save(results).relative_to(ROOT)}")
+    if baseline_path is not None and not _compare(
+        results, baseline_path, args.threshold
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,24 +10,8 @@ class ProjectService:
         self.project_generator = project_generator
 
     async def create_project(self, project_schema: ProjectSchema) -> bytes:
-        project = Project(
-            name=project_schema.project_name,
-            description=project_schema.description,
-            template_type=project_schema.template_type,
-            python_version=project_schema.python_version,
-            author=project_schema.author,
-            dependency_manager=project_schema.dependency_manager,
-            dependencies={
-                "fastapi": project_schema.fastapi_version,
-                "uvicorn": project_schema.uvicorn_version,
-            },
-            include_dockerfile=project_schema.include_dockerfile,
-            include_docker_compose=project_schema.include_docker_compose,
-            include_black=project_schema.include_black,
-            include_conventional_commit=project_schema.include_conventional_commit,
-            include_pre_commit=project_schema.include_pre_commit,
-            include_flake8=project_schema.include_flake8,
-        )
+        return await self.generate_project(project_schema.to_project())
 
+    async def generate_project(self, project: Project) -> bytes:
         with tempfile.TemporaryDirectory() as temp_dir:
             return await self.project_generator.generate(project, Path(temp_dir))
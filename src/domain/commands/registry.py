@@ -1,5 +1,4 @@
 from typing import Dict, List
-from loguru import logger
 from src.domain.commands.base import ProjectCommand
 
 
@@ -16,7 +15,6 @@ class CommandRegistry:
         Args:
             command: The command instance to register
         """
-        logger.info(f"Registering command: {command.name}")
         self._commands[command.name] = command
 
     def get_command(self, name: str) -> ProjectCommand:
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class LockedDependency:
+    name: str
+    version: str
+    hashes: Tuple[str, ...] = ()
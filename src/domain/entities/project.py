@@ -1,20 +1,99 @@
-from dataclasses import dataclass
-from typing import Optional
+import json
+import re
+from dataclasses import dataclass, field, fields
+from hashlib import blake2b
+from typing import Optional, Tuple
+
+from src.infrastructure.enumerators.dependency_manager import DependencyManager
 from src.infrastructure.enumerators.template_type import TemplateType
 
+_PYTHON_VERSION = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?$")
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Project:
+    """Immutable, normalised specification of a project to generate.
+
+    Construction canonicalises equivalent spellings (``"3.10.0"`` and
+    ``"3.10"``, enum members and their string values, dependency order), so
+    two projects that render the same output compare equal and share a
+    ``fingerprint()``.
+    """
+
     name: str
     description: str
     template_type: TemplateType
     python_version: str
     author: Optional[str]
-    dependencies: dict[str, str]
+    dependencies: Tuple[Tuple[str, str], ...]
     include_dockerfile: bool = False
     include_docker_compose: bool = False
-    dependency_manager: str = "pip"
+    dependency_manager: DependencyManager = DependencyManager.PIP
     include_black: bool = False
     include_conventional_commit: bool = False
     include_pre_commit: bool = False
     include_flake8: bool = False
+    include_lockfile: bool = False
+    _fingerprint: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        dependencies = (
+            self.dependencies.items()
+            if isinstance(self.dependencies, dict)
+            else self.dependencies
+        )
+        normalised = {
+            "name": self.name.strip(),
+            "description": self.description.strip(),
+            "template_type": TemplateType(self.template_type),
+            "python_version": self.normalise_python_version(self.python_version),
+            "author": self.author.strip() if self.author else None,
+            "dependencies": tuple(
+                sorted(
+                    (name.strip().lower(), version.strip())
+                    for name, version in dependencies
+                )
+            ),
+            "dependency_manager": DependencyManager(self.dependency_manager),
+        }
+        for name, value in normalised.items():
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def normalise_python_version(version: str) -> str:
+        """Drops a ``.0`` patch release, so ``X.Y.0`` and ``X.Y`` are one spec.
+
+        Any other patch is kept: templates put the version in the Dockerfile
+        base image tag and ``requires-python``, where it matters.
+        """
+        version = version.strip()
+        match = _PYTHON_VERSION.match(version)
+        if match is None:
+            return version
+        major, minor, patch = match.groups()
+        if patch is None or int(patch) == 0:
+            return f"{int(major)}.{int(minor)}"
+        return f"{int(major)}.{int(minor)}.{int(patch)}"
+
+    def dependency_version(self, name: str) -> str:
+        for dependency, version in self.dependencies:
+            if dependency == name:
+                return version
+        raise KeyError(name)
+
+    def fingerprint(self) -> str:
+        """Stable hex digest of the canonical spec, computed once per instance"""
+        if self._fingerprint is None:
+            canonical = {
+                spec_field.name: getattr(self, spec_field.name)
+                for spec_field in fields(self)
+                if spec_field.compare
+            }
+            digest = blake2b(
+                json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode(),
+                digest_size=16,
+            ).hexdigest()
+            object.__setattr__(self, "_fingerprint", digest)
+        return self._fingerprint
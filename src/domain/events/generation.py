@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class PlanResolved:
+    """The commands a generation will run, in execution order"""
+
+    project_name: str
+    fingerprint: str
+    template_type: str
+    commands: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FileRendered:
+    """A command wrote a file; ``duration_s`` covers rendering and writing"""
+
+    command: str
+    path: str
+    size_bytes: int
+    duration_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class CommandFinished:
+    command: str
+    template_type: str
+    success: bool
+    duration_s: float
+    changes: int
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RollbackPerformed:
+    """A command's changes were undone after a later step failed"""
+
+    command: str
+    changes: int
+    success: bool
+    duration_s: float
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationFinished:
+    project_name: str
+    template_type: str
+    success: bool
+    duration_s: float
+    archive_bytes: int = 0
+    error: Optional[str] = None
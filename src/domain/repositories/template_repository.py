@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Dict, FrozenSet
 
 from jinja2 import Template
 
@@ -14,3 +14,18 @@ class TemplateRepository(ABC):
     def get_template_content(self, template_path: str) -> Template:
         """Get the content of a specific template file"""
         pass
+
+    @abstractmethod
+    def referenced_variables(self, template_path: str) -> FrozenSet[str]:
+        """Names of the context variables a template file reads"""
+        pass
+
+    @abstractmethod
+    def tree_digest(self) -> str:
+        """Digest that changes whenever any template changes"""
+        pass
+
+    @abstractmethod
+    def render_template(self, template_path: str, context: Dict[str, Any]) -> str:
+        """Render a template file with the given context"""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Tuple
+
+from src.domain.entities.locked_dependency import LockedDependency
+
+
+class DependencyResolver(ABC):
+    @abstractmethod
+    def resolve(
+        self, requirements: Iterable[str], python_version: str
+    ) -> Tuple[LockedDependency, ...]:
+        """Pin the requirements and their dependencies for a Python version"""
+        pass
@@ -1,40 +1,125 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from loguru import logger
 from fastapi.middleware.cors import CORSMiddleware
+from src.infrastructure.api.admin import AdminAPI
 from src.infrastructure.api.health import HealthAPI
 from src.infrastructure.api.generator import GeneratorAPI
+from src.infrastructure.api.metrics import MetricsAPI
 from src.infrastructure.config.settings import settings
+from src.infrastructure.enumerators.rate_limit_algorithm import RateLimitAlgorithm
+from src.infrastructure.enumerators.rate_limit_backend import RateLimitBackend
+from src.infrastructure.events.bus import event_bus
+from src.infrastructure.events.subscribers import install_subscribers
 from src.infrastructure.middleware.logging.request_logging_middleware import (
     RequestLoggingMiddleware,
 )
+from src.infrastructure.middleware.logging.sampling import SamplingPolicy
+from src.infrastructure.middleware.metrics.middleware import MetricsMiddleware
+from src.infrastructure.middleware.probes.middleware import ProbeMiddleware
 from src.infrastructure.middleware.rate_limiting.middleware import (
     RateLimitingMiddleware,
 )
+from src.infrastructure.middleware.rate_limiting.costs import RouteCostModel
+from src.infrastructure.middleware.rate_limiting.redis_store import RedisRateLimitStore
+from src.infrastructure.middleware.rate_limiting.shared_store import SharedMemoryStore
+from src.infrastructure.middleware.rate_limiting.sketch import HeavyHitterStore
+from src.infrastructure.middleware.rate_limiting.store import (
+    SlidingWindowStore,
+    TokenBucketStore,
+)
+from src.infrastructure.middleware.tracing.middleware import TracingMiddleware
+from src.infrastructure.observability.loop_monitor import loop_monitor
+from src.infrastructure.observability.metrics import registry
+from src.infrastructure.observability.startup import startup_profiler
+from src.infrastructure.observability.system import system_sampler
+from src.infrastructure.observability.tracing import TraceExporter
 
 
 class APIBuilder:
     def __init__(self, app: FastAPI):
         self.app = app
-        self._configure_middlewares()
-        self._configure_routes()
+        with startup_profiler.phase("middlewares"):
+            self._configure_middlewares()
+        with startup_profiler.phase("routes"):
+            self._configure_routes()
 
-    def _configure_middlewares(self):
+    @staticmethod
+    def _create_rate_limit_store(requests_limit: int, window_seconds: int):
+        if settings.RATE_LIMIT_BACKEND == RateLimitBackend.SHARED_MEMORY:
+            return SharedMemoryStore(
+                window_seconds,
+                path=settings.RATE_LIMIT_SHM_PATH,
+                slots=settings.RATE_LIMIT_SHM_SLOTS,
+            )
+        if settings.RATE_LIMIT_BACKEND == RateLimitBackend.REDIS:
+            return RedisRateLimitStore(
+                settings.RATE_LIMIT_REDIS_URL,
+                window_seconds,
+                pool_size=settings.RATE_LIMIT_REDIS_POOL_SIZE,
+                timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000,
+            )
+        if settings.RATE_LIMIT_ALGORITHM == RateLimitAlgorithm.TOKEN_BUCKET:
+            return TokenBucketStore(requests_limit, window_seconds)
+        if settings.RATE_LIMIT_ALGORITHM == RateLimitAlgorithm.HEAVY_HITTERS:
+            return HeavyHitterStore(
+                window_seconds,
+                width=settings.RATE_LIMIT_SKETCH_WIDTH,
+                depth=settings.RATE_LIMIT_SKETCH_DEPTH,
+                top_k=settings.RATE_LIMIT_TOP_K,
+            )
+        return SlidingWindowStore(window_seconds)
 
-        self.app.add_middleware(
-            RateLimitingMiddleware,
-            requests_limit=100,
-            window_seconds=60,
-            exclude_paths={"/health", "/metrics"},
-        )
+    def _configure_middlewares(self):
+        self.rate_limit_store = self._create_rate_limit_store(100, 60)
 
         self.app.add_middleware(
             RequestLoggingMiddleware,
-            exclude_paths={"/health"},
+            exclude_paths={"/health", "/metrics"},
             log_request_body=True,
             log_response_body=True,
             mask_sensitive_data=True,
             include_timing=True,
+            max_body_bytes=settings.LOG_MAX_BODY_BYTES,
+            sampling_policy=SamplingPolicy(
+                sample_rate=settings.LOG_SAMPLE_RATE,
+                slow_request_threshold_ms=settings.LOG_SLOW_REQUEST_MS,
+                route_overrides=settings.LOG_SAMPLE_ROUTE_OVERRIDES,
+            ),
+        )
+
+        self.app.add_middleware(
+            TracingMiddleware,
+            server_timing=settings.TRACE_SERVER_TIMING,
+            exporter=(
+                TraceExporter(settings.TRACE_EXPORT_PATH)
+                if settings.TRACE_EXPORT_PATH
+                else None
+            ),
         )
 
+        if settings.METRICS_MULTIPROC_DIR:
+            registry.configure_multiprocess(settings.METRICS_MULTIPROC_DIR)
+        self.app.add_middleware(MetricsMiddleware, exclude_paths={"/metrics"})
+
+        # Added after everything but CORS and the probes, so rejected requests
+        # never reach logging, tracing or metrics, and their body is never read.
+        self.app.add_middleware(
+            RateLimitingMiddleware,
+            requests_limit=100,
+            window_seconds=60,
+            exclude_paths={"/health", "/metrics"},
+            store=self.rate_limit_store,
+            cost_model=RouteCostModel(
+                static_costs=settings.RATE_LIMIT_ROUTE_COSTS,
+                cost_unit_ms=settings.RATE_LIMIT_COST_UNIT_MS,
+                max_cost=settings.RATE_LIMIT_MAX_COST,
+            ),
+        )
+
+        # CORS wraps the limiter: preflights are answered without spending the
+        # client's budget, and browsers can read the 429s it sends.
         self.app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -43,12 +128,59 @@ class APIBuilder:
             allow_headers=["*"],
         )
 
+        # Outermost: liveness must not depend on any other layer.
+        self.app.add_middleware(
+            ProbeMiddleware,
+            live_path="/health/live",
+            ready_path="/health/ready",
+            ready_check=loop_monitor.is_ready,
+        )
+
     def _configure_routes(self):
         HealthAPI(self.app)
-        GeneratorAPI(self.app)
+        self.generator_api = GeneratorAPI(self.app)
+        MetricsAPI(self.app)
+        AdminAPI(self.app, self.rate_limit_store)
+
+    def warm_up(self) -> None:
+        """Do lazily deferred work now, e.g. before forking workers"""
+        with startup_profiler.phase("warm_up"):
+            templates = self.generator_api.warm_up()
+        logger.info(f"Warmed up {templates} templates")
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        with startup_profiler.phase("lifespan"):
+            await self._start_background_services()
+        startup_profiler.log_report()
+        try:
+            yield
+        finally:
+            await loop_monitor.stop()
+            system_sampler.stop()
+            await self.rate_limit_store.close()
+
+    @staticmethod
+    async def _start_background_services():
+        system_sampler.interval = settings.HEALTH_SAMPLE_INTERVAL_SECONDS
+        system_sampler.start()
+        if settings.LOOP_MONITOR_ENABLED:
+            loop_monitor.interval = settings.LOOP_MONITOR_INTERVAL_MS / 1000
+            loop_monitor.block_threshold = settings.LOOP_BLOCK_THRESHOLD_MS / 1000
+            if settings.LOOP_READY_MAX_LAG_MS is not None:
+                loop_monitor.ready_max_lag = settings.LOOP_READY_MAX_LAG_MS / 1000
+            await loop_monitor.start()
 
     @classmethod
     def create(cls) -> FastAPI:
+        with startup_profiler.phase("logging"):
+            settings.configure_logging()
+            install_subscribers(
+                event_bus,
+                log_level=settings.log_level,
+                tracing=settings.TRACE_SERVER_TIMING
+                or settings.TRACE_EXPORT_PATH is not None,
+            )
         app = FastAPI(
             title=settings.APP_NAME,
             description="FastAPI project generator",
@@ -56,4 +188,7 @@ class APIBuilder:
             docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
             redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
         )
-        return cls(app).app
+        builder = cls(app)
+        app.router.lifespan_context = builder._lifespan
+        app.state.builder = builder
+        return builder.app
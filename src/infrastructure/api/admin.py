@@ -0,0 +1,299 @@
+import secrets
+import threading
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.middleware.rate_limiting.sketch import HeavyHitterStore
+from src.infrastructure.middleware.rate_limiting.store import RateLimitStore
+from src.infrastructure.observability.allocations import (
+    AllocationSite,
+    allocation_tracker,
+)
+from src.infrastructure.observability.loop_monitor import loop_monitor
+from src.infrastructure.observability.profiler import sampling_profiler
+from src.infrastructure.schemas.admin import (
+    AllocationReport,
+    AllocationSiteInfo,
+    AllocationSitesResponse,
+    BlockedCallbackInfo,
+    BlockedCallbacksResponse,
+    PhaseAllocationInfo,
+    ProfiledFunction,
+    ProfileResponse,
+    RateLimitOffender,
+    TopOffendersResponse,
+)
+
+
+class AdminAPI:
+    """Operator endpoints, guarded by the X-Admin-Token header.
+
+    When no ADMIN_TOKEN is configured every route answers 404, so the admin
+    surface does not exist unless it has been deliberately enabled.
+    """
+
+    API_TAGS = ["Admin"]
+    API_PREFIX = "/admin"
+
+    def __init__(self, app: FastAPI, rate_limit_store: Optional[RateLimitStore]):
+        self.rate_limit_store = rate_limit_store
+        self.router = APIRouter(dependencies=[Depends(self._require_token)])
+        self._register_routes()
+        app.include_router(self.router, prefix=self.API_PREFIX, tags=self.API_TAGS)
+
+    @staticmethod
+    async def _require_token(x_admin_token: Optional[str] = Header(default=None)):
+        if not settings.ADMIN_TOKEN:
+            raise HTTPException(status_code=404, detail="Not Found")
+        if not x_admin_token or not secrets.compare_digest(
+            x_admin_token.encode(), settings.ADMIN_TOKEN.encode()
+        ):
+            raise HTTPException(status_code=401, detail="Invalid admin token")
+
+    def _register_routes(self):
+        self.router.add_api_route(
+            path="/rate-limit/top-offenders",
+            endpoint=self.top_offenders,
+            methods=["GET"],
+            response_model=TopOffendersResponse,
+            summary="Heaviest rate-limited clients",
+            description="Clients with the highest estimated request counts in the "
+            "current sliding window (heavy_hitters algorithm only)",
+        )
+        self.router.add_api_route(
+            path="/event-loop/blocked",
+            endpoint=self.blocked_callbacks,
+            methods=["GET"],
+            response_model=BlockedCallbacksResponse,
+            summary="Recent callbacks that blocked the event loop",
+            description="Stacks captured by the event loop monitor while the loop "
+            "was blocked beyond LOOP_BLOCK_THRESHOLD_MS, most recent last",
+        )
+        self.router.add_api_route(
+            path="/allocations",
+            endpoint=self.allocation_report,
+            methods=["GET"],
+            response_model=AllocationReport,
+            summary="Allocations per request phase",
+            description="Mean net and peak bytes allocated by each span of the "
+            "requests sampled since allocation tracing was started",
+        )
+        self.router.add_api_route(
+            path="/allocations/start",
+            endpoint=self.start_allocation_tracing,
+            methods=["POST"],
+            response_model=AllocationReport,
+            summary="Start allocation tracing",
+            description="Starts tracemalloc, records a baseline snapshot and "
+            "attributes allocations of a sample of requests to their spans. "
+            "Slows the whole process down while it runs.",
+        )
+        self.router.add_api_route(
+            path="/allocations/stop",
+            endpoint=self.stop_allocation_tracing,
+            methods=["POST"],
+            response_model=AllocationReport,
+            summary="Stop allocation tracing",
+            description="Stops tracemalloc; returns the final report",
+        )
+        self.router.add_api_route(
+            path="/allocations/top",
+            endpoint=self.top_allocation_sites,
+            methods=["GET"],
+            response_model=AllocationSitesResponse,
+            summary="Largest live allocation sites",
+        )
+        self.router.add_api_route(
+            path="/allocations/diff",
+            endpoint=self.allocation_diff,
+            methods=["GET"],
+            response_model=AllocationSitesResponse,
+            summary="Allocation growth since the baseline snapshot",
+            description="Sites whose live allocations grew most since tracing "
+            "started, or since the last call with rebase=true",
+        )
+        self.router.add_api_route(
+            path="/profile",
+            endpoint=self.profile,
+            methods=["POST"],
+            response_model=ProfileResponse,
+            summary="Sample this worker's stacks for a while",
+            description="Runs a statistical profiler on this worker for the given "
+            "number of seconds and returns a top-functions table with collapsed "
+            "stacks; format=collapsed returns only the stacks, ready for "
+            "flamegraph.pl or speedscope",
+            responses={200: {"content": {"text/plain": {}}}},
+        )
+
+    async def top_offenders(self, limit: int = Query(default=10, ge=1, le=100)):
+        store = self.rate_limit_store
+        if not isinstance(store, HeavyHitterStore):
+            raise HTTPException(
+                status_code=409,
+                detail="Top offenders are tracked only by the heavy_hitters "
+                "rate-limit algorithm",
+            )
+        return TopOffendersResponse(
+            window_seconds=store.window_seconds,
+            offenders=[
+                RateLimitOffender(client=client, estimated_requests=count)
+                for client, count in store.top_offenders(limit)
+            ],
+        )
+
+    @staticmethod
+    async def blocked_callbacks():
+        return BlockedCallbacksResponse(
+            total=loop_monitor.blocked_total,
+            recent=[
+                BlockedCallbackInfo(
+                    detected_at=datetime.fromtimestamp(
+                        blocked.detected_at, timezone.utc
+                    ).isoformat(),
+                    blocked_ms=blocked.blocked_ms,
+                    stack=blocked.stack,
+                )
+                for blocked in loop_monitor.blocked
+            ],
+        )
+
+    @staticmethod
+    async def allocation_report():
+        traced, peak = allocation_tracker.traced_memory()
+        return AllocationReport(
+            active=allocation_tracker.active,
+            sample_rate=allocation_tracker.sample_rate,
+            frames=allocation_tracker.frames,
+            requests_traced=allocation_tracker.requests_traced,
+            traced_bytes=traced,
+            traced_peak_bytes=peak,
+            phases=[
+                PhaseAllocationInfo(
+                    phase=name,
+                    calls=phase.calls,
+                    mean_net_bytes=phase.net_bytes / phase.calls,
+                    mean_peak_bytes=phase.peak_bytes_total / phase.calls,
+                    max_peak_bytes=phase.peak_bytes_max,
+                )
+                for name, phase in sorted(allocation_tracker.phases.items())
+            ],
+        )
+
+    async def start_allocation_tracing(
+        self,
+        sample_rate: float = Query(default=0.1, gt=0.0, le=1.0),
+        frames: int = Query(default=10, ge=1, le=100),
+    ):
+        allocation_tracker.enable(sample_rate=sample_rate, frames=frames)
+        return await self.allocation_report()
+
+    async def stop_allocation_tracing(self):
+        report = await self.allocation_report()
+        allocation_tracker.disable()
+        report.active = False
+        return report
+
+    @staticmethod
+    def _require_tracing():
+        if not allocation_tracker.active:
+            raise HTTPException(
+                status_code=409,
+                detail="Allocation tracing is not running; start it with "
+                "POST /admin/allocations/start",
+            )
+
+    @staticmethod
+    def _sites_response(
+        group_by: str, sites: List[AllocationSite]
+    ) -> AllocationSitesResponse:
+        return AllocationSitesResponse(
+            group_by=group_by,
+            sites=[
+                AllocationSiteInfo(
+                    location=site.location,
+                    size_bytes=site.size,
+                    count=site.count,
+                    size_diff_bytes=site.size_diff,
+                    count_diff=site.count_diff,
+                )
+                for site in sites
+            ],
+        )
+
+    # Plain functions: snapshots take a while, so they run in the threadpool.
+    def top_allocation_sites(
+        self,
+        limit: int = Query(default=20, ge=1, le=500),
+        group_by: str = Query(
+            default="lineno", pattern="^(lineno|filename|traceback)$"
+        ),
+    ):
+        self._require_tracing()
+        return self._sites_response(
+            group_by, allocation_tracker.top_sites(limit, group_by)
+        )
+
+    def allocation_diff(
+        self,
+        limit: int = Query(default=20, ge=1, le=500),
+        group_by: str = Query(
+            default="lineno", pattern="^(lineno|filename|traceback)$"
+        ),
+        rebase: bool = Query(default=False),
+    ):
+        self._require_tracing()
+        return self._sites_response(
+            group_by, allocation_tracker.diff(limit, group_by, rebase=rebase)
+        )
+
+    @staticmethod
+    async def profile(
+        seconds: float = Query(default=10.0, gt=0.0, le=60.0),
+        interval_ms: float = Query(default=5.0, ge=1.0, le=100.0),
+        all_threads: bool = Query(
+            default=False, description="Sample every thread, not only the event loop"
+        ),
+        limit: int = Query(default=30, ge=1, le=500),
+        format: str = Query(default="json", pattern="^(json|collapsed)$"),
+    ):
+        if sampling_profiler.running:
+            raise HTTPException(
+                status_code=409, detail="A profile is already being taken"
+            )
+        # Sampling happens in a pool thread while this loop keeps serving.
+        try:
+            result = await run_in_threadpool(
+                sampling_profiler.profile,
+                seconds,
+                interval=interval_ms / 1000,
+                thread_id=threading.get_ident(),
+                all_threads=all_threads,
+            )
+        except RuntimeError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        if format == "collapsed":
+            return PlainTextResponse(result.collapsed())
+
+        active = max(result.samples - result.idle_samples, 1)
+        return ProfileResponse(
+            duration_s=result.duration_s,
+            interval_ms=interval_ms,
+            samples=result.samples,
+            idle_samples=result.idle_samples,
+            top_functions=[
+                ProfiledFunction(
+                    function=stat.function,
+                    self_samples=stat.self_samples,
+                    self_percent=stat.self_samples / active * 100,
+                    total_samples=stat.total_samples,
+                    total_percent=stat.total_samples / active * 100,
+                )
+                for stat in result.top_functions(limit)
+            ],
+            collapsed_stacks=result.collapsed(),
+        )
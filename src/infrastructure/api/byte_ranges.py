@@ -0,0 +1,53 @@
+import re
+from typing import Optional, Tuple
+
+from src.infrastructure.exceptions.range_not_satisfiable import RangeNotSatisfiable
+
+_BYTE_RANGE = re.compile(r"^(\d*)-(\d*)$")
+
+
+def parse_byte_range(header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """The ``(first, last)`` byte positions (inclusive) a Range header asks for.
+
+    Returns None when the whole content should be sent instead: no header,
+    a unit other than bytes, a syntactically invalid value, or more than
+    one range. Multipart responses are not produced, and RFC 9110 lets a
+    server ignore any Range it does not want to honour; a single range is
+    also all resuming or splitting a download needs. Raises
+    RangeNotSatisfiable when a valid range starts past the end of the
+    content or is an empty suffix.
+    """
+    if not header:
+        return None
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    match = _BYTE_RANGE.match(ranges.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+
+    if not first:
+        if not last:
+            return None
+        suffix = int(last)
+        if suffix == 0 or length == 0:
+            raise RangeNotSatisfiable(length)
+        return max(length - suffix, 0), length - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= length:
+        raise RangeNotSatisfiable(length)
+    return start, min(int(last), length - 1) if last else length - 1
+
+
+def if_range_matches(if_range: Optional[str], etag: str) -> bool:
+    """Whether a Range may be honoured given the request's If-Range.
+
+    Only a strong comparison with the current ETag counts; a weak tag or
+    an HTTP date (these responses carry no Last-Modified) means the client
+    holds a different representation and must get the whole content.
+    """
+    return if_range is None or if_range.strip() == etag
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, HTTPException, Response, FastAPI
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, HTTPException, Request, Response, FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import RedirectResponse
+from pydantic import ValidationError
+from src.domain.entities.project import Project
+from src.infrastructure.api.byte_ranges import if_range_matches, parse_byte_range
+from src.infrastructure.config.settings import settings
+from src.infrastructure.exceptions.range_not_satisfiable import RangeNotSatisfiable
+from src.infrastructure.repositories.archive_store import ArchiveStore, StoredArchive
 from src.infrastructure.schemas.project import ProjectSchema
 from src.application.services.project_service import ProjectService
-from src.infrastructure.generators.jinja_project_generator import JinjaProjectGenerator
-from src.infrastructure.repositories.jinja_template_repository import (
-    JinjaTemplateRepository,
-)
 
 
 class GeneratorAPI:
@@ -15,13 +22,59 @@ class GeneratorAPI:
     def __init__(self, app: FastAPI):
         self.app = app
         self.router = APIRouter()
-
-        template_repository = JinjaTemplateRepository()
-        project_generator = JinjaProjectGenerator(template_repository)
-        self.project_service = ProjectService(project_generator)
+        self._project_service: Optional[ProjectService] = None
+        self._template_repository = None
+        self.archive_store = ArchiveStore(
+            ttl_seconds=settings.ARCHIVE_TTL_SECONDS,
+            max_bytes=settings.ARCHIVE_STORE_MAX_BYTES,
+            directory=settings.ARCHIVE_STORE_DIR,
+        )
+        self._defaults = self._query_values(ProjectSchema().to_project())
 
         self._register_routes()
 
+    @property
+    def project_service(self) -> ProjectService:
+        if self._project_service is None:
+            # Imported on first use: jinja2 and every command module are only
+            # needed once a project is generated, not to bring the worker up.
+            from src.infrastructure.generators.jinja_project_generator import (
+                JinjaProjectGenerator,
+            )
+            from src.infrastructure.repositories.jinja_template_repository import (
+                JinjaTemplateRepository,
+            )
+
+            self._template_repository = JinjaTemplateRepository()
+            project_generator = JinjaProjectGenerator(
+                self._template_repository, self._dependency_resolver()
+            )
+            self._project_service = ProjectService(project_generator)
+        return self._project_service
+
+    @staticmethod
+    def _dependency_resolver():
+        if not settings.LOCKFILE_INDEX_PATH:
+            return None
+        from src.infrastructure.resolvers.index_resolver import (
+            IndexDependencyResolver,
+        )
+        from src.infrastructure.resolvers.package_index import PackageIndex
+
+        return IndexDependencyResolver(PackageIndex.load(settings.LOCKFILE_INDEX_PATH))
+
+    def warm_up(self) -> int:
+        """Build the generation service, compile every template and digest
+        the template tree now"""
+        self.project_service
+        self._template_repository.tree_digest()
+        return self._template_repository.preload()
+
+    @property
+    def templates_digest(self) -> str:
+        self.project_service
+        return self._template_repository.tree_digest()
+
     def _register_routes(self):
         self.router.add_api_route(
             path="/create",
@@ -31,22 +84,204 @@ class GeneratorAPI:
             response_class=Response,
             response_description="ZIP file containing the generated project",
         )
+        self.router.add_api_route(
+            path="/create",
+            endpoint=self.create_project_from_query,
+            methods=["GET"],
+            summary="Generate a new FastAPI project (cacheable)",
+            description="Same as the POST variant, with the project options as "
+            "query parameters. Non-canonical queries (unsorted, default values "
+            "or equivalent spellings) are redirected to the canonical URL, and "
+            "responses carry an ETag and Cache-Control so shared caches can "
+            "serve repeat downloads.",
+            response_class=Response,
+            response_description="ZIP file containing the generated project",
+            openapi_extra={"parameters": self._query_parameters()},
+        )
+        self.router.add_api_route(
+            path="/archives/{digest}",
+            endpoint=self.download_archive,
+            methods=["GET"],
+            summary="Download a generated project again by its SHA-256",
+            description="Every generated archive is kept for ARCHIVE_TTL_SECONDS "
+            "at the URL given in the Content-Location of the response that "
+            "produced it. Single byte ranges (Range, If-Range) are honoured, so "
+            "interrupted downloads can be resumed or split without generating "
+            "the project again.",
+            response_class=Response,
+            response_description="ZIP file, or the requested part of it",
+        )
+        self.router.add_api_route(
+            path="/archives/{digest}",
+            endpoint=self.download_archive,
+            methods=["HEAD"],
+            summary="Check a generated project is still stored",
+            description="The headers the GET would answer with (size, ETag, "
+            "Accept-Ranges, Content-Range), without the body.",
+            response_class=Response,
+        )
 
         self.app.include_router(self.router, prefix=self.API_PREFIX, tags=self.API_TAGS)
 
-    async def create_project(self, project_config: ProjectSchema):
+    @staticmethod
+    def _query_parameters() -> List[Dict[str, Any]]:
+        schema = ProjectSchema.model_json_schema(
+            ref_template="#/components/schemas/{model}"
+        )
+        return [
+            {
+                "name": name,
+                "in": "query",
+                "required": False,
+                "schema": field_schema,
+                "description": field_schema.get("description", ""),
+            }
+            for name, field_schema in schema["properties"].items()
+        ]
+
+    @staticmethod
+    def _query_values(project: Project) -> Dict[str, str]:
+        values = ProjectSchema.from_project(project).model_dump(mode="json")
+        return {
+            name: ("true" if value else "false") if isinstance(value, bool) else value
+            for name, value in values.items()
+        }
+
+    def canonical_query(self, project: Project) -> str:
+        """Sorted query string of the options that differ from the defaults"""
+        return urlencode(
+            sorted(
+                (name, value)
+                for name, value in self._query_values(project).items()
+                if value != self._defaults[name]
+            )
+        )
+
+    @staticmethod
+    def _ensure_supported(project_config: ProjectSchema) -> None:
+        """Reject options this server is not configured to generate"""
+        if project_config.include_lockfile and not settings.LOCKFILE_INDEX_PATH:
+            raise HTTPException(
+                status_code=501,
+                detail="include_lockfile is not available: no package index is "
+                "configured on this server (LOCKFILE_INDEX_PATH)",
+            )
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == etag for tag in candidates
+        )
+
+    async def create_project_from_query(self, request: Request):
         try:
-            zip_content = await self.project_service.create_project(project_config)
+            project_config = ProjectSchema.model_validate(dict(request.query_params))
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        project = project_config.to_project()
+        self._ensure_supported(project_config)
 
-            return Response(
-                content=zip_content,
-                media_type="application/zip",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{project_config.project_name}.zip"'
-                },
+        max_age = settings.GENERATOR_CACHE_MAX_AGE_SECONDS
+        cache_headers = {"Cache-Control": f"public, max-age={max_age}"}
+        canonical = self.canonical_query(project)
+        if request.url.query != canonical:
+            location = request.url.path + (f"?{canonical}" if canonical else "")
+            return RedirectResponse(location, status_code=308, headers=cache_headers)
+
+        # The project fingerprint, the release and the templates as loaded
+        # together identify the archive, so editing a template without a
+        # version bump still changes the ETag.
+        etag = (
+            f'"{project.fingerprint()}-{settings.APP_VERSION}'
+            f'-{self.templates_digest}"'
+        )
+        headers = {**cache_headers, "ETag": etag}
+        if self._etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        # A resumed or split download finds the archive it started on here.
+        archive = self.archive_store.get_by_alias(etag)
+        if archive is None:
+            try:
+                zip_content = await self.project_service.generate_project(project)
+            except Exception as e:
+                # The generator's errors already say the generation failed.
+                raise HTTPException(status_code=500, detail=str(e))
+            archive = self.archive_store.put(
+                zip_content, f"{project.name}.zip", alias=etag
             )
+        return self._archive_response(request, archive, etag, headers)
 
+    async def create_project(self, project_config: ProjectSchema):
+        self._ensure_supported(project_config)
+        try:
+            zip_content = await self.project_service.create_project(project_config)
         except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Failed to generate project: {str(e)}"
+            raise HTTPException(status_code=500, detail=str(e))
+        archive = self.archive_store.put(
+            zip_content, f"{project_config.project_name}.zip"
+        )
+        return Response(
+            content=archive.content,
+            media_type="application/zip",
+            headers=self._archive_headers(archive, archive.etag),
+        )
+
+    async def download_archive(self, request: Request, digest: str):
+        archive = self.archive_store.get(digest)
+        if archive is None:
+            raise HTTPException(status_code=404, detail="Archive not found or expired")
+        remaining = max(int(archive.expires_at - self.archive_store.clock()), 0)
+        headers = {"Cache-Control": f"public, max-age={remaining}, immutable"}
+        if self._etag_matches(request.headers.get("if-none-match"), archive.etag):
+            return Response(status_code=304, headers={**headers, "ETag": archive.etag})
+        response = self._archive_response(request, archive, archive.etag, headers)
+        if request.method == "HEAD":
+            # The headers (Content-Length included) of a GET, without the body.
+            response.body = b""
+        return response
+
+    def _archive_headers(self, archive: StoredArchive, etag: str) -> Dict[str, str]:
+        headers = {
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f'attachment; filename="{archive.filename}"',
+        }
+        if archive.kept:
+            # Only advertised when another request can actually fetch it.
+            headers["Content-Location"] = f"{self.API_PREFIX}/archives/{archive.digest}"
+        return headers
+
+    def _archive_response(
+        self,
+        request: Request,
+        archive: StoredArchive,
+        etag: str,
+        headers: Dict[str, str],
+    ) -> Response:
+        """The archive, or the single byte range the request asks for"""
+        headers = {**headers, **self._archive_headers(archive, etag)}
+        length = len(archive.content)
+        byte_range = None
+        if if_range_matches(request.headers.get("if-range"), etag):
+            try:
+                byte_range = parse_byte_range(request.headers.get("range"), length)
+            except RangeNotSatisfiable:
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{length}"},
+                )
+        if byte_range is None:
+            return Response(
+                content=archive.content, media_type="application/zip", headers=headers
             )
+        first, last = byte_range
+        return Response(
+            content=archive.content[first : last + 1],
+            status_code=206,
+            media_type="application/zip",
+            headers={**headers, "Content-Range": f"bytes {first}-{last}/{length}"},
+        )
@@ -1,12 +1,20 @@
-from fastapi import APIRouter, status
-import platform
-import sys
-import psutil
+from fastapi import APIRouter, Response, status
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
 from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.loop_monitor import (
+    EventLoopMonitor,
+    loop_monitor as default_loop_monitor,
+)
+from src.infrastructure.observability.system import (
+    SystemMetricsSampler,
+    SystemSnapshot,
+    system_sampler,
+)
 from src.infrastructure.schemas.health import (
+    EventLoopInfo,
     HealthResponse,
     SystemInfo,
     PythonInfo,
@@ -15,43 +23,91 @@ from src.infrastructure.schemas.health import (
 
 
 class HealthAPI:
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        sampler: SystemMetricsSampler = None,
+        loop_monitor: EventLoopMonitor = None,
+    ):
         self.router = APIRouter()
         self.start_time = time.time()
+        self.sampler = sampler or system_sampler
+        self.loop_monitor = loop_monitor or default_loop_monitor
+        self._body_snapshot: Optional[SystemSnapshot] = None
+        self._system_json = b""
         self._configure_routes()
         app.include_router(self.router)
 
-    def _configure_routes(self):
-        @self.router.get(
-            "/health",
-            response_model=HealthResponse,
-            status_code=status.HTTP_200_OK,
-            tags=["Health"],
-            summary="Check service health",
-            description="Returns detailed health information about the service",
-        )
-        async def health_check():
-            return HealthResponse(
+    def _build_system_json(self, snapshot: SystemSnapshot) -> bytes:
+        """The body without its event-loop section and closing brace"""
+        info = self.sampler.platform
+        return (
+            HealthResponse(
                 status="healthy",
                 environment=settings.ENVIRONMENT,
                 version=settings.APP_VERSION,
-                timestamp=datetime.utcnow().isoformat(),
-                uptime=time.time() - self.start_time,
+                timestamp=datetime.fromtimestamp(
+                    snapshot.taken_at, timezone.utc
+                ).isoformat(),
+                uptime=snapshot.taken_at - self.start_time,
                 python_info=PythonInfo(
-                    version=sys.version,
-                    implementation=platform.python_implementation(),
-                    compiler=platform.python_compiler(),
+                    version=info.python_version,
+                    implementation=info.python_implementation,
+                    compiler=info.python_compiler,
                 ),
                 system_info=SystemInfo(
-                    platform=platform.platform(),
-                    architecture=platform.machine(),
-                    processor=platform.processor() or "Unknown",
-                    cpu_count=psutil.cpu_count(),
-                    cpu_usage=psutil.cpu_percent(interval=0.1),
+                    platform=info.platform,
+                    architecture=info.architecture,
+                    processor=info.processor,
+                    cpu_count=info.cpu_count,
+                    cpu_usage=snapshot.cpu_percent,
                 ),
                 memory_usage=MemoryInfo(
-                    total=psutil.virtual_memory().total,
-                    available=psutil.virtual_memory().available,
-                    used_percent=psutil.virtual_memory().percent,
+                    total=snapshot.memory_total,
+                    available=snapshot.memory_available,
+                    used_percent=snapshot.memory_used_percent,
                 ),
             )
+            .model_dump_json(exclude={"event_loop"})
+            .encode()[:-1]
+        )
+
+    def _event_loop_info(self) -> Optional[EventLoopInfo]:
+        if not self.loop_monitor.running:
+            return None
+        percentiles = self.loop_monitor.percentiles()
+        return EventLoopInfo(
+            lag_p50_ms=percentiles["0.5"] * 1000,
+            lag_p90_ms=percentiles["0.9"] * 1000,
+            lag_p99_ms=percentiles["0.99"] * 1000,
+            lag_max_ms=percentiles["max"] * 1000,
+            blocked_callbacks=self.loop_monitor.blocked_total,
+            ready=self.loop_monitor.is_ready(),
+        )
+
+    def _configure_routes(self):
+        @self.router.get(
+            "/health",
+            response_model=HealthResponse,
+            status_code=status.HTTP_200_OK,
+            tags=["Health"],
+            summary="Check service health",
+            description="Returns detailed health information about the service, "
+            "as of the latest background system sample",
+        )
+        async def health_check():
+            # The system part is serialised once per system sample and reused
+            # until the sampler publishes a newer snapshot; the event-loop
+            # section moves with every heartbeat and is serialised each time.
+            snapshot = self.sampler.snapshot
+            if snapshot is not self._body_snapshot:
+                self._system_json = self._build_system_json(snapshot)
+                self._body_snapshot = snapshot
+            event_loop = self._event_loop_info()
+            event_loop_json = (
+                event_loop.model_dump_json().encode() if event_loop else b"null"
+            )
+            return Response(
+                content=self._system_json + b',"event_loop":' + event_loop_json + b"}",
+                media_type="application/json",
+            )
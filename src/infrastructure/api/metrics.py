@@ -0,0 +1,26 @@
+from fastapi import APIRouter, FastAPI, Response
+
+from src.infrastructure.observability.metrics import CONTENT_TYPE, registry
+
+
+class MetricsAPI:
+    API_TAGS = ["Metrics"]
+
+    def __init__(self, app: FastAPI):
+        self.router = APIRouter()
+        self._register_routes()
+        app.include_router(self.router, tags=self.API_TAGS)
+
+    def _register_routes(self):
+        self.router.add_api_route(
+            path="/metrics",
+            endpoint=self.metrics,
+            methods=["GET"],
+            summary="Prometheus metrics",
+            response_class=Response,
+            response_description="Metrics in the Prometheus text format",
+        )
+
+    @staticmethod
+    async def metrics():
+        return Response(content=registry.render(), media_type=CONTENT_TYPE)
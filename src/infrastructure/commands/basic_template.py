@@ -1,16 +1,23 @@
 from pathlib import Path
-from typing import Dict, Any, Set
+from typing import Dict, Any, Optional, Set
 from loguru import logger
 from src.domain.commands.base import ProjectCommand
 from src.domain.entities.command_result import CommandResult
 from src.domain.entities.project import Project
 from src.domain.repositories.template_repository import TemplateRepository
+from src.infrastructure.commands.rendering import write_file
 from src.infrastructure.enumerators.command_priority import CommandPriority
+from src.infrastructure.generators.template_layers import LayerRenderer, TemplateLayer
 
 
 class BasicTemplateCommand(ProjectCommand):
-    def __init__(self, template_repository: TemplateRepository):
+    def __init__(
+        self,
+        template_repository: TemplateRepository,
+        layer_renderer: Optional[LayerRenderer] = None,
+    ):
         self.template_repository = template_repository
+        self.layer_renderer = layer_renderer or LayerRenderer(template_repository)
 
     @property
     def name(self) -> str:
@@ -35,14 +42,28 @@ class BasicTemplateCommand(ProjectCommand):
 
     @property
     def init_dirs(self) -> Set[str]:
-        return {"app", "app/services", "app/models", "app/db", "app/core", "app/schemas"}
+        return {
+            "app",
+            "app/services",
+            "app/models",
+            "app/db",
+            "app/core",
+            "app/schemas",
+        }
+
+    @property
+    def layer(self) -> TemplateLayer:
+        return TemplateLayer.with_packages(
+            "basic", self.template_files, tuple(sorted(self.init_dirs))
+        )
 
     async def validate(self, project: Project, context: Dict[str, Any]) -> bool:
-        logger.debug(f"Validating {self.name} command")
         try:
-            for template_path in self.template_files.values():
-                self.template_repository.get_template_content(template_path)
-            self.template_repository.get_template_content("common/empty_init.py.jinja")
+            layer: Optional[TemplateLayer] = self.layer
+            while layer is not None:
+                for template_path in layer.files.values():
+                    self.template_repository.get_template_content(template_path)
+                layer = layer.base
             return True
         except Exception as e:
             logger.error(f"Validation failed for {self.name}: {str(e)}")
@@ -51,30 +72,26 @@ class BasicTemplateCommand(ProjectCommand):
     async def execute(
         self, project: Project, context: Dict[str, Any], output_path: Path
     ) -> CommandResult:
-        logger.info(f"Executing {self.name} command")
         changes = {}
         try:
-            for dir_path in self.init_dirs:
-                full_dir_path = output_path / dir_path
-                full_dir_path.mkdir(parents=True, exist_ok=True)
-                changes[f"dir:{dir_path}"] = None
-
-                empty_init = self.template_repository.get_template_content(
-                    "common/empty_init.py.jinja"
+            files = self.layer_renderer.render(self.layer, context)
+            for dest_path in sorted(files):
+                (output_path / dest_path).parent.mkdir(parents=True, exist_ok=True)
+                file_path = write_file(
+                    self.name, output_path, dest_path, files[dest_path]
                 )
-                init_file = output_path / dir_path / "__init__.py"
-                init_file.write_text(empty_init.render())
-                changes[str(init_file)] = None
-
-            (output_path / "app/routers").mkdir(parents=True, exist_ok=True)
-
-            for dest_path, template_path in self.template_files.items():
-                template = self.template_repository.get_template_content(template_path)
-                content = template.render(**context)
-                file_path = output_path / dest_path
-                file_path.write_text(content)
                 changes[str(file_path)] = None
-                logger.debug(f"Created file: {file_path}")
+
+            # Directories after the files and deepest first, so a rollback
+            # empties each one before trying to remove it.
+            dirs = {
+                parent
+                for dest_path in files
+                for parent in Path(dest_path).parents
+                if parent != Path(".")
+            }
+            for dir_path in sorted(dirs, reverse=True):
+                changes[f"dir:{output_path / dir_path}"] = None
 
             return CommandResult(success=True, changes=changes)
 
@@ -85,20 +102,16 @@ class BasicTemplateCommand(ProjectCommand):
     async def rollback(
         self, project: Project, context: Dict[str, Any], changes: Dict[str, Any]
     ) -> None:
-        logger.info(f"Rolling back {self.name} command")
         for path_str in changes.keys():
             try:
                 if path_str.startswith("dir:"):
                     dir_path = Path(path_str[4:])
                     try:
                         dir_path.rmdir()
-                        logger.debug(f"Removed directory: {dir_path}")
                     except OSError:
-                        logger.debug(
-                            f"Directory not empty, skipping removal: {dir_path}"
-                        )
+                        # Not empty: something else wrote into it.
+                        pass
                 else:
                     Path(path_str).unlink(missing_ok=True)
-                    logger.debug(f"Removed file: {path_str}")
             except Exception as e:
                 logger.error(f"Failed to rollback {path_str}: {str(e)}")
@@ -1,18 +1,29 @@
+import asyncio
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from loguru import logger
 from src.domain.commands.base import ProjectCommand
 from src.domain.entities.command_result import CommandResult
 from src.domain.entities.project import Project
 from src.domain.repositories.template_repository import TemplateRepository
+from src.domain.services.dependency_resolver import DependencyResolver
+from src.infrastructure.commands.rendering import render_file
 from src.infrastructure.enumerators.command_priority import CommandPriority
 from src.infrastructure.enumerators.dependency_manager import DependencyManager
 from src.infrastructure.exceptions.command_execution import CommandValidationError
 
 
 class DependencyManagementCommand(ProjectCommand):
-    def __init__(self, template_repository: TemplateRepository):
+    LOCK_FILE = "requirements.lock"
+    LOCK_TEMPLATE = "dependency/requirements.lock.jinja"
+
+    def __init__(
+        self,
+        template_repository: TemplateRepository,
+        dependency_resolver: Optional[DependencyResolver] = None,
+    ):
         self.template_repository = template_repository
+        self.dependency_resolver = dependency_resolver
 
     @property
     def name(self) -> str:
@@ -54,13 +65,35 @@ class DependencyManagementCommand(ProjectCommand):
             dep for option, dep in dependency_map.items() if getattr(project, option)
         ]
 
+    @staticmethod
+    def _lock_requirements(
+        project: Project, utils_dependencies: List[str]
+    ) -> List[str]:
+        """The dependencies of the generated requirements.txt, as PEP 508 strings"""
+        return [
+            f"fastapi=={project.dependency_version('fastapi')}",
+            f"uvicorn[standard]=={project.dependency_version('uvicorn')}",
+            "loguru",
+            "pydantic_settings",
+            "pydantic",
+            "python-dotenv",
+            *utils_dependencies,
+        ]
+
     async def validate(self, project: Project, context: Dict[str, Any]) -> bool:
-        logger.debug(f"Validating {self.name} command")
         try:
+            if project.include_lockfile and self.dependency_resolver is None:
+                raise CommandValidationError(
+                    "A lock file was requested but no package index is configured "
+                    "(LOCKFILE_INDEX_PATH)",
+                    self.name,
+                )
             dependency_manager = context.get(
                 "dependency_manager", DependencyManager.PIP
             )
             template_files = self._get_dependency_files(dependency_manager)
+            if project.include_lockfile:
+                template_files[self.LOCK_FILE] = self.LOCK_TEMPLATE
 
             for template_path in template_files.values():
                 try:
@@ -85,7 +118,6 @@ class DependencyManagementCommand(ProjectCommand):
     async def execute(
         self, project: Project, context: Dict[str, Any], output_path: Path
     ) -> CommandResult:
-        logger.info(f"Executing {self.name} command")
         changes = {}
 
         try:
@@ -97,13 +129,27 @@ class DependencyManagementCommand(ProjectCommand):
             )
             template_files = self._get_dependency_files(dependency_manager)
 
+            if project.include_lockfile:
+                # Resolution is memoised, but a first solve is CPU-bound work.
+                locked = await asyncio.to_thread(
+                    self.dependency_resolver.resolve,
+                    self._lock_requirements(project, utils_dependencies),
+                    project.python_version,
+                )
+                context["locked_dependencies"] = locked
+                context["lock_hashed"] = all(dependency.hashes for dependency in locked)
+                template_files[self.LOCK_FILE] = self.LOCK_TEMPLATE
+
             for dest_path, template_path in template_files.items():
-                template = self.template_repository.get_template_content(template_path)
-                content = template.render(**context)
-                file_path = output_path / dest_path
-                file_path.write_text(content)
+                file_path = render_file(
+                    self.template_repository,
+                    self.name,
+                    template_path,
+                    context,
+                    output_path,
+                    dest_path,
+                )
                 changes[str(file_path)] = None
-                logger.debug(f"Created file: {file_path} for {dependency_manager}")
 
             return CommandResult(success=True, changes=changes)
 
@@ -114,10 +160,8 @@ class DependencyManagementCommand(ProjectCommand):
     async def rollback(
         self, project: Project, context: Dict[str, Any], changes: Dict[str, Any]
     ) -> None:
-        logger.info(f"Rolling back {self.name} command")
         for file_path in changes.keys():
             try:
                 Path(file_path).unlink(missing_ok=True)
-                logger.debug(f"Removed file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to rollback {file_path}: {str(e)}")
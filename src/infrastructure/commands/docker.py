@@ -6,6 +6,7 @@ from src.domain.commands.base import ProjectCommand
 from src.domain.entities.command_result import CommandResult
 from src.domain.entities.project import Project
 from src.domain.repositories.template_repository import TemplateRepository
+from src.infrastructure.commands.rendering import render_file
 from src.infrastructure.enumerators.command_priority import CommandPriority
 from src.infrastructure.enumerators.dependency_manager import DependencyManager
 
@@ -42,7 +43,6 @@ class DockerCommand(ProjectCommand):
         if not (project.include_dockerfile or project.include_docker_compose):
             return True
 
-        logger.debug(f"Validating {self.name} command")
         try:
             if project.include_dockerfile:
                 dependency_manager = DependencyManager(
@@ -66,7 +66,6 @@ class DockerCommand(ProjectCommand):
         if not (project.include_dockerfile or project.include_docker_compose):
             return CommandResult(success=True, changes={})
 
-        logger.info(f"Executing {self.name} command")
         changes = {}
         try:
             docker_path = output_path / "docker"
@@ -78,22 +77,26 @@ class DockerCommand(ProjectCommand):
                     context.get("dependency_manager", DependencyManager.PIP)
                 )
                 template_path = self._get_dockerfile_template(dependency_manager)
-                template = self.template_repository.get_template_content(template_path)
-                content = template.render(**context)
-                file_path = docker_path / "Dockerfile"
-                file_path.write_text(content)
+                file_path = render_file(
+                    self.template_repository,
+                    self.name,
+                    template_path,
+                    context,
+                    output_path,
+                    "docker/Dockerfile",
+                )
                 changes[str(file_path)] = None
-                logger.debug(f"Created Dockerfile for {dependency_manager.value}")
 
             if project.include_docker_compose:
-                template = self.template_repository.get_template_content(
-                    "docker/docker-compose.yml.jinja"
+                file_path = render_file(
+                    self.template_repository,
+                    self.name,
+                    "docker/docker-compose.yml.jinja",
+                    context,
+                    output_path,
+                    "docker/docker-compose.yml",
                 )
-                content = template.render(**context)
-                file_path = docker_path / "docker-compose.yml"
-                file_path.write_text(content)
                 changes[str(file_path)] = None
-                logger.debug("Created docker-compose.yml")
 
             return CommandResult(success=True, changes=changes)
 
@@ -104,14 +107,11 @@ class DockerCommand(ProjectCommand):
     async def rollback(
         self, project: Project, context: Dict[str, Any], changes: Dict[str, Any]
     ) -> None:
-        logger.info(f"Rolling back {self.name} command")
         for path in changes.keys():
             try:
                 if path == "docker_dir":
                     Path(path).rmdir()
-                    logger.debug(f"Removed directory: {path}")
                 else:
                     Path(path).unlink(missing_ok=True)
-                    logger.debug(f"Removed file: {path}")
             except Exception as e:
                 logger.error(f"Failed to rollback {path}: {str(e)}")
@@ -6,6 +6,7 @@ from src.domain.entities.command_result import CommandResult
 from src.domain.entities.project import Project
 from src.domain.repositories.template_repository import TemplateRepository
 
+from src.infrastructure.commands.rendering import render_file
 from src.infrastructure.enumerators.command_priority import CommandPriority
 from src.infrastructure.enumerators.dependency_manager import DependencyManager
 
@@ -38,7 +39,6 @@ class DocumentationCommand(ProjectCommand):
         )
 
     async def validate(self, project: Project, context: Dict[str, Any]) -> bool:
-        logger.debug(f"Validating {self.name} command")
         try:
             dependency_manager = DependencyManager(
                 context.get("dependency_manager", DependencyManager.PIP)
@@ -53,20 +53,21 @@ class DocumentationCommand(ProjectCommand):
     async def execute(
         self, project: Project, context: Dict[str, Any], output_path: Path
     ) -> CommandResult:
-        logger.info(f"Executing {self.name} command")
         changes = {}
         try:
             dependency_manager = DependencyManager(
                 context.get("dependency_manager", DependencyManager.PIP)
             )
             template_path = self._get_readme_template(dependency_manager)
-            template = self.template_repository.get_template_content(template_path)
-            content = template.render(**context)
-
-            file_path = output_path / "README.md"
-            file_path.write_text(content)
+            file_path = render_file(
+                self.template_repository,
+                self.name,
+                template_path,
+                context,
+                output_path,
+                "README.md",
+            )
             changes[str(file_path)] = None
-            logger.debug(f"Created README.md using {dependency_manager.value} template")
 
             return CommandResult(success=True, changes=changes)
 
@@ -77,10 +78,8 @@ class DocumentationCommand(ProjectCommand):
     async def rollback(
         self, project: Project, context: Dict[str, Any], changes: Dict[str, Any]
     ) -> None:
-        logger.info(f"Rolling back {self.name} command")
         for file_path in changes.keys():
             try:
                 Path(file_path).unlink(missing_ok=True)
-                logger.debug(f"Removed file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to rollback {file_path}: {str(e)}")
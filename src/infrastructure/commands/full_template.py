@@ -0,0 +1,31 @@
+from typing import Dict
+
+from src.infrastructure.commands.basic_template import BasicTemplateCommand
+from src.infrastructure.generators.template_layers import TemplateLayer
+
+
+class FullTemplateCommand(BasicTemplateCommand):
+    """The basic template plus a ``full`` overlay layer.
+
+    The overlay adds application error handling, request-ID and timing
+    middleware and health probes, and replaces the basic files that wire
+    them in. Everything else is the basic layer's (cached) output.
+    """
+
+    @property
+    def name(self) -> str:
+        return "full_template"
+
+    @property
+    def overlay_files(self) -> Dict[str, str]:
+        return {
+            "app/routers/__init__.py": "full/app/routers/__init__.py.jinja",
+            "app/routers/health.py": "full/app/routers/health.py.jinja",
+            "app/core/config.py": "full/app/core/config.py.jinja",
+            "app/core/exceptions.py": "full/app/core/exceptions.py.jinja",
+            "app/core/middleware.py": "full/app/core/middleware.py.jinja",
+        }
+
+    @property
+    def layer(self) -> TemplateLayer:
+        return TemplateLayer("full", self.overlay_files, base=super().layer)
@@ -6,6 +6,7 @@ from src.domain.entities.command_result import CommandResult
 
 from src.domain.entities.project import Project
 from src.domain.repositories.template_repository import TemplateRepository
+from src.infrastructure.commands.rendering import render_file
 from src.infrastructure.enumerators.command_priority import CommandPriority
 
 
@@ -29,7 +30,6 @@ class MinimalTemplateCommand(ProjectCommand):
         }
 
     async def validate(self, project: Project, context: Dict[str, Any]) -> bool:
-        logger.debug(f"Validating {self.name} command")
         try:
             for _, template_path in self.template_files.items():
                 self.template_repository.get_template_content(template_path)
@@ -41,16 +41,18 @@ class MinimalTemplateCommand(ProjectCommand):
     async def execute(
         self, project: Project, context: Dict[str, Any], output_path: Path
     ) -> CommandResult:
-        logger.info(f"Executing {self.name} command")
         changes = {}
         try:
             for dest_path, template_path in self.template_files.items():
-                template = self.template_repository.get_template_content(template_path)
-                content = template.render(**context)
-                file_path = output_path.joinpath(dest_path)
-                file_path.write_text(content)
+                file_path = render_file(
+                    self.template_repository,
+                    self.name,
+                    template_path,
+                    context,
+                    output_path,
+                    dest_path,
+                )
                 changes[str(file_path)] = None
-                logger.debug(f"Created file: {file_path}")
 
             return CommandResult(success=True, changes=changes)
 
@@ -61,10 +63,8 @@ class MinimalTemplateCommand(ProjectCommand):
     async def rollback(
         self, project: Project, context: Dict[str, Any], changes: Dict[str, Any]
     ) -> None:
-        logger.info(f"Rolling back {self.name} command")
         for file_path in changes.keys():
             try:
                 Path(file_path).unlink(missing_ok=True)
-                logger.debug(f"Removed file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to rollback {file_path}: {str(e)}")
@@ -0,0 +1,49 @@
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Optional
+
+from src.domain.events.generation import FileRendered
+from src.domain.repositories.template_repository import TemplateRepository
+from src.infrastructure.events.generation import file_rendered
+
+
+def write_file(
+    command: str,
+    output_path: Path,
+    dest_path: str,
+    content: str,
+    started: Optional[float] = None,
+) -> Path:
+    """Write ``content`` to ``output_path / dest_path`` and emit FileRendered.
+
+    ``started`` is when producing the content began; without it only the
+    write is timed. Nothing is timed or measured while nobody subscribes.
+    """
+    if started is None and file_rendered.active:
+        started = perf_counter()
+    file_path = output_path / dest_path
+    file_path.write_text(content)
+    if started is not None and file_rendered.active:
+        file_rendered.emit(
+            FileRendered(
+                command=command,
+                path=dest_path,
+                size_bytes=len(content.encode()),
+                duration_s=perf_counter() - started,
+            )
+        )
+    return file_path
+
+
+def render_file(
+    template_repository: TemplateRepository,
+    command: str,
+    template_path: str,
+    context: Dict[str, Any],
+    output_path: Path,
+    dest_path: str,
+) -> Path:
+    """Render ``template_path`` to ``output_path / dest_path``"""
+    started = perf_counter() if file_rendered.active else None
+    content = template_repository.render_template(template_path, context)
+    return write_file(command, output_path, dest_path, content, started)
@@ -1,13 +1,18 @@
+from typing import Dict, Optional
+
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from loguru import logger
 from sys import stderr
-from dotenv import load_dotenv
 
-load_dotenv()
+from src.infrastructure.enumerators.rate_limit_algorithm import RateLimitAlgorithm
+from src.infrastructure.enumerators.rate_limit_backend import RateLimitBackend
+from src.infrastructure.middleware.logging.context import patch_log_record
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
     ENVIRONMENT: str = Field(
         default="dev",
         description="Environment (dev, test, prod)",
@@ -20,14 +25,207 @@ class Settings(BaseSettings):
         default="0.1.0",
         description="Application version",
     )
+    LOG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of successful requests logged in full",
+    )
+    LOG_SLOW_REQUEST_MS: Optional[float] = Field(
+        default=1000.0,
+        description="Requests slower than this are always logged",
+    )
+    LOG_MAX_BODY_BYTES: int = Field(
+        default=8192,
+        ge=0,
+        description="Request/response bodies larger than this are truncated in logs",
+    )
+    TRACE_SERVER_TIMING: bool = Field(
+        default=True,
+        description="Report request spans in a Server-Timing response header",
+    )
+    TRACE_EXPORT_PATH: Optional[str] = Field(
+        default=None,
+        description="Append finished request traces as JSON lines to this file",
+    )
+    GENERATOR_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=86400,
+        ge=0,
+        description="How long clients and shared caches may reuse a project "
+        "downloaded with GET /generator/create",
+    )
+    ARCHIVE_TTL_SECONDS: int = Field(
+        default=900,
+        gt=0,
+        description="How long a generated archive stays downloadable (and "
+        "resumable) from /generator/archives/{digest}",
+    )
+    ARCHIVE_STORE_MAX_BYTES: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Space kept for generated archives; the oldest are "
+        "dropped first past it",
+    )
+    ARCHIVE_STORE_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory shared by the workers on a host to keep generated "
+        "archives in; defaults to one under /dev/shm (or the temp directory)",
+    )
+    LOCKFILE_INDEX_PATH: Optional[str] = Field(
+        default=None,
+        description="Local package index used to pin generated requirements.lock "
+        "files; unset disables include_lockfile",
+    )
+    ADMIN_TOKEN: Optional[str] = Field(
+        default=None,
+        description="Token required in X-Admin-Token by /admin routes; unset "
+        "disables them",
+    )
+    HEALTH_SAMPLE_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="How often CPU and memory usage reported by /health is refreshed",
+    )
+    LOOP_MONITOR_ENABLED: bool = Field(
+        default=True,
+        description="Measure event loop lag and report callbacks that block it",
+    )
+    LOOP_MONITOR_INTERVAL_MS: float = Field(
+        default=100.0,
+        gt=0,
+        description="Interval of the event loop lag heartbeat",
+    )
+    LOOP_BLOCK_THRESHOLD_MS: float = Field(
+        default=100.0,
+        gt=0,
+        description="Blocking time after which the offending stack is captured",
+    )
+    LOOP_READY_MAX_LAG_MS: Optional[float] = Field(
+        default=None,
+        description="Report not-ready on /health/ready while recent loop lag "
+        "exceeds this; unset never fails readiness on lag",
+    )
+    HOST: str = Field(
+        default="0.0.0.0",
+        description="Address the production server binds to",
+    )
+    PORT: int = Field(
+        default=8000,
+        description="Port the production server binds to",
+    )
+    WEB_CONCURRENCY: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker processes; defaults to the CPUs available to the container",
+    )
+    WORKER_MAX_REQUESTS: Optional[int] = Field(
+        default=10000,
+        ge=1,
+        description="Requests after which a worker is replaced; unset never recycles",
+    )
+    WORKER_MAX_REQUESTS_JITTER: int = Field(
+        default=1000,
+        ge=0,
+        description="Random extra requests per worker, so workers recycle at "
+        "different times",
+    )
+    WORKER_MAX_RSS_GROWTH_MB: Optional[int] = Field(
+        default=512,
+        ge=1,
+        description="Resident memory growth after which a worker is replaced",
+    )
+    GRACEFUL_TIMEOUT_SECONDS: int = Field(
+        default=30,
+        ge=0,
+        description="Time workers get to finish in-flight requests on shutdown",
+    )
+    STARTUP_BUDGET_MS: float = Field(
+        default=1500.0,
+        gt=0,
+        description="Cold-start budget enforced by python -m benchmarks.startup",
+    )
+    METRICS_MULTIPROC_DIR: Optional[str] = Field(
+        default=None,
+        description="Shared directory used to aggregate metrics across workers",
+    )
+    RATE_LIMIT_BACKEND: RateLimitBackend = Field(
+        default=RateLimitBackend.MEMORY,
+        description="Rate-limit store: per-process memory, host-wide shared memory "
+        "or a cluster-wide Redis-protocol server",
+    )
+    RATE_LIMIT_ALGORITHM: RateLimitAlgorithm = Field(
+        default=RateLimitAlgorithm.TOKEN_BUCKET,
+        description="Limiting algorithm of the memory backend; the shared-memory "
+        "and redis backends always use a sliding window",
+    )
+    RATE_LIMIT_SKETCH_WIDTH: int = Field(
+        default=16384,
+        ge=1,
+        description="Counters per row of the heavy_hitters count-min sketch",
+    )
+    RATE_LIMIT_SKETCH_DEPTH: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Rows of the heavy_hitters count-min sketch",
+    )
+    RATE_LIMIT_TOP_K: int = Field(
+        default=32,
+        ge=1,
+        description="Heaviest clients remembered by the heavy_hitters algorithm",
+    )
+    RATE_LIMIT_ROUTE_COSTS: Dict[str, int] = Field(
+        default={},
+        description="Fixed rate-limit cost per route prefix (e.g. /generator: 5)",
+    )
+    RATE_LIMIT_COST_UNIT_MS: float = Field(
+        default=50.0,
+        ge=0.0,
+        description="Handling time charged as one rate-limit unit on routes "
+        "without a fixed cost; 0 charges every request 1",
+    )
+    RATE_LIMIT_MAX_COST: int = Field(
+        default=20,
+        ge=1,
+        description="Upper bound on the measured cost of a single request",
+    )
+    RATE_LIMIT_SHM_PATH: Optional[str] = Field(
+        default=None,
+        description="File backing the shared-memory rate-limit table",
+    )
+    RATE_LIMIT_SHM_SLOTS: int = Field(
+        default=65536,
+        description="Number of client slots in the shared-memory rate-limit table",
+    )
+    RATE_LIMIT_REDIS_URL: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis-protocol server used by the redis rate-limit backend",
+    )
+    RATE_LIMIT_REDIS_POOL_SIZE: int = Field(
+        default=4,
+        description="Connections kept open to the rate-limit Redis server",
+    )
+    RATE_LIMIT_REDIS_TIMEOUT_MS: float = Field(
+        default=50.0,
+        description="Time to wait for the rate-limit backend before limiting locally",
+    )
+    LOG_SAMPLE_ROUTE_OVERRIDES: Dict[str, float] = Field(
+        default_factory=dict,
+        description='Per-route sample rates, e.g. {"/docs": 0.01}',
+    )
+
+    @property
+    def log_level(self) -> str:
+        return "DEBUG" if self.ENVIRONMENT != "production" else "INFO"
 
     def configure_logging(self):
+        logger.configure(patcher=patch_log_record)
         if not logger._core.handlers:
             logger.add(
                 sink=stderr,
                 colorize=True,
-                level="DEBUG" if self.ENVIRONMENT != "production" else "INFO",
-                format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | <cyan>{module}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+                level=self.log_level,
+                format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | {extra[request_id]} | <cyan>{module}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             )
             logger.info(
                 f"Environment {self.ENVIRONMENT} initialized for {self.APP_NAME} v{self.APP_VERSION}"
@@ -35,4 +233,3 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
-settings.configure_logging()
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RateLimitAlgorithm(str, Enum):
+    SLIDING_WINDOW = "sliding_window"
+    TOKEN_BUCKET = "token_bucket"
+    HEAVY_HITTERS = "heavy_hitters"
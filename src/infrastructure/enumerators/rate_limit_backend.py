@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RateLimitBackend(str, Enum):
+    MEMORY = "memory"
+    SHARED_MEMORY = "shared_memory"
+    REDIS = "redis"
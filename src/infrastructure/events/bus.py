@@ -0,0 +1,83 @@
+import threading
+from typing import Callable, Dict, Generic, Tuple, Type, TypeVar
+
+from loguru import logger
+
+E = TypeVar("E")
+
+Subscriber = Callable[[E], None]
+
+
+class Channel(Generic[E]):
+    """The subscribers to one event type.
+
+    ``active`` is a plain attribute that is False while nobody subscribes,
+    so emitters check it before building an event (or timing anything for
+    it) and an unobserved event costs one attribute lookup::
+
+        if file_rendered.active:
+            file_rendered.emit(FileRendered(...))
+    """
+
+    __slots__ = ("event_type", "active", "_subscribers")
+
+    def __init__(self, event_type: Type[E]):
+        self.event_type = event_type
+        self.active = False
+        self._subscribers: Tuple[Subscriber, ...] = ()
+
+    def emit(self, event: E) -> None:
+        # Subscribing swaps the tuple, so this iterates a stable snapshot.
+        for subscriber in self._subscribers:
+            try:
+                subscriber(event)
+            except Exception as e:
+                logger.error(
+                    f"Subscriber {subscriber!r} failed on "
+                    f"{self.event_type.__name__}: {str(e)}"
+                )
+
+    def _set(self, subscribers: Tuple[Subscriber, ...]) -> None:
+        self._subscribers = subscribers
+        self.active = bool(subscribers)
+
+
+class EventBus:
+    """In-process, synchronous publish/subscribe keyed by event type"""
+
+    def __init__(self):
+        self._channels: Dict[type, Channel] = {}
+        self._lock = threading.Lock()
+
+    def channel(self, event_type: Type[E]) -> Channel[E]:
+        """The channel of ``event_type``; the same object for the bus' life"""
+        channel = self._channels.get(event_type)
+        if channel is None:
+            with self._lock:
+                channel = self._channels.setdefault(event_type, Channel(event_type))
+        return channel
+
+    def subscribe(
+        self, event_type: Type[E], subscriber: Subscriber
+    ) -> Callable[[], None]:
+        """Call ``subscriber`` with every ``event_type`` event; returns an
+        unsubscribe function"""
+        channel = self.channel(event_type)
+        with self._lock:
+            channel._set(channel._subscribers + (subscriber,))
+
+        def unsubscribe() -> None:
+            with self._lock:
+                channel._set(
+                    tuple(s for s in channel._subscribers if s is not subscriber)
+                )
+
+        return unsubscribe
+
+    def clear(self) -> None:
+        with self._lock:
+            for channel in self._channels.values():
+                channel._set(())
+
+
+event_bus = EventBus()
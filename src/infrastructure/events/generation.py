@@ -0,0 +1,14 @@
+from src.domain.events.generation import (
+    CommandFinished,
+    FileRendered,
+    GenerationFinished,
+    PlanResolved,
+    RollbackPerformed,
+)
+from src.infrastructure.events.bus import event_bus
+
+plan_resolved = event_bus.channel(PlanResolved)
+file_rendered = event_bus.channel(FileRendered)
+command_finished = event_bus.channel(CommandFinished)
+rollback_performed = event_bus.channel(RollbackPerformed)
+generation_finished = event_bus.channel(GenerationFinished)
@@ -0,0 +1,150 @@
+from typing import Callable, List
+
+from loguru import logger
+
+from src.domain.events.generation import (
+    CommandFinished,
+    FileRendered,
+    GenerationFinished,
+    PlanResolved,
+    RollbackPerformed,
+)
+from src.infrastructure.events.bus import EventBus
+from src.infrastructure.observability.metrics import (
+    GENERATION_ARCHIVE_SIZE,
+    GENERATION_COMMANDS,
+    GENERATION_ROLLBACKS,
+)
+from src.infrastructure.observability.tracing import record_span
+
+
+class LoggingSubscriber:
+    """Logs generation events; levels below ``min_level`` are not subscribed
+    to at all, so filtered events are never built, let alone formatted"""
+
+    def __init__(self, min_level: str):
+        self.min_level = logger.level(min_level).no
+
+    def install(self, bus: EventBus) -> List[Callable[[], None]]:
+        handlers = [
+            (PlanResolved, "INFO", self.plan_resolved),
+            (FileRendered, "DEBUG", self.file_rendered),
+            (CommandFinished, "INFO", self.command_finished),
+            (RollbackPerformed, "WARNING", self.rollback_performed),
+            (GenerationFinished, "INFO", self.generation_finished),
+        ]
+        return [
+            bus.subscribe(event_type, handler)
+            for event_type, level, handler in handlers
+            if logger.level(level).no >= self.min_level
+        ]
+
+    @staticmethod
+    def plan_resolved(event: PlanResolved) -> None:
+        logger.info(
+            f"Generating {event.project_name} ({event.fingerprint}) from the "
+            f"{event.template_type} template: {', '.join(event.commands)}"
+        )
+
+    @staticmethod
+    def file_rendered(event: FileRendered) -> None:
+        logger.debug(
+            f"{event.command} wrote {event.path} ({event.size_bytes} bytes, "
+            f"{event.duration_s * 1000:.2f} ms)"
+        )
+
+    @staticmethod
+    def command_finished(event: CommandFinished) -> None:
+        if event.success:
+            logger.info(
+                f"Command {event.command} finished in "
+                f"{event.duration_s * 1000:.2f} ms ({event.changes} changes)"
+            )
+        else:
+            logger.error(f"Command {event.command} failed: {event.error}")
+
+    @staticmethod
+    def rollback_performed(event: RollbackPerformed) -> None:
+        if event.success:
+            logger.warning(
+                f"Rolled back {event.changes} changes of command {event.command}"
+            )
+        else:
+            logger.error(f"Failed to rollback command {event.command}: {event.error}")
+
+    @staticmethod
+    def generation_finished(event: GenerationFinished) -> None:
+        if event.success:
+            logger.info(
+                f"Generated {event.project_name} in "
+                f"{event.duration_s * 1000:.2f} ms ({event.archive_bytes} bytes)"
+            )
+        else:
+            logger.error(f"Generation of {event.project_name} failed: {event.error}")
+
+
+class MetricsSubscriber:
+    """Counts command results and rollbacks and records archive sizes"""
+
+    def install(self, bus: EventBus) -> List[Callable[[], None]]:
+        return [
+            bus.subscribe(CommandFinished, self.command_finished),
+            bus.subscribe(RollbackPerformed, self.rollback_performed),
+            bus.subscribe(GenerationFinished, self.generation_finished),
+        ]
+
+    @staticmethod
+    def command_finished(event: CommandFinished) -> None:
+        result = "success" if event.success else "failure"
+        GENERATION_COMMANDS.labels(event.command, result).inc()
+
+    @staticmethod
+    def rollback_performed(event: RollbackPerformed) -> None:
+        GENERATION_ROLLBACKS.labels(event.command).inc()
+
+    @staticmethod
+    def generation_finished(event: GenerationFinished) -> None:
+        if event.success:
+            GENERATION_ARCHIVE_SIZE.labels(event.template_type).observe(
+                event.archive_bytes
+            )
+
+
+class TracingSubscriber:
+    """Adds written files and rollbacks to the current request's spans"""
+
+    def install(self, bus: EventBus) -> List[Callable[[], None]]:
+        return [
+            bus.subscribe(FileRendered, self.file_rendered),
+            bus.subscribe(RollbackPerformed, self.rollback_performed),
+        ]
+
+    @staticmethod
+    def file_rendered(event: FileRendered) -> None:
+        record_span(
+            "file",
+            event.duration_s,
+            command=event.command,
+            path=event.path,
+            size_bytes=event.size_bytes,
+        )
+
+    @staticmethod
+    def rollback_performed(event: RollbackPerformed) -> None:
+        record_span(
+            "rollback", event.duration_s, command=event.command, success=event.success
+        )
+
+
+_installed: List[Callable[[], None]] = []
+
+
+def install_subscribers(bus: EventBus, *, log_level: str, tracing: bool) -> None:
+    """Subscribe logging, metrics and (when enabled) tracing to ``bus``,
+    replacing the subscribers a previous call installed"""
+    while _installed:
+        _installed.pop()()
+    _installed.extend(LoggingSubscriber(log_level).install(bus))
+    _installed.extend(MetricsSubscriber().install(bus))
+    if tracing:
+        _installed.extend(TracingSubscriber().install(bus))
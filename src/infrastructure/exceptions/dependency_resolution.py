@@ -0,0 +1,2 @@
+class DependencyResolutionError(Exception):
+    """Exception raised when requirements cannot be pinned from the index"""
@@ -0,0 +1,6 @@
+class RangeNotSatisfiable(Exception):
+    """Exception raised when a Range header selects no byte of the content"""
+
+    def __init__(self, length: int):
+        super().__init__(f"No requested range overlaps the {length} bytes available")
+        self.length = length
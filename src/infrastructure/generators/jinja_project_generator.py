@@ -1,34 +1,73 @@
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 import io
-from zipfile import ZipFile
-from typing import List, Tuple, Dict, Any
+from time import perf_counter
+from zipfile import ZipFile, ZipInfo
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 from loguru import logger
 from src.domain.commands.base import ProjectCommand
 from src.domain.entities.command_result import CommandResult
 from src.domain.repositories.template_repository import TemplateRepository
+from src.domain.services.dependency_resolver import DependencyResolver
 from src.domain.services.project_generator import ProjectGenerator
 from src.domain.commands.registry import CommandRegistry
 from src.domain.entities.project import Project
+from src.domain.events.generation import (
+    CommandFinished,
+    GenerationFinished,
+    PlanResolved,
+    RollbackPerformed,
+)
 from src.infrastructure.commands.basic_template import BasicTemplateCommand
+from src.infrastructure.commands.full_template import FullTemplateCommand
 from src.infrastructure.commands.minimal_template import MinimalTemplateCommand
 from src.infrastructure.commands.dependency import DependencyManagementCommand
 from src.infrastructure.commands.docker import DockerCommand
 from src.infrastructure.commands.documentation import DocumentationCommand
 from src.infrastructure.commands.utils import UtilsCommand
 from src.infrastructure.enumerators.template_type import TemplateType
+from src.infrastructure.events.generation import (
+    command_finished,
+    generation_finished,
+    plan_resolved,
+    rollback_performed,
+)
 from src.infrastructure.exceptions.command_execution import (
     CommandValidationError,
     CommandExecutionError,
 )
+from src.infrastructure.generators.template_layers import LayerRenderer
+from src.infrastructure.observability.metrics import (
+    GENERATION_DURATION,
+    GENERATIONS_IN_PROGRESS,
+)
+from src.infrastructure.observability.tracing import span
+
+
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
 
 
 class JinjaProjectGenerator(ProjectGenerator):
-    def __init__(self, template_repository: TemplateRepository):
+    def __init__(
+        self,
+        template_repository: TemplateRepository,
+        dependency_resolver: Optional[DependencyResolver] = None,
+    ):
         self.template_repository = template_repository
+        self.dependency_resolver = dependency_resolver
         self.registry = CommandRegistry()
+        # Shared by the layered templates so that FULL reuses the rendered
+        # BASIC layer of any earlier BASIC or FULL project.
+        self.layer_renderer = LayerRenderer(template_repository)
         self.template_commands = {
             TemplateType.MINIMAL: MinimalTemplateCommand,
-            TemplateType.BASIC: BasicTemplateCommand,
+            TemplateType.BASIC: partial(
+                BasicTemplateCommand, layer_renderer=self.layer_renderer
+            ),
+            TemplateType.FULL: partial(
+                FullTemplateCommand, layer_renderer=self.layer_renderer
+            ),
         }
 
     @staticmethod
@@ -44,10 +83,11 @@ class JinjaProjectGenerator(ProjectGenerator):
             "description": project.description,
             "python_version": project.python_version,
             "author": project.author,
-            "fastapi_version": project.dependencies["fastapi"],
-            "uvicorn_version": project.dependencies["uvicorn"],
+            "fastapi_version": project.dependency_version("fastapi"),
+            "uvicorn_version": project.dependency_version("uvicorn"),
             "include_dockerfile": project.include_dockerfile,
             "include_docker_compose": project.include_docker_compose,
+            "include_lockfile": project.include_lockfile,
             "dependency_manager": project.dependency_manager,
             "utils_dependencies": utils_dependencies,
         }
@@ -62,7 +102,6 @@ class JinjaProjectGenerator(ProjectGenerator):
         }
 
     def _register_commands(self, project: Project) -> None:
-        logger.info("Registering project commands")
         self.registry = CommandRegistry()
         template_command_cls = self.template_commands.get(project.template_type)
         if not template_command_cls:
@@ -78,7 +117,10 @@ class JinjaProjectGenerator(ProjectGenerator):
             DocumentationCommand(template_repository=self.template_repository)
         )
         self.registry.register(
-            DependencyManagementCommand(template_repository=self.template_repository)
+            DependencyManagementCommand(
+                template_repository=self.template_repository,
+                dependency_resolver=self.dependency_resolver,
+            )
         )
         self.registry.register(
             UtilsCommand(template_repository=self.template_repository)
@@ -90,10 +132,10 @@ class JinjaProjectGenerator(ProjectGenerator):
         executed_commands: List[Tuple[ProjectCommand, CommandResult]] = []
         try:
             commands = self.registry.get_all_commands()
-            logger.info("Validating all commands")
-            failed_validations = [
-                cmd for cmd in commands if not await cmd.validate(project, context)
-            ]
+            with self._phase(project, "validate"):
+                failed_validations = [
+                    cmd for cmd in commands if not await cmd.validate(project, context)
+                ]
             if failed_validations:
                 invalid_command_names = ", ".join(
                     cmd.name for cmd in failed_validations
@@ -103,16 +145,15 @@ class JinjaProjectGenerator(ProjectGenerator):
                     invalid_command_names,
                 )
 
-            logger.info("Executing commands in priority order")
-            execute_command = self._execute_single_command
-            executed_commands = [
-                await execute_command(cmd, project, context, output_path)
-                for cmd in commands
-            ]
+            # Appended one by one so that a failure rolls back what ran before it.
+            for cmd in commands:
+                executed_commands.append(
+                    await self._execute_single_command(
+                        cmd, project, context, output_path
+                    )
+                )
 
         except Exception as exc:
-            logger.error(f"Command execution failed: {str(exc)}")
-            logger.info("Starting rollback process")
             await self._rollback_commands(project, context, executed_commands)
             raise exc
 
@@ -123,7 +164,20 @@ class JinjaProjectGenerator(ProjectGenerator):
         context: Dict[str, Any],
         output_path: Path,
     ) -> Tuple[ProjectCommand, CommandResult]:
-        result = await command.execute(project, context, output_path)
+        start = perf_counter()
+        with JinjaProjectGenerator._phase(project, f"command.{command.name}"):
+            result = await command.execute(project, context, output_path)
+        if command_finished.active:
+            command_finished.emit(
+                CommandFinished(
+                    command=command.name,
+                    template_type=project.template_type.value,
+                    success=result.success,
+                    duration_s=perf_counter() - start,
+                    changes=len(result.changes),
+                    error=result.error,
+                )
+            )
         if not result.success:
             raise CommandExecutionError(
                 f"Command failed: {command.name} - {result.error}",
@@ -139,32 +193,90 @@ class JinjaProjectGenerator(ProjectGenerator):
         executed_commands: List[Tuple[ProjectCommand, CommandResult]],
     ) -> None:
         for command, result in reversed(executed_commands):
+            start = perf_counter()
+            error = None
             try:
                 await command.rollback(project, context, result.changes)
             except Exception as rollback_error:
-                logger.error(
-                    f"Failed to rollback command {command.name}: {str(rollback_error)}"
+                error = str(rollback_error)
+            if rollback_performed.active:
+                rollback_performed.emit(
+                    RollbackPerformed(
+                        command=command.name,
+                        changes=len(result.changes),
+                        success=error is None,
+                        duration_s=perf_counter() - start,
+                        error=error,
+                    )
                 )
 
+    @staticmethod
+    @contextmanager
+    def _phase(project: Project, name: str) -> Iterator[None]:
+        """Trace a generation phase and record its duration per template type"""
+        start = perf_counter()
+        try:
+            with span(name):
+                yield
+        finally:
+            GENERATION_DURATION.labels(project.template_type.value, name).observe(
+                perf_counter() - start
+            )
+
     async def generate(self, project: Project, output_path: Path) -> bytes:
         temp_dir = None
+        start = perf_counter()
+        GENERATIONS_IN_PROGRESS.inc()
         try:
-            logger.info(f"Starting project generation: {project.name}")
-            context = self._create_context(project)
-            temp_dir = self._prepare_temp_dir(output_path, project.name)
-            self._register_commands(project)
-            await self._execute_commands(project, context, temp_dir)
-            return self._prepare_zip_buffer(temp_dir)
+            with self._phase(project, "total"):
+                context = self._create_context(project)
+                temp_dir = self._prepare_temp_dir(output_path, project.name)
+                self._register_commands(project)
+                if plan_resolved.active:
+                    plan_resolved.emit(
+                        PlanResolved(
+                            project_name=project.name,
+                            fingerprint=project.fingerprint(),
+                            template_type=project.template_type.value,
+                            commands=tuple(
+                                command.name
+                                for command in self.registry.get_all_commands()
+                            ),
+                        )
+                    )
+                await self._execute_commands(project, context, temp_dir)
+                with self._phase(project, "archive"):
+                    archive = self._prepare_zip_buffer(temp_dir)
+            if generation_finished.active:
+                generation_finished.emit(
+                    GenerationFinished(
+                        project_name=project.name,
+                        template_type=project.template_type.value,
+                        success=True,
+                        duration_s=perf_counter() - start,
+                        archive_bytes=len(archive),
+                    )
+                )
+            return archive
         except Exception as exc:
-            logger.error(f"Project generation failed: {str(exc)}")
+            if generation_finished.active:
+                generation_finished.emit(
+                    GenerationFinished(
+                        project_name=project.name,
+                        template_type=project.template_type.value,
+                        success=False,
+                        duration_s=perf_counter() - start,
+                        error=str(exc),
+                    )
+                )
             raise RuntimeError(f"Failed to generate project: {str(exc)}")
         finally:
+            GENERATIONS_IN_PROGRESS.dec()
             if temp_dir and temp_dir.exists():
                 try:
                     import shutil
 
                     shutil.rmtree(temp_dir)
-                    logger.debug(f"Cleaned up temporary directory: {temp_dir}")
                 except Exception as cleanup_error:
                     logger.warning(
                         f"Failed to cleanup temporary files: {str(cleanup_error)}"
@@ -180,13 +292,15 @@ class JinjaProjectGenerator(ProjectGenerator):
     def _prepare_zip_buffer(temp_dir: Path) -> bytes:
         zip_buffer = io.BytesIO()
         with ZipFile(zip_buffer, "w") as zip_file:
-            file_paths = [
+            file_paths = sorted(
                 file_path for file_path in temp_dir.rglob("*") if file_path.is_file()
-            ]
+            )
             for file_path in file_paths:
                 relative_path = file_path.relative_to(temp_dir)
-                zip_file.write(file_path, str(relative_path))
-                logger.debug(f"Added to ZIP: {relative_path}")
+                # Fixed entry order, timestamps and modes make the archive a
+                # function of the project alone, so its ETag can stay strong.
+                entry = ZipInfo(relative_path.as_posix(), date_time=ZIP_TIMESTAMP)
+                entry.external_attr = 0o644 << 16
+                zip_file.writestr(entry, file_path.read_bytes())
         zip_buffer.seek(0)
-        logger.info("Project generation completed successfully")
         return zip_buffer.getvalue()
@@ -0,0 +1,124 @@
+import threading
+from collections import ChainMap, OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from src.domain.repositories.template_repository import TemplateRepository
+from src.infrastructure.observability.metrics import CACHE_REQUESTS
+from src.infrastructure.observability.tracing import span
+
+_layer_hits = CACHE_REQUESTS.labels("template_layer", "hit")
+_layer_misses = CACHE_REQUESTS.labels("template_layer", "miss")
+
+EMPTY_INIT_TEMPLATE = "common/empty_init.py.jinja"
+
+
+@dataclass(frozen=True)
+class TemplateLayer:
+    """A set of files (destination -> template) stacked on an optional base.
+
+    Files of a layer replace the base files at the same destination; the
+    rest of the base shows through unchanged.
+    """
+
+    name: str
+    files: Mapping[str, str]
+    base: Optional["TemplateLayer"] = None
+
+    @classmethod
+    def with_packages(
+        cls,
+        name: str,
+        files: Mapping[str, str],
+        packages: Tuple[str, ...],
+        base: Optional["TemplateLayer"] = None,
+    ) -> "TemplateLayer":
+        """Layer whose ``packages`` get an empty ``__init__.py`` each"""
+        init_files = {
+            f"{package}/__init__.py": EMPTY_INIT_TEMPLATE for package in packages
+        }
+        return cls(name=name, files={**init_files, **files}, base=base)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(map(_freeze, value))
+    return value
+
+
+class LayerRenderer:
+    """Renders stacks of template layers, caching each layer's own output.
+
+    A layer's rendered files are cached under the values of the context
+    variables its templates reference, so any project that agrees on those
+    values reuses them, whatever else differs. A stack is composed as a
+    ``ChainMap`` of the layers' cached outputs: a layer never copies or
+    mutates its base's files, and rendering an overlay costs only the files
+    the overlay itself adds or replaces.
+    """
+
+    def __init__(self, template_repository: TemplateRepository, max_cached: int = 128):
+        self.template_repository = template_repository
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[Tuple[str, Hashable], Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(
+        self, layer: TemplateLayer, context: Dict[str, Any]
+    ) -> Tuple[str, Hashable]:
+        variables = sorted(
+            {
+                variable
+                for template_path in layer.files.values()
+                for variable in self.template_repository.referenced_variables(
+                    template_path
+                )
+            }
+        )
+        return layer.name, tuple(
+            (variable, _freeze(context.get(variable))) for variable in variables
+        )
+
+    def _render_layer(
+        self, layer: TemplateLayer, context: Dict[str, Any]
+    ) -> Dict[str, str]:
+        key = self._key(layer, context)
+        with self._lock:
+            rendered = self._cache.get(key)
+            if rendered is not None:
+                self._cache.move_to_end(key)
+                _layer_hits.inc()
+                return rendered
+        _layer_misses.inc()
+
+        with span(f"layer.{layer.name}"):
+            rendered = {
+                dest_path: self.template_repository.render_template(
+                    template_path, context
+                )
+                for dest_path, template_path in layer.files.items()
+            }
+        with self._lock:
+            self._cache[key] = rendered
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return rendered
+
+    def render(
+        self, layer: TemplateLayer, context: Dict[str, Any]
+    ) -> Mapping[str, str]:
+        """Destination -> content of ``layer`` over all its bases.
+
+        The result shares the cached outputs and must not be modified.
+        """
+        outputs = []
+        current: Optional[TemplateLayer] = layer
+        while current is not None:
+            outputs.append(self._render_layer(current, context))
+            current = current.base
+        return ChainMap(*outputs)
@@ -0,0 +1,100 @@
+import json
+from json.decoder import JSONDecodeError
+from typing import Any, Optional
+
+from .utils import SensitiveDataMasker
+
+DEFAULT_MAX_BODY_BYTES = 8192
+TEXTUAL_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/problem+json",
+        "application/x-www-form-urlencoded",
+        "application/xml",
+        "application/javascript",
+    }
+)
+
+
+class BodyCapturePolicy:
+    """Decides whether and how much of a body ends up in a log record.
+
+    Binary payloads (e.g. ``application/zip``) are never decoded, only
+    described. Bodies over ``max_body_bytes`` are cut with a truncation
+    marker and are not parsed, so the cost is bounded by the cap rather than
+    by the payload size.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        masker: Optional[SensitiveDataMasker] = None,
+    ):
+        self.max_body_bytes = max_body_bytes
+        self.masker = masker
+
+    @staticmethod
+    def media_type(content_type: Optional[str]) -> str:
+        if not content_type:
+            return ""
+        return content_type.split(";", 1)[0].strip().lower()
+
+    @classmethod
+    def is_textual(cls, content_type: Optional[str]) -> bool:
+        media_type = cls.media_type(content_type)
+        return (
+            media_type.startswith("text/")
+            or media_type in TEXTUAL_CONTENT_TYPES
+            or media_type.endswith("+json")
+        )
+
+    def should_read(
+        self, content_type: Optional[str], content_length: Optional[str]
+    ) -> bool:
+        """Whether a body is worth reading at all, judged from headers only"""
+        if content_length == "0":
+            return False
+        return not content_type or self.is_textual(content_type)
+
+    def describe_skipped(
+        self, content_type: Optional[str], content_length: Optional[str]
+    ) -> Optional[str]:
+        """Placeholder for a body that is not read; None for an empty body"""
+        size = (
+            int(content_length)
+            if content_length and content_length.strip().isdigit()
+            else None
+        )
+        if size == 0:
+            return None
+        media_type = self.media_type(content_type) or "unknown"
+        if size is None:
+            return f"<{media_type} body omitted>"
+        return f"<{media_type} body omitted, {size} bytes>"
+
+    def capture(self, body: bytes, content_type: Optional[str]) -> Any:
+        if not body:
+            return None
+        size = len(body)
+        if content_type and not self.is_textual(content_type):
+            return self.describe_skipped(content_type, str(size))
+
+        media_type = self.media_type(content_type)
+        is_json = not media_type or media_type.endswith("json")
+        if size > self.max_body_bytes:
+            if is_json and self.masker:
+                # Unparsed JSON cannot be masked, so never log a raw prefix of it
+                return f"<{media_type or 'unknown'} body over limit, {size} bytes>"
+            head = body[: self.max_body_bytes].decode("utf-8", errors="replace")
+            return f"{head}...<truncated {size - self.max_body_bytes} bytes>"
+
+        if is_json:
+            try:
+                parsed = json.loads(body)
+            except (JSONDecodeError, UnicodeDecodeError):
+                pass
+            else:
+                return self.masker.mask(parsed) if self.masker else parsed
+
+        return body.decode("utf-8", errors="replace")
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional
 
 
 class RequestContext:
@@ -6,6 +7,38 @@ class RequestContext:
         self.request_id = request_id
         self.correlation_id = correlation_id
         self.extras: Dict[str, Any] = {}
+        self.spans: List[Any] = []
+        # Set only for requests sampled by the allocation tracker.
+        self.allocation_marks: Optional[List[List[int]]] = None
 
     def add_extra(self, key: str, value: Any) -> None:
         self.extras[key] = value
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar(
+    "request_context", default=None
+)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    return _request_context.get()
+
+
+def set_request_context(context: RequestContext) -> Token:
+    return _request_context.set(context)
+
+
+def reset_request_context(token: Token) -> None:
+    _request_context.reset(token)
+
+
+def patch_log_record(record: Dict[str, Any]) -> None:
+    """Loguru patcher adding the current request/correlation ids to every record"""
+    context = _request_context.get()
+    extra = record["extra"]
+    if context is None:
+        extra.setdefault("request_id", "-")
+        extra.setdefault("correlation_id", None)
+    else:
+        extra.setdefault("request_id", context.request_id)
+        extra.setdefault("correlation_id", context.correlation_id)
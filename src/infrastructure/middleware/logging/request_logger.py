@@ -2,12 +2,12 @@ from fastapi import Request
 from datetime import datetime, UTC
 import uuid
 from typing import Dict, Any
-import json
-from json.decoder import JSONDecodeError
 from loguru import logger
 
-from .utils import get_client_ip, mask_sensitive_data
+from .body_capture import BodyCapturePolicy, DEFAULT_MAX_BODY_BYTES
+from .utils import get_client_ip, SensitiveDataMasker
 from .constants import DEFAULT_SENSITIVE_HEADERS
+from .context import get_request_context
 
 
 class RequestLogger:
@@ -19,16 +19,37 @@ class RequestLogger:
         mask_sensitive_data: bool = True,
         request_id_header: str = "X-Request-ID",
         correlation_id_header: str = "X-Correlation-ID",
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
     ):
         self.log_request_body = log_request_body
         self.sensitive_headers = sensitive_headers or DEFAULT_SENSITIVE_HEADERS
         self.mask_sensitive_data = mask_sensitive_data
         self.request_id_header = request_id_header
         self.correlation_id_header = correlation_id_header
+        self.masker = SensitiveDataMasker(self.sensitive_headers)
+        self.body_capture = BodyCapturePolicy(
+            max_body_bytes=max_body_bytes,
+            masker=self.masker if mask_sensitive_data else None,
+        )
 
     def get_request_id(self, request: Request) -> str:
+        context = get_request_context()
+        if context is not None:
+            return context.request_id
         return request.headers.get(self.request_id_header) or str(uuid.uuid4())
 
+    def build_summary(self, request: Request) -> Dict[str, Any]:
+        """Cheap record for sampled-out requests: no header copy, no body read"""
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "request_id": self.get_request_id(request),
+            "correlation_id": request.headers.get(self.correlation_id_header),
+            "method": request.method,
+            "path": request.url.path,
+            "client_ip": get_client_ip(request),
+            "sampled": False,
+        }
+
     async def build_log(self, request: Request) -> tuple[Dict[str, Any], str]:
         request_id = self.get_request_id(request)
         correlation_id = request.headers.get(self.correlation_id_header)
@@ -45,37 +66,30 @@ class RequestLogger:
             "user_agent": request.headers.get("user-agent"),
         }
 
-        headers = dict(request.headers)
         if self.mask_sensitive_data:
-            headers = mask_sensitive_data(headers, self.sensitive_headers)
-        log_data["headers"] = headers
+            log_data["headers"] = self.masker.mask_headers(request.headers)
+        else:
+            log_data["headers"] = dict(request.headers)
 
         if self.log_request_body:
             body = await self._get_request_body(request)
             if body is not None:
-                if self.mask_sensitive_data:
-                    body = mask_sensitive_data(body, self.sensitive_headers)
                 log_data["body"] = body
 
         return log_data, request_id
 
-    @staticmethod
-    async def _get_request_body(request: Request) -> Any:
+    async def _get_request_body(self, request: Request) -> Any:
         if not hasattr(request, "body"):
             return None
 
-        body = await request.body()
-        if not body:
-            return None
+        content_type = request.headers.get("content-type")
+        content_length = request.headers.get("content-length")
+        if not self.body_capture.should_read(content_type, content_length):
+            return self.body_capture.describe_skipped(content_type, content_length)
 
         try:
-            return json.loads(body)
-        except JSONDecodeError:
-            try:
-                return body.decode()
-            except UnicodeDecodeError as e:
-                logger.warning(f"Failed to decode request body: {str(e)}")
-                return None
+            body = await request.body()
+            return self.body_capture.capture(body, content_type)
         except Exception as e:
             logger.error(f"Failed to process request body: {str(e)}")
             return None
@@ -1,18 +1,22 @@
+from typing import Any, Dict, Optional
+
 from fastapi import Request, Response
 from starlette.middleware.base import RequestResponseEndpoint
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 from loguru import logger
-from contextlib import asynccontextmanager
-import time
 
 from .base import BaseCustomMiddleware
+from .body_capture import DEFAULT_MAX_BODY_BYTES
 from .constants import (
     DEFAULT_EXCLUDED_PATHS,
     DEFAULT_EXCLUDED_METHODS,
-    nullcontext,
     LogLevel,
 )
 from .request_logger import RequestLogger
 from .response_logger import ResponseLogger
+from .sampling import SamplingPolicy
+from .utils import request_timing
+from src.infrastructure.observability.tracing import span
 
 
 class RequestLoggingMiddleware(BaseCustomMiddleware):
@@ -26,29 +30,25 @@ class RequestLoggingMiddleware(BaseCustomMiddleware):
         log_response_body: bool = True,
         mask_sensitive_data: bool = True,
         include_timing: bool = True,
+        sampling_policy: SamplingPolicy = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
     ):
         super().__init__(app)
-        self.duration_ms = None
         self.exclude_paths = exclude_paths or DEFAULT_EXCLUDED_PATHS
         self.exclude_methods = exclude_methods or DEFAULT_EXCLUDED_METHODS
         self.include_timing = include_timing
+        self.sampling_policy = sampling_policy or SamplingPolicy()
         self.request_logger = RequestLogger(
             log_request_body=log_request_body,
             mask_sensitive_data=mask_sensitive_data,
+            max_body_bytes=max_body_bytes,
         )
         self.response_logger = ResponseLogger(
             log_response_body=log_response_body,
             mask_sensitive_data=mask_sensitive_data,
+            max_body_bytes=max_body_bytes,
         )
 
-    @asynccontextmanager
-    async def timing_context(self):
-        start = time.time()
-        try:
-            yield
-        finally:
-            self.duration_ms = round((time.time() - start) * 1000, 2)
-
     def _should_skip_logging(self, request: Request) -> bool:
         return (
             request.url.path in self.exclude_paths
@@ -61,24 +61,48 @@ class RequestLoggingMiddleware(BaseCustomMiddleware):
         if self._should_skip_logging(request):
             return await call_next(request)
 
-        self.duration_ms = None
-        timing_ctx = self.timing_context() if self.include_timing else nullcontext()
-
-        log_data, request_id = await self.request_logger.build_log(request)
+        log_data: Optional[Dict[str, Any]] = None
+        request_id: Optional[str] = None
+        if self.sampling_policy.should_sample(request.url.path):
+            with span("log.request"):
+                log_data, request_id = await self.request_logger.build_log(request)
 
-        async with timing_ctx:
-            try:
+        response = None
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+        try:
+            async with request_timing() as timing:
                 response = await call_next(request)
-                status_code = response.status_code
-            except Exception as exc:
-                logger.error(f"Request {request_id}: Unhandled exception - {str(exc)}")
-                raise
-            finally:
-                log_data.update(self.response_logger.build_log(response, status_code))
-                if self.include_timing:
-                    log_data["duration_ms"] = self.duration_ms
-
-                log_level = LogLevel.from_status_code(status_code)
-                logger.log(log_level, log_data)
+            status_code = response.status_code
+        except Exception as exc:
+            logger.error(f"Request {request_id}: Unhandled exception - {str(exc)}")
+            raise
+        finally:
+            with span("log.response"):
+                self._log_request(
+                    request, response, status_code, timing.duration_ms, log_data
+                )
 
         return response
+
+    def _log_request(
+        self,
+        request: Request,
+        response: Optional[Response],
+        status_code: int,
+        duration_ms: float,
+        log_data: Optional[Dict[str, Any]],
+    ) -> None:
+        if log_data is None:
+            if not self.sampling_policy.should_keep(status_code, duration_ms):
+                return
+            log_data = self.request_logger.build_summary(request)
+            log_data.update(self.response_logger.build_summary(status_code))
+        elif response is not None:
+            log_data.update(self.response_logger.build_log(response, status_code))
+        else:
+            log_data.update(self.response_logger.build_summary(status_code))
+
+        if self.include_timing:
+            log_data["duration_ms"] = duration_ms
+
+        logger.log(LogLevel.from_status_code(status_code), log_data)
@@ -3,7 +3,8 @@ from typing import Dict, Any
 from http import HTTPStatus
 from loguru import logger
 
-from .utils import mask_sensitive_data
+from .body_capture import BodyCapturePolicy, DEFAULT_MAX_BODY_BYTES
+from .utils import SensitiveDataMasker
 from .constants import DEFAULT_SENSITIVE_HEADERS
 
 
@@ -14,30 +15,39 @@ class ResponseLogger:
         log_response_body: bool = True,
         sensitive_headers: set[str] = None,
         mask_sensitive_data: bool = True,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
     ):
         self.log_response_body = log_response_body
         self.sensitive_headers = sensitive_headers or DEFAULT_SENSITIVE_HEADERS
         self.mask_sensitive_data = mask_sensitive_data
+        self.masker = SensitiveDataMasker(self.sensitive_headers)
+        self.body_capture = BodyCapturePolicy(
+            max_body_bytes=max_body_bytes,
+            masker=self.masker if mask_sensitive_data else None,
+        )
 
-    def build_log(self, response: Response, status_code: int) -> Dict[str, Any]:
-        log_data = {
+    @staticmethod
+    def build_summary(status_code: int) -> Dict[str, Any]:
+        return {
             "status_code": status_code,
             "status_phrase": HTTPStatus(status_code).phrase,
         }
 
-        headers = dict(response.headers)
+    def build_log(self, response: Response, status_code: int) -> Dict[str, Any]:
+        log_data = self.build_summary(status_code)
+
         if self.mask_sensitive_data:
-            headers = mask_sensitive_data(headers, self.sensitive_headers)
-        log_data["response_headers"] = headers
+            log_data["response_headers"] = self.masker.mask_headers(response.headers)
+        else:
+            log_data["response_headers"] = dict(response.headers)
 
         if self.log_response_body and hasattr(response, "body"):
             try:
-                body = response.body.decode()
-                if self.mask_sensitive_data:
-                    body = mask_sensitive_data(body, self.sensitive_headers)
-                log_data["response_body"] = body
-            except UnicodeDecodeError as e:
-                logger.warning(f"Failed to decode response body: {str(e)}")
+                body = self.body_capture.capture(
+                    response.body, response.headers.get("content-type")
+                )
+                if body is not None:
+                    log_data["response_body"] = body
             except Exception as e:
                 logger.error(f"Failed to read response body: {str(e)}")
 
@@ -0,0 +1,67 @@
+import random
+from typing import Dict, Optional
+
+from .constants import LogLevel
+
+
+class SamplingPolicy:
+    """Decides which requests get a full log record.
+
+    Requests are sampled before they are handled, so a sampled-out request
+    never has its headers copied or its body read. Errors (4xx/5xx) and slow
+    requests are always kept, as a summary record, after the response is known.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: float = 1.0,
+        slow_request_threshold_ms: Optional[float] = None,
+        route_overrides: Optional[Dict[str, float]] = None,
+    ):
+        self.sample_rate = self._clamp(sample_rate)
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self.route_overrides = {
+            path.rstrip("/") or "/": self._clamp(rate)
+            for path, rate in (route_overrides or {}).items()
+        }
+        self._prefixes = tuple(
+            sorted(
+                (path for path in self.route_overrides if path != "/"),
+                key=len,
+                reverse=True,
+            )
+        )
+
+    @staticmethod
+    def _clamp(rate: float) -> float:
+        return min(max(float(rate), 0.0), 1.0)
+
+    def rate_for(self, path: str) -> float:
+        """Sample rate for a path; the longest matching route override wins"""
+        if not self.route_overrides:
+            return self.sample_rate
+        rate = self.route_overrides.get(path.rstrip("/") or "/")
+        if rate is not None:
+            return rate
+        for prefix in self._prefixes:
+            if path.startswith(prefix + "/"):
+                return self.route_overrides[prefix]
+        return self.sample_rate
+
+    def should_sample(self, path: str) -> bool:
+        rate = self.rate_for(path)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return random.random() < rate
+
+    def should_keep(self, status_code: int, duration_ms: float) -> bool:
+        """Whether a sampled-out request must still be logged"""
+        if LogLevel.from_status_code(status_code) != LogLevel.INFO:
+            return True
+        return (
+            self.slow_request_threshold_ms is not None
+            and duration_ms >= self.slow_request_threshold_ms
+        )
@@ -1,9 +1,8 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Any
+from functools import lru_cache
+from typing import AsyncGenerator, Any, Dict, FrozenSet, Iterable, Mapping
 from fastapi import Request
 import time
-import json
-from json.decoder import JSONDecodeError
 
 from src.infrastructure.middleware.logging.models import RequestTiming
 
@@ -17,24 +16,45 @@ async def request_timing() -> AsyncGenerator[RequestTiming, None]:
         timing.end_time = time.time()
 
 
+class SensitiveDataMasker:
+    """Masks values of sensitive keys in a single pass over parsed data.
+
+    The key set is lowercased once up front; strings are never re-parsed.
+    """
+
+    MASK = "***MASKED***"
+
+    def __init__(self, sensitive_keys: Iterable[str]):
+        self.sensitive_keys = frozenset(key.lower() for key in sensitive_keys)
+
+    def mask_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
+        """Mask a flat header mapping; ASGI header names are already lowercase"""
+        keys = self.sensitive_keys
+        return {k: self.MASK if k in keys else v for k, v in headers.items()}
+
+    def mask(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            keys = self.sensitive_keys
+            return {
+                k: (
+                    self.MASK
+                    if isinstance(k, str) and k.lower() in keys
+                    else self.mask(v)
+                )
+                for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [self.mask(item) for item in data]
+        return data
+
+
+@lru_cache(maxsize=32)
+def _get_masker(sensitive_keys: FrozenSet[str]) -> SensitiveDataMasker:
+    return SensitiveDataMasker(sensitive_keys)
+
+
 def mask_sensitive_data(data: Any, sensitive_headers: set[str]) -> Any:
-    if isinstance(data, dict):
-        return {
-            k: (
-                "***MASKED***"
-                if k.lower() in sensitive_headers
-                else mask_sensitive_data(v, sensitive_headers)
-            )
-            for k, v in data.items()
-        }
-    if isinstance(data, str):
-        try:
-            json_data = json.loads(data)
-            if isinstance(json_data, dict):
-                return json.dumps(mask_sensitive_data(json_data, sensitive_headers))
-        except JSONDecodeError:
-            pass
-    return data
+    return _get_masker(frozenset(sensitive_headers)).mask(data)
 
 
 def get_client_ip(request: Request) -> str:
@@ -0,0 +1,55 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.metrics import (
+    HTTP_REQUEST_DURATION,
+    MetricsRegistry,
+    registry as default_registry,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency per route template.
+
+    The route label comes from the matched route's path template, never the raw
+    URL, so label cardinality stays bounded by the number of routes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        registry: MetricsRegistry = None,
+        exclude_paths: set[str] = None,
+    ):
+        self.app = app
+        self.registry = registry or default_registry
+        self.exclude_paths = exclude_paths or set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status_code,
+            ).observe(perf_counter() - start)
+            self.registry.maybe_flush()
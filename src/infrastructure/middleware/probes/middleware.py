@@ -0,0 +1,59 @@
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+LIVENESS_BODY = b'{"status":"alive"}'
+READY_BODY = b'{"status":"ready"}'
+NOT_READY_BODY = b'{"status":"not ready"}'
+
+
+class ProbeMiddleware:
+    """Pure ASGI middleware answering the liveness and readiness probes itself.
+
+    Added outermost, so probes are answered without routing, logging, rate
+    limiting or any other middleware. Liveness only proves that the event loop
+    of this worker is still serving requests; readiness additionally asks
+    ``ready_check`` whether the worker should receive traffic.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        live_path: str = "/health/live",
+        ready_path: str = "/health/ready",
+        ready_check: Optional[Callable[[], bool]] = None,
+    ):
+        self.app = app
+        self.live_path = live_path
+        self.ready_path = ready_path
+        self.ready_check = ready_check
+
+    @staticmethod
+    async def _respond(send: Send, status: int, body: bytes) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"cache-control", b"no-store"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == self.live_path:
+                await self._respond(send, 200, LIVENESS_BODY)
+                return
+            if path == self.ready_path:
+                if self.ready_check is None or self.ready_check():
+                    await self._respond(send, 200, READY_BODY)
+                else:
+                    await self._respond(send, 503, NOT_READY_BODY)
+                return
+        await self.app(scope, receive, send)
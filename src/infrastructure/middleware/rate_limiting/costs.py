@@ -0,0 +1,80 @@
+import math
+from typing import Dict, Optional
+
+DEFAULT_MAX_ROUTES = 1024
+
+
+class RouteCostModel:
+    """Decides how many rate-limit units a request is charged.
+
+    Routes with a static cost (longest path prefix wins) are always charged
+    that cost. Other routes are charged by how expensive they have proven to
+    be: an exponentially weighted average of their successful handling time,
+    with one unit per ``cost_unit_ms``, clamped to ``[1, max_cost]``. Setting
+    ``cost_unit_ms`` to 0 disables measured costs.
+    """
+
+    def __init__(
+        self,
+        *,
+        static_costs: Optional[Dict[str, int]] = None,
+        cost_unit_ms: float = 0.0,
+        max_cost: int = 20,
+        smoothing: float = 0.2,
+        max_routes: int = DEFAULT_MAX_ROUTES,
+    ):
+        self.static_costs = {
+            path.rstrip("/") or "/": max(int(cost), 0)
+            for path, cost in (static_costs or {}).items()
+        }
+        self._prefixes = tuple(
+            sorted(
+                (path for path in self.static_costs if path != "/"),
+                key=len,
+                reverse=True,
+            )
+        )
+        self.cost_unit_ms = cost_unit_ms
+        self.max_cost = max_cost
+        self.smoothing = smoothing
+        self.max_routes = max_routes
+        self._average_ms: Dict[str, float] = {}
+
+    def _static_cost(self, path: str) -> Optional[int]:
+        if not self.static_costs:
+            return None
+        cost = self.static_costs.get(path)
+        if cost is not None:
+            return cost
+        for prefix in self._prefixes:
+            if path.startswith(prefix + "/"):
+                return self.static_costs[prefix]
+        return self.static_costs.get("/")
+
+    def cost_for(self, path: str) -> int:
+        path = path.rstrip("/") or "/"
+        cost = self._static_cost(path)
+        if cost is not None:
+            return cost
+        average_ms = self._average_ms.get(path)
+        if average_ms is None:
+            return 1
+        units = math.ceil(average_ms / self.cost_unit_ms)
+        return min(max(units, 1), self.max_cost)
+
+    def observe(self, path: str, status_code: int, duration_ms: float) -> None:
+        """Feed back the handling time of a request to a non-static route"""
+        if not self.cost_unit_ms or status_code >= 400:
+            return
+        path = path.rstrip("/") or "/"
+        if self._static_cost(path) is not None:
+            return
+        average_ms = self._average_ms.get(path)
+        if average_ms is None:
+            if len(self._average_ms) >= self.max_routes:
+                return
+            self._average_ms[path] = duration_ms
+        else:
+            self._average_ms[path] = average_ms + self.smoothing * (
+                duration_ms - average_ms
+            )
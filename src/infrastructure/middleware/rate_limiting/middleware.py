@@ -1,83 +1,120 @@
-from fastapi import Request, Response
-from starlette.middleware.base import RequestResponseEndpoint
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from loguru import logger
 
-from .store import InMemoryStore
-from ..logging.base import BaseCustomMiddleware
+from src.infrastructure.observability.metrics import RATE_LIMIT_REJECTIONS
+from .costs import RouteCostModel
+from .store import RateLimitStore, SlidingWindowStore
 
 
 class RateLimitExceeded(Exception):
     pass
 
 
-class RateLimitingMiddleware(BaseCustomMiddleware):
+class RateLimitingMiddleware:
+    """Pure ASGI rate limiter, meant to be the outermost middleware.
+
+    The decision is made from the path, headers and client address only, so a
+    rejected request is answered before anything downstream runs and its body
+    is never received. OPTIONS requests (CORS preflights) are never counted.
+    """
+
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         requests_limit: int = 100,
         window_seconds: int = 60,
         exclude_paths: set[str] = None,
+        store: RateLimitStore = None,
+        cost_model: RouteCostModel = None,
     ):
-        super().__init__(app)
-        self.store = InMemoryStore()
+        self.app = app
+        # Stores define __len__, so an empty one is falsy.
+        self.store = store if store is not None else SlidingWindowStore(window_seconds)
         self.requests_limit = requests_limit
         self.window_seconds = window_seconds
         self.exclude_paths = exclude_paths or set()
+        self.cost_model = cost_model or RouteCostModel()
 
     @staticmethod
-    def _get_client_key(request: Request) -> str:
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+    def _get_client_key(scope: Scope) -> str:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
-    def _should_skip_rate_limiting(self, request: Request) -> bool:
-        return request.url.path in self.exclude_paths
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if self._should_skip_rate_limiting(request):
-            return await call_next(request)
+    def _rejection(self, time_until_reset: float) -> JSONResponse:
+        return JSONResponse(
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "error": "Rate limit exceeded",
+                "detail": (
+                    f"Too many requests. Please try again in "
+                    f"{time_until_reset:.1f} seconds."
+                ),
+                "reset_in_seconds": round(time_until_reset, 1),
+            },
+            headers={
+                "X-RateLimit-Limit": str(self.requests_limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(round(time_until_reset)),
+            },
+        )
 
-        client_key = self._get_client_key(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in self.exclude_paths
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        requests_count, time_until_reset = self.store.get_requests_count(
-            client_key, self.window_seconds
-        )
+        client_key = self._get_client_key(scope)
+        path = scope["path"]
+        cost = self.cost_model.cost_for(path)
 
-        self.store.add_request(client_key)
+        requests_count, time_until_reset = await self.store.check(client_key, cost)
 
-        if requests_count >= self.requests_limit:
+        if requests_count + cost > self.requests_limit:
+            RATE_LIMIT_REJECTIONS.inc()
             logger.warning(
                 f"Rate limit exceeded for client {client_key}. "
-                f"Count: {requests_count}, Limit: {self.requests_limit}"
-            )
-            return JSONResponse(
-                status_code=HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "error": "Rate limit exceeded",
-                    "detail": (
-                        f"Too many requests. Please try again in "
-                        f"{time_until_reset:.1f} seconds."
-                    ),
-                    "reset_in_seconds": round(time_until_reset, 1),
-                },
-                headers={
-                    "X-RateLimit-Limit": str(self.requests_limit),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(round(time_until_reset)),
-                },
+                f"Count: {requests_count}, Cost: {cost}, Limit: {self.requests_limit}"
             )
+            response = self._rejection(time_until_reset)
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(self.requests_limit)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.requests_limit - requests_count - 1
-        )
-        response.headers["X-RateLimit-Reset"] = str(round(time_until_reset))
+        rate_limit_headers = [
+            ("X-RateLimit-Limit", str(self.requests_limit)),
+            (
+                "X-RateLimit-Remaining",
+                str(max(self.requests_limit - requests_count - cost, 0)),
+            ),
+            ("X-RateLimit-Reset", str(round(time_until_reset))),
+        ]
+        start_time = perf_counter()
+        status_code = 500
 
-        return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_limit_headers:
+                    headers.append(name, value)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.cost_model.observe(
+                path, status_code, (perf_counter() - start_time) * 1000
+            )
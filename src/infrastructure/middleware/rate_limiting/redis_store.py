@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+from time import monotonic, time
+from typing import Callable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from .resp import RespConnectionPool, RespError, encode_command
+from .store import LocalRateLimitStore, RateLimitStore, SlidingWindowStore
+
+# KEYS[1] is the current window's counter, KEYS[2] the previous window's.
+SLIDING_WINDOW_SCRIPT = """
+local cost = tonumber(ARGV[1])
+local current = redis.call('INCRBY', KEYS[1], cost)
+if current == cost then
+    redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+end
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+return {current - cost, previous}
+"""
+SLIDING_WINDOW_SHA = hashlib.sha1(SLIDING_WINDOW_SCRIPT.encode()).hexdigest()
+
+PendingCheck = Tuple[bytes, asyncio.Future]
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Cluster-wide sliding-window limits on a Redis-protocol server.
+
+    Each check is one ``EVALSHA`` of a server-side script that increments and
+    reads the window counters atomically. Both counters are declared in KEYS
+    and share the client key as hash tag (``ratelimit:{client}:<window>``),
+    so the script is valid on Redis Cluster and never spans two slots. The
+    window is picked by this host's clock, so the hosts sharing a backend
+    need synchronised clocks. Checks made
+    during the same event-loop tick are pipelined together on one pooled
+    connection. If the backend errors or does not answer within ``timeout``
+    seconds, checks are answered by a local store for ``retry_after`` seconds.
+    A pipeline that times out drops its connection from the pool, so a late
+    reply is never mistaken for the answer to a later check.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        window_seconds: int,
+        *,
+        pool_size: int = 4,
+        timeout: float = 0.05,
+        retry_after: float = 5.0,
+        key_prefix: str = "ratelimit:",
+        max_batch: int = 256,
+        fallback: Optional[LocalRateLimitStore] = None,
+        clock: Callable[[], float] = time,
+    ):
+        self.window_seconds = window_seconds
+        self.pool = RespConnectionPool(url, size=pool_size)
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.key_prefix = key_prefix
+        self.max_batch = max_batch
+        self._clock = clock
+        # Stores define __len__, so an empty one is falsy.
+        self.fallback = (
+            fallback
+            if fallback is not None
+            else SlidingWindowStore(window_seconds, clock=clock)
+        )
+        self._pending: List[PendingCheck] = []
+        self._batches: Set[asyncio.Task] = set()
+        self._flush_scheduled = False
+        self._degraded_until = 0.0
+
+    async def check(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        if self._degraded_until and monotonic() < self._degraded_until:
+            return self.fallback.increment(key, cost)
+
+        now = self._clock()
+        window_index = int(now // self.window_seconds)
+        elapsed = now - window_index * self.window_seconds
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((self._encode(key, cost, window_index), future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush_pending)
+
+        try:
+            current, previous = await asyncio.wait_for(future, self.timeout)
+        except (asyncio.TimeoutError, OSError, RespError) as e:
+            self._degrade(e)
+            return self.fallback.increment(key, cost)
+
+        self._degraded_until = 0.0
+        previous_weight = 1.0 - elapsed / self.window_seconds
+        count = int(current + previous * previous_weight)
+        return count, self.window_seconds - elapsed
+
+    def _degrade(self, error: Exception) -> None:
+        if not self._degraded_until:
+            logger.warning(
+                f"Rate-limit backend unavailable, limiting locally for "
+                f"{self.retry_after}s: {error!r}"
+            )
+        self._degraded_until = monotonic() + self.retry_after
+
+    def _flush_pending(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch):
+            task = asyncio.ensure_future(
+                self._send_batch(pending[start : start + self.max_batch])
+            )
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _send_batch(self, batch: List[PendingCheck]) -> None:
+        try:
+            connection = await self.pool.acquire()
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        discard = False
+        try:
+            replies = await connection.pipeline(
+                [command for command, _ in batch], self.timeout
+            )
+            missing = [i for i, reply in enumerate(replies) if self._is_noscript(reply)]
+            if missing:
+                await connection.execute(
+                    "SCRIPT", "LOAD", SLIDING_WINDOW_SCRIPT, timeout=self.timeout
+                )
+                retried = await connection.pipeline(
+                    [batch[i][0] for i in missing], self.timeout
+                )
+                for i, reply in zip(missing, retried):
+                    replies[i] = reply
+            for (_, future), reply in zip(batch, replies):
+                if future.done():
+                    continue
+                if isinstance(reply, RespError):
+                    future.set_exception(reply)
+                else:
+                    current, previous = reply
+                    future.set_result((current, previous))
+        except Exception as e:
+            discard = True
+            self._fail(batch, e)
+        finally:
+            self.pool.release(connection, discard=discard)
+
+    def window_keys(self, key: str, window_index: int) -> Tuple[str, str]:
+        """Keys of the current and previous window counters of ``key``"""
+        base = f"{self.key_prefix}{{{key}}}"
+        return f"{base}:{window_index}", f"{base}:{window_index - 1}"
+
+    def _encode(self, key: str, cost: int, window_index: int) -> bytes:
+        return encode_command(
+            "EVALSHA",
+            SLIDING_WINDOW_SHA,
+            2,
+            *self.window_keys(key, window_index),
+            cost,
+            self.window_seconds * 2,
+        )
+
+    @staticmethod
+    def _is_noscript(reply) -> bool:
+        return isinstance(reply, RespError) and str(reply).startswith("NOSCRIPT")
+
+    @staticmethod
+    def _fail(batch: List[PendingCheck], error: Exception) -> None:
+        if not isinstance(error, (OSError, RespError)):
+            error = OSError(str(error))
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        await self.pool.close()
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any, List, Optional, Sequence
+from urllib.parse import urlparse
+
+CRLF = b"\r\n"
+
+
+class RespError(Exception):
+    """Error reply returned by a Redis-protocol server"""
+
+
+def encode_command(*args: Any) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one reply; error replies are returned (not raised) as RespError"""
+    line = await reader.readuntil(CRLF)
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        return RespError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RespError(f"Unexpected reply prefix: {line!r}")
+
+
+class RespConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def pipeline(
+        self, commands: Sequence[bytes], timeout: Optional[float] = None
+    ) -> List[Any]:
+        """Send already-encoded commands in one write and read every reply.
+
+        Raises ``asyncio.TimeoutError`` when the round trip takes longer than
+        ``timeout`` seconds; the connection must then be discarded, as late
+        replies would be read by the next command.
+        """
+        return await asyncio.wait_for(self._round_trip(commands), timeout)
+
+    async def _round_trip(self, commands: Sequence[bytes]) -> List[Any]:
+        self.writer.write(b"".join(commands))
+        await self.writer.drain()
+        return [await read_reply(self.reader) for _ in commands]
+
+    async def execute(self, *args: Any, timeout: Optional[float] = None) -> Any:
+        (reply,) = await self.pipeline([encode_command(*args)], timeout)
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RespConnectionPool:
+    """Fixed-size pool of connections to a Redis-protocol server.
+
+    Accepts ``redis://[:password@]host[:port][/db]`` URLs. A connection that
+    fails mid-command is discarded rather than returned to the pool, since its
+    reply stream can no longer be trusted.
+    """
+
+    def __init__(self, url: str, *, size: int = 4, connect_timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self._idle: Optional[asyncio.LifoQueue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _ensure_started(self) -> None:
+        if self._idle is None:
+            self._idle = asyncio.LifoQueue()
+            self._slots = asyncio.Semaphore(self.size)
+
+    async def _connect(self) -> RespConnection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.connect_timeout
+        )
+        connection = RespConnection(reader, writer)
+        if self.password:
+            await connection.execute("AUTH", self.password)
+        if self.db:
+            await connection.execute("SELECT", self.db)
+        return connection
+
+    async def acquire(self) -> RespConnection:
+        self._ensure_started()
+        await self._slots.acquire()
+        try:
+            if not self._idle.empty():
+                return self._idle.get_nowait()
+            return await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: RespConnection, *, discard: bool = False) -> None:
+        if discard:
+            connection.close()
+        else:
+            self._idle.put_nowait(connection)
+        self._slots.release()
+
+    async def close(self) -> None:
+        if self._idle is None:
+            return
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
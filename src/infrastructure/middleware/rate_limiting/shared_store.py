@@ -0,0 +1,165 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from time import time
+from typing import Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from .store import LocalRateLimitStore, SlidingWindowStore
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+HEADER = struct.Struct("<IIII")
+SLOT = struct.Struct("<QqII")
+MAGIC = 0x524C5331
+VERSION = 1
+DEFAULT_SLOTS = 65536
+DEFAULT_STRIPES = 64
+MAX_PROBES = 32
+
+
+def default_segment_path() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "fastapi-initializr-ratelimit")
+
+
+class SharedMemoryStore(LocalRateLimitStore):
+    """Sliding-window counters shared by every worker process on the host.
+
+    The table lives in a memory-mapped file (``/dev/shm`` when available) as a
+    fixed-size open-addressing table of ``(key hash, window, current,
+    previous)`` slots. Slots are split into stripes; a key only ever probes
+    within its own stripe, so one POSIX byte-range lock per stripe (plus a
+    thread lock for callers in the same process) serialises every update to
+    that key across processes. Slots whose counts are older than two windows
+    are reclaimed in place, which keeps the table from filling with idle
+    clients. If a stripe is exhausted the key falls back to a local store.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int,
+        *,
+        path: Optional[str] = None,
+        slots: int = DEFAULT_SLOTS,
+        stripes: int = DEFAULT_STRIPES,
+        clock: Callable[[], float] = time,
+    ):
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryStore requires POSIX file locking")
+        if slots % stripes:
+            raise ValueError("slots must be a multiple of stripes")
+
+        self.window_seconds = window_seconds
+        self.path = Path(path or default_segment_path())
+        self.slots = slots
+        self.stripes = stripes
+        self.stripe_size = slots // stripes
+        self._clock = clock
+        self._thread_locks: List[threading.Lock] = [
+            threading.Lock() for _ in range(stripes)
+        ]
+        self._fallback = SlidingWindowStore(window_seconds, clock=clock)
+
+        size = HEADER.size + slots * SLOT.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock_range(-1, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+            self._initialise_header()
+        finally:
+            self._lock_range(-1, fcntl.LOCK_UN)
+
+    def _initialise_header(self) -> None:
+        magic, version, slots, stripes = HEADER.unpack_from(self._map, 0)
+        if magic == 0:
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, self.slots, self.stripes)
+        elif (magic, version, slots, stripes) != (
+            MAGIC,
+            VERSION,
+            self.slots,
+            self.stripes,
+        ):
+            raise ValueError(
+                f"Shared rate-limit segment {self.path} has an incompatible layout"
+            )
+
+    def _lock_range(self, stripe: int, operation: int) -> None:
+        # Byte 0 guards the header; stripe n is guarded by byte n + 1. The
+        # locked bytes are lock tokens only, they need not lie inside the file.
+        fcntl.lockf(self._fd, operation, 1, stripe + 1, os.SEEK_SET)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def increment(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        """Record a request and return (count before it, seconds until reset)"""
+        now = self._clock()
+        window_index = int(now // self.window_seconds)
+        elapsed = now - window_index * self.window_seconds
+        key_hash = self._hash(key)
+        stripe = key_hash % self.stripes
+
+        with self._thread_locks[stripe]:
+            self._lock_range(stripe, fcntl.LOCK_EX)
+            try:
+                counts = self._increment_slot(key_hash, stripe, window_index, cost)
+            finally:
+                self._lock_range(stripe, fcntl.LOCK_UN)
+
+        if counts is None:
+            logger.warning(f"Shared rate-limit stripe {stripe} is full")
+            return self._fallback.increment(key, cost)
+
+        current, previous = counts
+        previous_weight = 1.0 - elapsed / self.window_seconds
+        return int(current + previous * previous_weight), self.window_seconds - elapsed
+
+    def _increment_slot(
+        self, key_hash: int, stripe: int, window_index: int, cost: int
+    ) -> Optional[Tuple[int, int]]:
+        base = stripe * self.stripe_size
+        start = (key_hash // self.stripes) % self.stripe_size
+        reusable = None
+        for probe in range(min(MAX_PROBES, self.stripe_size)):
+            offset = (
+                HEADER.size + (base + (start + probe) % self.stripe_size) * SLOT.size
+            )
+            slot_hash, slot_window, current, previous = SLOT.unpack_from(
+                self._map, offset
+            )
+            if slot_hash == key_hash:
+                if slot_window == window_index - 1:
+                    current, previous = 0, current
+                elif slot_window != window_index:
+                    current, previous = 0, 0
+                SLOT.pack_into(
+                    self._map, offset, key_hash, window_index, current + cost, previous
+                )
+                return current, previous
+            if slot_hash == 0:
+                reusable = offset if reusable is None else reusable
+                break
+            if reusable is None and slot_window < window_index - 1:
+                reusable = offset
+
+        if reusable is None:
+            return None
+        SLOT.pack_into(self._map, reusable, key_hash, window_index, cost, 0)
+        return 0, 0
+
+    async def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
@@ -0,0 +1,152 @@
+import hashlib
+import struct
+from array import array
+from time import time
+from typing import Callable, Dict, List, Tuple
+
+from .store import LocalRateLimitStore
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimator that never undercounts.
+
+    ``depth`` rows of ``width`` counters; a key increments one counter per
+    row and its estimate is the smallest of them. Conservative update only
+    raises the counters that are below the new estimate, which keeps
+    collisions from inflating estimates more than necessary.
+    """
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self._counters = array("I", bytes(4 * width * depth))
+        self._unpack = struct.Struct(f"<{depth}I").unpack
+
+    def _indexes(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=4 * self.depth).digest()
+        return [
+            row * self.width + value % self.width
+            for row, value in enumerate(self._unpack(digest))
+        ]
+
+    def estimate(self, key: str) -> int:
+        return min(self._counters[i] for i in self._indexes(key))
+
+    def add(self, key: str, count: int = 1) -> Tuple[int, int]:
+        """Add count to key; return its (estimate before, estimate after)"""
+        indexes = self._indexes(key)
+        counters = self._counters
+        before = min(counters[i] for i in indexes)
+        after = before + count
+        for i in indexes:
+            if counters[i] < after:
+                counters[i] = after
+        return before, after
+
+
+class TopK:
+    """The k keys with the highest counts seen so far in a window"""
+
+    def __init__(self, k: int):
+        self.k = k
+        self.counts: Dict[str, int] = {}
+        self._threshold = 0
+
+    def offer(self, key: str, count: int) -> None:
+        counts = self.counts
+        if key in counts:
+            counts[key] = count
+            return
+        if len(counts) < self.k:
+            counts[key] = count
+            if len(counts) == self.k:
+                self._threshold = min(counts.values())
+            return
+        # Counts only grow within a window, so the threshold is a lower bound
+        # on the smallest count and the full scan is only paid when it is beaten.
+        if count <= self._threshold:
+            return
+        smallest = min(counts, key=counts.get)
+        if counts[smallest] < count:
+            del counts[smallest]
+            counts[key] = count
+        self._threshold = min(counts.values())
+
+
+class HeavyHitterStore(LocalRateLimitStore):
+    """Sliding-window limits in memory that does not grow with client count.
+
+    Counts are kept in two count-min sketches (current and previous fixed
+    window), combined the same way as SlidingWindowStore. Because the sketch
+    only ever overestimates, a client is never let through early; a client
+    sharing every counter with a heavy hitter can be limited early, with a
+    probability set by ``width`` and ``depth``. Only the ``top_k`` heaviest
+    clients are remembered by key, for operators to inspect.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int,
+        *,
+        width: int = 16384,
+        depth: int = 4,
+        top_k: int = 32,
+        clock: Callable[[], float] = time,
+    ):
+        self.window_seconds = window_seconds
+        self.width = width
+        self.depth = depth
+        self.top_k = top_k
+        self._clock = clock
+        self._window_index = int(clock() // window_seconds)
+        self._current = CountMinSketch(width, depth)
+        self._previous = CountMinSketch(width, depth)
+        self._current_top = TopK(top_k)
+        self._previous_top = TopK(top_k)
+
+    def _roll(self, now: float) -> int:
+        window_index = int(now // self.window_seconds)
+        if window_index != self._window_index:
+            if window_index == self._window_index + 1:
+                self._previous = self._current
+                self._previous_top = self._current_top
+            else:
+                self._previous = CountMinSketch(self.width, self.depth)
+                self._previous_top = TopK(self.top_k)
+            self._current = CountMinSketch(self.width, self.depth)
+            self._current_top = TopK(self.top_k)
+            self._window_index = window_index
+        return window_index
+
+    def _previous_weight(self, now: float, window_index: int) -> float:
+        return 1.0 - (now - window_index * self.window_seconds) / self.window_seconds
+
+    def increment(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        """Record a request and return (count before it, seconds until reset)"""
+        now = self._clock()
+        window_index = self._roll(now)
+        elapsed = now - window_index * self.window_seconds
+
+        current, after = self._current.add(key, cost)
+        self._current_top.offer(key, after)
+        previous = self._previous.estimate(key)
+        count = int(current + previous * self._previous_weight(now, window_index))
+        return count, self.window_seconds - elapsed
+
+    def top_offenders(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Heaviest clients in the sliding window, as (key, estimated count)"""
+        now = self._clock()
+        window_index = self._roll(now)
+        weight = self._previous_weight(now, window_index)
+        keys = self._current_top.counts.keys() | self._previous_top.counts.keys()
+        estimates = [
+            (
+                key,
+                int(
+                    self._current.estimate(key) + self._previous.estimate(key) * weight
+                ),
+            )
+            for key in keys
+        ]
+        estimates.sort(key=lambda item: item[1], reverse=True)
+        return estimates[:limit]
@@ -1,8 +1,34 @@
-from typing import Dict, Tuple
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Tuple
 from time import time
 from collections import defaultdict
 
 
+class RateLimitStore(ABC):
+    """Backend interface used by RateLimitingMiddleware"""
+
+    @abstractmethod
+    async def check(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        """Charge cost units to key; return (units used before, seconds until reset)"""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources"""
+        pass
+
+
+class LocalRateLimitStore(RateLimitStore):
+    """Store answering synchronously from memory on this host"""
+
+    @abstractmethod
+    def increment(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        pass
+
+    async def check(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        return self.increment(key, cost)
+
+
 class InMemoryStore:
     def __init__(self):
         self._requests: Dict[str, list] = defaultdict(list)
@@ -30,3 +56,113 @@ class InMemoryStore:
         time_until_reset = max(0, window - (current_time - oldest_timestamp))
 
         return len(self._requests[key]), time_until_reset
+
+
+class SlidingWindowStore(LocalRateLimitStore):
+    """Sliding-window counter with constant memory per client.
+
+    Only two integers per client are kept: the count for the current fixed
+    window and the count for the previous one. The effective count is the
+    current count plus the previous count weighted by how much of the
+    previous window still overlaps the sliding window. Keys are stored as
+    their hash, and clients idle for two windows are dropped wholesale when
+    the window rolls over, so no per-request list is ever built or scanned.
+    """
+
+    def __init__(self, window_seconds: int, clock: Callable[[], float] = time):
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._window_index = int(clock() // window_seconds)
+        self._current: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._current.keys() | self._previous.keys())
+
+    def _roll(self, now: float) -> int:
+        window_index = int(now // self.window_seconds)
+        if window_index != self._window_index:
+            if window_index == self._window_index + 1:
+                self._previous = self._current
+            else:
+                self._previous = {}
+            self._current = {}
+            self._window_index = window_index
+        return window_index
+
+    def increment(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        """Record a request and return (count before it, seconds until reset)"""
+        now = self._clock()
+        window_index = self._roll(now)
+        key_hash = hash(key)
+
+        elapsed = now - window_index * self.window_seconds
+        previous_weight = 1.0 - elapsed / self.window_seconds
+        current = self._current.get(key_hash, 0)
+        count = int(current + self._previous.get(key_hash, 0) * previous_weight)
+
+        self._current[key_hash] = current + cost
+        return count, self.window_seconds - elapsed
+
+
+class TokenBucketStore(LocalRateLimitStore):
+    """Per-client token buckets refilled continuously.
+
+    Each bucket holds up to ``capacity`` tokens and regains
+    ``capacity / window_seconds`` tokens per second, so a client may burst up
+    to its full budget and is then held to the sustained rate. A request is
+    only debited when its whole cost fits; a rejected request costs nothing.
+    Full buckets carry no information and are dropped periodically.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        window_seconds: int,
+        clock: Callable[[], float] = time,
+    ):
+        self.capacity = capacity
+        self.refill_rate = capacity / window_seconds
+        self._clock = clock
+        self._buckets: Dict[int, Tuple[float, float]] = {}
+        self._next_prune = clock() + window_seconds
+        self._window_seconds = window_seconds
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _prune(self, now: float) -> None:
+        self._buckets = {
+            key_hash: (tokens, updated)
+            for key_hash, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * self.refill_rate < self.capacity
+        }
+        self._next_prune = now + self._window_seconds
+
+    def increment(self, key: str, cost: int = 1) -> Tuple[int, float]:
+        """Take cost tokens and return (tokens in use before, seconds to wait).
+
+        The wait is the time until the bucket is full again, or, when the
+        request does not fit, the time until it would.
+        """
+        now = self._clock()
+        if now >= self._next_prune:
+            self._prune(now)
+        key_hash = hash(key)
+
+        bucket = self._buckets.get(key_hash)
+        if bucket is None:
+            tokens = float(self.capacity)
+        else:
+            tokens = min(
+                self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate
+            )
+
+        used = self.capacity - tokens
+        if tokens < cost:
+            self._buckets[key_hash] = (tokens, now)
+            return math.ceil(used), (cost - tokens) / self.refill_rate
+
+        tokens -= cost
+        self._buckets[key_hash] = (tokens, now)
+        return int(used), (self.capacity - tokens) / self.refill_rate
@@ -0,0 +1,118 @@
+import uuid
+from time import perf_counter
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.middleware.logging.context import (
+    RequestContext,
+    reset_request_context,
+    set_request_context,
+)
+from src.infrastructure.observability.allocations import allocation_tracker
+from src.infrastructure.observability.tracing import (
+    Span,
+    TraceExporter,
+    format_server_timing,
+)
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware owning the per-request context.
+
+    Binds request/correlation ids to a context variable for the whole
+    request, reports the recorded spans in a ``Server-Timing`` header and
+    optionally hands the finished trace to a ``TraceExporter``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        request_id_header: str = "X-Request-ID",
+        correlation_id_header: str = "X-Correlation-ID",
+        server_timing: bool = True,
+        exporter: Optional[TraceExporter] = None,
+        exclude_paths: set[str] = None,
+    ):
+        self.app = app
+        self.request_id_header = request_id_header
+        self.correlation_id_header = correlation_id_header
+        self.server_timing = server_timing
+        self.exporter = exporter
+        self.exclude_paths = exclude_paths or set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        context = RequestContext(
+            request_id=headers.get(self.request_id_header) or str(uuid.uuid4()),
+            correlation_id=headers.get(self.correlation_id_header),
+        )
+        if allocation_tracker.active and allocation_tracker.should_sample(
+            scope["path"]
+        ):
+            context.allocation_marks = []
+            allocation_tracker.requests_traced += 1
+            allocation_tracker.begin(context.allocation_marks)
+        token = set_request_context(context)
+        start = perf_counter()
+        send_span: Optional[Span] = None
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal send_span, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                app_span = Span(name="app", start=start)
+                app_span.finish()
+                context.spans.append(app_span)
+
+                response_headers = MutableHeaders(scope=message)
+                response_headers.append(self.request_id_header, context.request_id)
+                if self.server_timing:
+                    response_headers.append(
+                        "Server-Timing", format_server_timing(context.spans)
+                    )
+                send_span = Span(name="send", start=perf_counter())
+
+            await send(message)
+
+            if (
+                send_span is not None
+                and message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+            ):
+                send_span.finish()
+                context.spans.append(send_span)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_context(token)
+            if context.allocation_marks is not None:
+                allocation_tracker.end(context.allocation_marks, "request")
+            if self.exporter is not None:
+                self.exporter.export(
+                    {
+                        "request_id": context.request_id,
+                        "correlation_id": context.correlation_id,
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round((perf_counter() - start) * 1000, 3),
+                        "spans": [
+                            {
+                                "name": item.name,
+                                "offset_ms": round((item.start - start) * 1000, 3),
+                                "duration_ms": round(item.duration_ms, 3),
+                                "attributes": item.attributes,
+                            }
+                            for item in context.spans
+                        ],
+                    }
+                )
@@ -0,0 +1,155 @@
+import linecache
+import random
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class PhaseAllocations:
+    calls: int = 0
+    net_bytes: int = 0
+    peak_bytes_total: int = 0
+    peak_bytes_max: int = 0
+
+    def add(self, net: int, peak: int) -> None:
+        self.calls += 1
+        self.net_bytes += net
+        self.peak_bytes_total += peak
+        self.peak_bytes_max = max(self.peak_bytes_max, peak)
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    location: List[str]
+    size: int
+    count: int
+    size_diff: int = 0
+    count_diff: int = 0
+
+
+class AllocationTracker:
+    """Attributes tracemalloc allocations to the spans of sampled requests.
+
+    Disabled by default: tracemalloc is not running and the only cost on the
+    request path is a check of ``active``. Once enabled, a ``sample_rate``
+    share of requests records, for every span, the bytes still allocated when
+    it finished (net) and the highest allocation reached while it ran
+    (peak). tracemalloc counts the whole process, so requests that overlap
+    in time share their allocations; use a low sample rate or low
+    concurrency for precise numbers.
+    """
+
+    def __init__(self, exclude_prefixes: Tuple[str, ...] = ("/admin",)):
+        self.exclude_prefixes = exclude_prefixes
+        self.active = False
+        self.sample_rate = 0.0
+        self.frames = 1
+        self.requests_traced = 0
+        self.phases: Dict[str, PhaseAllocations] = {}
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    def enable(self, sample_rate: float = 0.1, frames: int = 10) -> None:
+        with self._lock:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            tracemalloc.start(frames)
+            self.sample_rate = sample_rate
+            self.frames = frames
+            self.requests_traced = 0
+            self.phases = {}
+            self._baseline = self._snapshot()
+            self.active = True
+        logger.info(
+            f"Allocation tracing enabled for {sample_rate:.0%} of requests "
+            f"({frames} frames)"
+        )
+
+    def disable(self) -> None:
+        with self._lock:
+            self.active = False
+            self._baseline = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+        logger.info("Allocation tracing disabled")
+
+    def should_sample(self, path: str) -> bool:
+        return random.random() < self.sample_rate and not path.startswith(
+            self.exclude_prefixes
+        )
+
+    def begin(self, marks: List[List[int]]) -> None:
+        """Start measuring a span nested in the spans already on ``marks``"""
+        current, peak = tracemalloc.get_traced_memory()
+        if marks:
+            # Resetting the peak below would lose the enclosing span's peak.
+            marks[-1][1] = max(marks[-1][1], peak)
+        tracemalloc.reset_peak()
+        marks.append([current, 0])
+
+    def end(self, marks: List[List[int]], name: str) -> Tuple[int, int]:
+        """Finish the innermost span; returns its (net, peak) bytes"""
+        current, peak = tracemalloc.get_traced_memory()
+        start, child_peak = marks.pop()
+        if not self.active:
+            # Disabled while the request was running; nothing meaningful left.
+            return 0, 0
+        peak = max(peak, child_peak)
+        if marks:
+            marks[-1][1] = max(marks[-1][1], peak)
+        net, peak = current - start, max(peak - start, 0)
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseAllocations()
+        phase.add(net, peak)
+        return net, peak
+
+    def traced_memory(self) -> Tuple[int, int]:
+        return tracemalloc.get_traced_memory() if self.active else (0, 0)
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                # Formatting tracebacks fills the line cache; not ours to report.
+                tracemalloc.Filter(False, linecache.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+
+    def top_sites(self, limit: int, group_by: str = "lineno") -> List[AllocationSite]:
+        """Largest live allocations, grouped by line, file or traceback"""
+        stats = self._snapshot().statistics(group_by)
+        return [
+            AllocationSite(
+                location=stat.traceback.format(), size=stat.size, count=stat.count
+            )
+            for stat in stats[:limit]
+        ]
+
+    def diff(
+        self, limit: int, group_by: str = "lineno", rebase: bool = False
+    ) -> List[AllocationSite]:
+        """Allocation sites that grew most since enabling (or the last rebase)"""
+        snapshot = self._snapshot()
+        stats = snapshot.compare_to(self._baseline, group_by)
+        if rebase:
+            self._baseline = snapshot
+        return [
+            AllocationSite(
+                location=stat.traceback.format(),
+                size=stat.size,
+                count=stat.count,
+                size_diff=stat.size_diff,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats[:limit]
+        ]
+
+
+allocation_tracker = AllocationTracker()
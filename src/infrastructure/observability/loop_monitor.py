@@ -0,0 +1,148 @@
+import asyncio
+import sys
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import Deque, Dict, List, Optional
+
+from loguru import logger
+
+from src.infrastructure.observability.metrics import (
+    EVENT_LOOP_BLOCKED,
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_LAG_QUANTILE,
+)
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+@dataclass(frozen=True)
+class BlockedCallback:
+    detected_at: float
+    blocked_ms: float
+    stack: List[str]
+
+
+class EventLoopMonitor:
+    """Measures event loop lag and catches callbacks that block the loop.
+
+    A heartbeat task sleeps for ``interval`` seconds and records how late it
+    wakes up. A watchdog thread checks the heartbeat; once the loop has gone
+    ``block_threshold`` seconds past a due heartbeat it captures the stack
+    the loop thread is executing at that moment, which is the offending
+    callback. Each blocking episode is reported once.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.1,
+        block_threshold: float = 0.1,
+        ready_max_lag: Optional[float] = None,
+        history: int = 600,
+        ready_window: int = 10,
+        max_blocked: int = 20,
+    ):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.ready_max_lag = ready_max_lag
+        self.ready_window = ready_window
+        self._lags: Deque[float] = deque(maxlen=history)
+        self.blocked: Deque[BlockedCallback] = deque(maxlen=max_blocked)
+        self.blocked_total = 0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._next_beat_due = 0.0
+        self._reported_beat = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._next_beat_due = monotonic() + self.interval
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._watchdog.join(self.interval + self.block_threshold)
+        self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        beats = 0
+        while True:
+            due = loop.time() + self.interval
+            self._next_beat_due = monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - due, 0.0)
+            self._lags.append(lag)
+            EVENT_LOOP_LAG.observe(lag)
+            beats += 1
+            if beats % self.ready_window == 0:
+                for quantile, value in self.percentiles().items():
+                    EVENT_LOOP_LAG_QUANTILE.labels(quantile).set(value)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.block_threshold / 2):
+            due = self._next_beat_due
+            blocked_for = monotonic() - due
+            if blocked_for < self.block_threshold or due == self._reported_beat:
+                continue
+            self._reported_beat = due
+            self._report_blocked(blocked_for)
+
+    def _report_blocked(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        self.blocked.append(
+            BlockedCallback(
+                detected_at=time(), blocked_ms=blocked_for * 1000, stack=stack
+            )
+        )
+        self.blocked_total += 1
+        EVENT_LOOP_BLOCKED.inc()
+        logger.warning(
+            f"Event loop blocked for at least {blocked_for * 1000:.0f} ms in:\n"
+            + "".join(stack[-8:])
+        )
+
+    def percentiles(self) -> Dict[str, float]:
+        """Recent lag percentiles in seconds, keyed by quantile and "max" """
+        lags = sorted(self._lags) or [0.0]
+        result = {
+            str(quantile): lags[min(int(quantile * len(lags)), len(lags) - 1)]
+            for quantile in QUANTILES
+        }
+        result["max"] = lags[-1]
+        return result
+
+    def is_ready(self) -> bool:
+        """False while recent lag exceeds ``ready_max_lag`` (when set)"""
+        if self.ready_max_lag is None or not self._lags:
+            return True
+        recent = list(self._lags)[-self.ready_window :]
+        return max(recent) <= self.ready_max_lag
+
+
+loop_monitor = EventLoopMonitor()
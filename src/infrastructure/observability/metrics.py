@@ -0,0 +1,520 @@
+import fcntl
+import json
+import math
+import os
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from time import monotonic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_SIZE_BUCKETS = (
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+DEFAULT_LAG_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+MERGED_SNAPSHOT = "merged.json"
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(
+                    f"Metric {self.name} expects labels {self.label_names}, got {key}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labels": list(self.label_names),
+            "samples": [
+                [list(key), child.value()]
+                for key, child in list(self._children.items())
+            ],
+        }
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self._value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def value(self) -> float:
+        return self._value
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+
+class Gauge(Metric):
+    """Gauge; ``multiprocess_mode`` picks how workers are combined (sum, max, pid)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        multiprocess_mode: str = "sum",
+    ):
+        super().__init__(name, documentation, labels)
+        self.multiprocess_mode = multiprocess_mode
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = super().snapshot()
+        data["multiprocess_mode"] = self.multiprocess_mode
+        return data
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_counts", "_sum", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def value(self) -> List[float]:
+        return [*self._counts, self._sum]
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets)
+        return data
+
+
+class MetricsRegistry:
+    """In-process metrics with optional aggregation across worker processes.
+
+    When ``multiprocess_dir`` is set, each worker periodically writes its own
+    snapshot to ``<dir>/<pid>.json`` and a scrape on any worker merges every
+    file found there: counters and histograms are summed, gauges follow their
+    ``multiprocess_mode`` and are dropped for workers that no longer exist.
+
+    The supervising process clears the directory before it forks the first
+    worker and calls ``mark_process_dead`` for every worker it reaps, which
+    folds the worker's counters and histograms into ``merged.json``. Since a
+    pid cannot be reused before it is reaped, a new worker that gets the pid
+    of a dead one never finds that worker's file still in place.
+    """
+
+    def __init__(
+        self,
+        multiprocess_dir: Optional[str] = None,
+        flush_interval: float = 5.0,
+    ):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self.flush_interval = flush_interval
+        self._next_flush = 0.0
+        self.multiprocess_dir: Optional[Path] = None
+        if multiprocess_dir:
+            self.configure_multiprocess(multiprocess_dir)
+
+    def configure_multiprocess(self, multiprocess_dir: str) -> None:
+        self.multiprocess_dir = Path(multiprocess_dir)
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _locked_dir(self, operation: int) -> Iterator[None]:
+        # Folding a dead worker rewrites two files; scrapes must not see the
+        # worker's counters in both of them, or in neither.
+        with open(self.multiprocess_dir / ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def clear_multiprocess_dir(self) -> None:
+        """Remove the snapshots of earlier runs; call before forking workers"""
+        if self.multiprocess_dir is None:
+            return
+        with self._locked_dir(fcntl.LOCK_EX):
+            for path in self.multiprocess_dir.iterdir():
+                if path.suffix in (".json", ".tmp"):
+                    path.unlink(missing_ok=True)
+
+    def mark_process_dead(self, pid: int) -> None:
+        """Fold the snapshot of reaped worker ``pid`` into the merged file.
+
+        Its counters and histograms keep counting towards the totals, its
+        gauges are dropped, and its own file is removed.
+        """
+        if self.multiprocess_dir is None:
+            return
+        path = self.multiprocess_dir / f"{pid}.json"
+        merged_path = self.multiprocess_dir / MERGED_SNAPSHOT
+        with self._locked_dir(fcntl.LOCK_EX):
+            try:
+                snapshot = json.loads(path.read_text())
+            except FileNotFoundError:
+                return
+            except (ValueError, OSError) as e:
+                logger.warning(f"Dropping unreadable snapshot of {pid}: {str(e)}")
+                path.unlink(missing_ok=True)
+                return
+            merged: Dict[str, Dict[str, Any]] = {}
+            try:
+                _merge_snapshot(merged, json.loads(merged_path.read_text()), 0, False)
+            except FileNotFoundError:
+                pass
+            _merge_snapshot(merged, snapshot, pid, False)
+            tmp_path = merged_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(_as_snapshot(merged)))
+            os.replace(tmp_path, merged_path)
+            path.unlink()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        if not metric.label_names:
+            metric.labels()
+        return metric
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels=(), **kwargs) -> Gauge:
+        return self._register(Gauge(name, documentation, labels, **kwargs))
+
+    def histogram(
+        self, name: str, documentation: str, labels=(), **kwargs
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, **kwargs))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def maybe_flush(self) -> None:
+        """Write this worker's snapshot if the flush interval has elapsed"""
+        if self.multiprocess_dir is None:
+            return
+        now = monotonic()
+        if now >= self._next_flush:
+            self._next_flush = now + self.flush_interval
+            self.flush()
+
+    def flush(self) -> None:
+        if self.multiprocess_dir is None:
+            return
+        path = self.multiprocess_dir / f"{os.getpid()}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to flush metrics snapshot: {str(e)}")
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        if self.multiprocess_dir is None:
+            return self.snapshot()
+
+        self.flush()
+        self._next_flush = monotonic() + self.flush_interval
+        merged: Dict[str, Dict[str, Any]] = {}
+        with self._locked_dir(fcntl.LOCK_SH):
+            for path in sorted(self.multiprocess_dir.glob("*.json")):
+                try:
+                    snapshot = json.loads(path.read_text())
+                    if path.name == MERGED_SNAPSHOT:
+                        pid, alive = 0, False
+                    else:
+                        pid = int(path.stem)
+                        alive = _is_alive(pid)
+                except (ValueError, OSError):
+                    continue
+                _merge_snapshot(merged, snapshot, pid, alive)
+        return _as_snapshot(merged)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+        for name, data in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {_escape_help(data['help'])}")
+            lines.append(f"# TYPE {name} {data['type']}")
+            label_names = data["labels"]
+            for label_values, value in data["samples"]:
+                labels = list(zip(label_names, label_values))
+                if data["type"] == "histogram":
+                    lines.extend(
+                        _render_histogram(name, labels, data["buckets"], value)
+                    )
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _merge_snapshot(
+    merged: Dict[str, Dict[str, Any]],
+    snapshot: Dict[str, Dict[str, Any]],
+    pid: int,
+    alive: bool,
+) -> None:
+    for name, data in snapshot.items():
+        metric_type = data["type"]
+        mode = data.get("multiprocess_mode", "sum")
+        if metric_type == "gauge" and not alive:
+            continue
+
+        target = merged.get(name)
+        if target is None:
+            target = {key: value for key, value in data.items() if key != "samples"}
+            target["samples"] = {}
+            if metric_type == "gauge" and mode == "pid":
+                target["labels"] = [*data["labels"], "pid"]
+            merged[name] = target
+
+        samples = target["samples"]
+        for label_values, value in data["samples"]:
+            key = tuple(label_values)
+            if metric_type == "gauge" and mode == "pid":
+                samples[(*key, str(pid))] = value
+            elif key not in samples:
+                samples[key] = value
+            elif metric_type == "histogram":
+                samples[key] = [a + b for a, b in zip(samples[key], value)]
+            elif metric_type == "gauge" and mode == "max":
+                samples[key] = max(samples[key], value)
+            else:
+                samples[key] = samples[key] + value
+
+
+def _as_snapshot(merged: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {
+        name: {
+            **data,
+            "samples": [[list(k), v] for k, v in data["samples"].items()],
+        }
+        for name, data in merged.items()
+    }
+
+
+def _render_histogram(
+    name: str, labels: List[Tuple[str, str]], buckets: List[float], value: List[float]
+) -> List[str]:
+    lines = []
+    cumulative = 0
+    counts, total = value[:-1], value[-1]
+    for bound, count in zip([*buckets, math.inf], counts):
+        cumulative += count
+        bucket_labels = _format_labels([*labels, ("le", _format(bound))])
+        lines.append(f"{name}_bucket{bucket_labels} {_format(cumulative)}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format(total)}")
+    lines.append(f"{name}_count{_format_labels(labels)} {_format(cumulative)}")
+    return lines
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route and status",
+    labels=("method", "route", "status"),
+)
+GENERATION_DURATION = registry.histogram(
+    "generation_duration_seconds",
+    "Project generation time by template type and phase",
+    labels=("template_type", "phase"),
+)
+GENERATION_ARCHIVE_SIZE = registry.histogram(
+    "generation_archive_size_bytes",
+    "Size of generated project archives",
+    labels=("template_type",),
+    buckets=DEFAULT_SIZE_BUCKETS,
+)
+GENERATION_COMMANDS = registry.counter(
+    "generation_commands_total",
+    "Generation commands run, by command and result (success or failure)",
+    labels=("command", "result"),
+)
+GENERATION_ROLLBACKS = registry.counter(
+    "generation_rollbacks_total",
+    "Generation commands whose changes were rolled back",
+    labels=("command",),
+)
+GENERATIONS_IN_PROGRESS = registry.gauge(
+    "generation_queue_depth",
+    "Project generations currently waiting or running",
+)
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total",
+    "Requests rejected by the rate limiter",
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss)",
+    labels=("cache", "result"),
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between when the loop monitor heartbeat was due and when it ran",
+    buckets=DEFAULT_LAG_BUCKETS,
+)
+EVENT_LOOP_LAG_QUANTILE = registry.gauge(
+    "event_loop_lag_quantile_seconds",
+    "Recent event loop lag percentiles of each worker",
+    labels=("quantile",),
+    multiprocess_mode="pid",
+)
+EVENT_LOOP_BLOCKED = registry.counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked for longer than the slow-callback threshold",
+)
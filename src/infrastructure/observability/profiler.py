@@ -0,0 +1,174 @@
+import os
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from time import monotonic, sleep
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+# Leaf frames of a thread that is waiting rather than running Python code:
+# selector waits, loops driven from C (uvloop) and idle pool workers.
+IDLE_FUNCTIONS = {
+    "select",
+    "poll",
+    "control",
+    "_read_from_self",
+    "run_forever",
+    "run_until_complete",
+}
+IDLE_FILES = (os.path.join("asyncio", "runners.py"), "threading.py")
+
+
+@dataclass(frozen=True)
+class FunctionStat:
+    function: str
+    self_samples: int
+    total_samples: int
+
+
+@dataclass(frozen=True)
+class Profile:
+    duration_s: float
+    interval_s: float
+    samples: int
+    idle_samples: int
+    stacks: Dict[Tuple[str, ...], int]
+
+    def collapsed(self) -> str:
+        """One ``frame;frame;... count`` line per stack, as flamegraph tools read"""
+        return "\n".join(
+            f"{';'.join(stack)} {count}" for stack, count in sorted(self.stacks.items())
+        )
+
+    def top_functions(self, limit: int) -> List[FunctionStat]:
+        """Functions by self samples, with inclusive (total) samples"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack[-1]] += count
+            for function in set(stack):
+                total_counts[function] += count
+        return [
+            FunctionStat(
+                function=function,
+                self_samples=self_counts[function],
+                total_samples=total_counts[function],
+            )
+            for function, _ in self_counts.most_common(limit)
+        ]
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling Python stacks from a background thread.
+
+    Every ``interval`` seconds the stack the event loop thread (or, with
+    ``all_threads``, every other thread) is executing is recorded; nothing
+    is hooked into function calls, so the overhead is that of walking one
+    stack per sample. Samples of a thread that is only waiting (an idle
+    event loop, a pool worker without work) are counted separately and left
+    out of the stacks.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = False
+        self._path_prefixes = sorted(
+            {
+                os.getcwd() + os.sep,
+                sysconfig.get_paths()["purelib"] + os.sep,
+                sysconfig.get_paths()["stdlib"] + os.sep,
+            },
+            key=len,
+            reverse=True,
+        )
+        self._labels: Dict[object, str] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            for prefix in self._path_prefixes:
+                if filename.startswith(prefix):
+                    filename = filename[len(prefix) :]
+                    break
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _stack(self, frame: Optional[FrameType]) -> Tuple[str, ...]:
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame))
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+    def profile(
+        self,
+        duration: float,
+        *,
+        interval: float = 0.005,
+        thread_id: Optional[int] = None,
+        all_threads: bool = False,
+    ) -> Profile:
+        """Sample for ``duration`` seconds, blocking the calling thread.
+
+        Samples ``thread_id`` (the caller when not given) unless
+        ``all_threads`` is set. Run it off the thread being profiled.
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("A profile is already being taken")
+            self._running = True
+        try:
+            return self._sample(duration, interval, thread_id, all_threads)
+        finally:
+            self._running = False
+
+    def _sample(
+        self,
+        duration: float,
+        interval: float,
+        thread_id: Optional[int],
+        all_threads: bool,
+    ) -> Profile:
+        own_id = threading.get_ident()
+        target_id = thread_id if thread_id is not None else own_id
+        stacks: Counter = Counter()
+        samples = idle = 0
+        start = monotonic()
+        deadline = start + duration
+        while monotonic() < deadline:
+            sleep(interval)
+            frames = sys._current_frames()
+            if all_threads:
+                selected = [frame for ident, frame in frames.items() if ident != own_id]
+            else:
+                selected = [frames[target_id]] if target_id in frames else []
+            for frame in selected:
+                samples += 1
+                code = frame.f_code
+                if code.co_name in IDLE_FUNCTIONS or code.co_filename.endswith(
+                    IDLE_FILES
+                ):
+                    idle += 1
+                    continue
+                stacks[self._stack(frame)] += 1
+            del frames, selected
+        return Profile(
+            duration_s=monotonic() - start,
+            interval_s=interval,
+            samples=samples,
+            idle_samples=idle,
+            stacks=dict(stacks),
+        )
+
+
+sampling_profiler = SamplingProfiler()
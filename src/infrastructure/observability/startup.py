@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator
+
+from loguru import logger
+
+
+class StartupProfiler:
+    """Times the named phases of application startup"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (
+                self.phases.get(name, 0.0) + (perf_counter() - start) * 1000
+            )
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.phases.values())
+
+    def log_report(self) -> None:
+        phases = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.phases.items())
+        logger.info(f"Startup took {self.total_ms:.1f} ms ({phases})")
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,110 @@
+import platform
+import sys
+import threading
+from dataclasses import dataclass
+from time import time
+from typing import Optional
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class PlatformInfo:
+    python_version: str
+    python_implementation: str
+    python_compiler: str
+    platform: str
+    architecture: str
+    processor: str
+    cpu_count: int
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    taken_at: float
+    cpu_percent: float
+    memory_total: int
+    memory_available: int
+    memory_used_percent: float
+
+
+class SystemMetricsSampler:
+    """Refreshes a CPU/memory snapshot from a background thread.
+
+    Readers only ever fetch the latest snapshot, so nothing on the request
+    path sleeps or calls into psutil. CPU usage is measured over the interval
+    between two samples rather than by blocking for a fixed period.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._platform: Optional[PlatformInfo] = None
+        self._snapshot: Optional[SystemSnapshot] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def platform(self) -> PlatformInfo:
+        if self._platform is None:
+            import psutil
+
+            self._platform = PlatformInfo(
+                python_version=sys.version,
+                python_implementation=platform.python_implementation(),
+                python_compiler=platform.python_compiler(),
+                platform=platform.platform(),
+                architecture=platform.machine(),
+                processor=platform.processor() or "Unknown",
+                cpu_count=psutil.cpu_count(),
+            )
+        return self._platform
+
+    @property
+    def snapshot(self) -> SystemSnapshot:
+        """Latest snapshot; taken on the spot while the sampler is not running
+        and the last one is missing or older than the interval"""
+        if self._snapshot is None or (
+            self._thread is None and time() - self._snapshot.taken_at >= self.interval
+        ):
+            self.sample()
+        return self._snapshot
+
+    def sample(self) -> SystemSnapshot:
+        import psutil
+
+        memory = psutil.virtual_memory()
+        self._snapshot = SystemSnapshot(
+            taken_at=time(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            memory_total=memory.total,
+            memory_available=memory.available,
+            memory_used_percent=memory.percent,
+        )
+        return self._snapshot
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(
+            target=self._run, name="system-metrics-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(self.interval)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"System metrics sample failed: {str(e)}")
+
+
+system_sampler = SystemMetricsSampler()
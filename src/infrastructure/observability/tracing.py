@@ -0,0 +1,127 @@
+import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import SimpleQueue
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from src.infrastructure.middleware.logging.context import get_request_context
+from src.infrastructure.observability.allocations import allocation_tracker
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration_ms: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def finish(self) -> None:
+        self.duration_ms = (perf_counter() - self.start) * 1000
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a block and attach it to the current request, if there is one"""
+    context = get_request_context()
+    if context is None:
+        yield None
+        return
+
+    marks = context.allocation_marks
+    if marks is not None:
+        allocation_tracker.begin(marks)
+    current = Span(name=name, start=perf_counter(), attributes=attributes)
+    try:
+        yield current
+    finally:
+        current.finish()
+        if marks is not None:
+            net, peak = allocation_tracker.end(marks, name)
+            current.attributes["alloc_net_bytes"] = net
+            current.attributes["alloc_peak_bytes"] = peak
+        context.spans.append(current)
+
+
+def record_span(name: str, duration_s: float, **attributes: Any) -> None:
+    """Attach an already measured block to the current request, if there is one"""
+    context = get_request_context()
+    if context is None:
+        return
+    context.spans.append(
+        Span(
+            name=name,
+            start=perf_counter() - duration_s,
+            duration_ms=duration_s * 1000,
+            attributes=attributes,
+        )
+    )
+
+
+def format_server_timing(spans: Iterable[Span]) -> str:
+    """Build a Server-Timing header value, summing spans that share a name"""
+    totals: Dict[str, List[float]] = {}
+    for item in spans:
+        total = totals.setdefault(item.name, [0.0, 0])
+        total[0] += item.duration_ms
+        total[1] += 1
+
+    metrics = []
+    for name, (duration_ms, count) in totals.items():
+        metric = f"{name};dur={duration_ms:.2f}"
+        if count > 1:
+            metric += f';desc="x{count}"'
+        metrics.append(metric)
+    return ", ".join(metrics)
+
+
+class TraceExporter:
+    """Appends finished request traces as JSON lines from a background thread"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def export(self, record: Dict[str, Any]) -> None:
+        if self._failed:
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put(record)
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="trace-exporter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as trace_file:
+                while True:
+                    record = self._queue.get()
+                    if record is None:
+                        break
+                    trace_file.write(json.dumps(record, separators=(",", ":")))
+                    trace_file.write("\n")
+                    if self._queue.empty():
+                        trace_file.flush()
+        except Exception as e:
+            self._failed = True
+            logger.error(f"Trace exporter stopped: {str(e)}")
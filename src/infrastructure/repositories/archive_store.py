@@ -0,0 +1,179 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from time import time
+from typing import Callable, List, Optional, Tuple
+
+from src.infrastructure.observability.metrics import CACHE_REQUESTS
+
+_archive_hits = CACHE_REQUESTS.labels("archive", "hit")
+_archive_misses = CACHE_REQUESTS.labels("archive", "miss")
+
+ARCHIVE_SUFFIX = ".archive"
+ALIAS_SUFFIX = ".alias"
+TMP_SUFFIX = ".tmp"
+_OWN_SUFFIXES = (ARCHIVE_SUFFIX, ALIAS_SUFFIX, TMP_SUFFIX)
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+def default_archive_dir() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "fastapi-initializr-archives")
+
+
+@dataclass(frozen=True)
+class StoredArchive:
+    digest: str
+    content: bytes
+    filename: str
+    expires_at: float
+    # False when the archive was too large to keep: it can be sent once but
+    # not fetched again from /generator/archives/{digest}.
+    kept: bool = True
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+
+class ArchiveStore:
+    """Generated archives shared by every worker on the host, by content hash.
+
+    Each archive is a ``<sha256>.archive`` file (its download filename on the
+    first line, then the bytes) in ``directory``, so a resumed or split
+    download can reach any worker. Files are written to a temporary name and
+    renamed into place, and the file's mtime is when it was last stored: an
+    archive lives for ``ttl_seconds`` after that. An archive can also be
+    found under an alias (the GET endpoint's ETag), kept as a small file
+    holding the digest. Every ``put`` sweeps expired files and, past
+    ``max_bytes``, drops the least recently stored archives first.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_bytes: int,
+        directory: Optional[str] = None,
+        clock: Callable[[], float] = time,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.directory = Path(directory or default_archive_dir())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+
+    def __len__(self) -> int:
+        return len(self._archives(self.clock()))
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._archives(self.clock()))
+
+    def put(
+        self, content: bytes, filename: str, alias: Optional[str] = None
+    ) -> StoredArchive:
+        digest = hashlib.sha256(content).hexdigest()
+        now = self.clock()
+        data = filename.encode() + b"\n" + content
+        kept = len(data) <= self.max_bytes
+        if kept:
+            self._write(self._archive_path(digest), data, now)
+            if alias is not None:
+                self._write(self._alias_path(alias), digest.encode(), now)
+        self._sweep(now, keep=digest)
+        return StoredArchive(
+            digest=digest,
+            content=content,
+            filename=filename,
+            expires_at=now + self.ttl_seconds,
+            kept=kept,
+        )
+
+    def get(self, digest: str) -> Optional[StoredArchive]:
+        archive = self._read(digest) if _DIGEST.fullmatch(digest) else None
+        (_archive_hits if archive is not None else _archive_misses).inc()
+        return archive
+
+    def get_by_alias(self, alias: str) -> Optional[StoredArchive]:
+        path = self._alias_path(alias)
+        try:
+            with path.open("rb") as f:
+                stored_at = os.fstat(f.fileno()).st_mtime
+                digest = f.read().decode()
+        except FileNotFoundError:
+            _archive_misses.inc()
+            return None
+        if stored_at + self.ttl_seconds <= self.clock():
+            path.unlink(missing_ok=True)
+            _archive_misses.inc()
+            return None
+        return self.get(digest)
+
+    def _archive_path(self, digest: str) -> Path:
+        return self.directory / f"{digest}{ARCHIVE_SUFFIX}"
+
+    def _alias_path(self, alias: str) -> Path:
+        name = hashlib.sha256(alias.encode()).hexdigest()
+        return self.directory / f"{name}{ALIAS_SUFFIX}"
+
+    def _write(self, path: Path, data: bytes, now: float) -> None:
+        tmp = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}{TMP_SUFFIX}"
+        )
+        tmp.write_bytes(data)
+        os.utime(tmp, (now, now))
+        os.replace(tmp, path)
+
+    def _read(self, digest: str) -> Optional[StoredArchive]:
+        path = self._archive_path(digest)
+        try:
+            with path.open("rb") as f:
+                stored_at = os.fstat(f.fileno()).st_mtime
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        expires_at = stored_at + self.ttl_seconds
+        if expires_at <= self.clock():
+            path.unlink(missing_ok=True)
+            return None
+        filename, _, content = data.partition(b"\n")
+        return StoredArchive(
+            digest=digest,
+            content=content,
+            filename=filename.decode(),
+            expires_at=expires_at,
+        )
+
+    def _archives(self, now: float) -> List[Tuple[float, int, Path]]:
+        """``(stored at, size, path)`` of every live archive; drops the rest"""
+        archives = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_OWN_SUFFIXES):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Swept by another worker meanwhile.
+                if stat.st_mtime + self.ttl_seconds <= now:
+                    Path(entry.path).unlink(missing_ok=True)
+                elif entry.name.endswith(ARCHIVE_SUFFIX):
+                    archives.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return archives
+
+    def _sweep(self, now: float, keep: str) -> None:
+        # Expired archives, aliases and leftover temporary files all go by
+        # mtime; an alias outliving its archive simply misses.
+        archives = sorted(self._archives(now))
+        size = sum(size for _, size, _ in archives)
+        current = self._archive_path(keep)
+        for _, archive_size, path in archives:
+            if size <= self.max_bytes:
+                break
+            if path != current:
+                path.unlink(missing_ok=True)
+                size -= archive_size
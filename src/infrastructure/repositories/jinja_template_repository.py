@@ -1,8 +1,14 @@
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict
-from jinja2 import Environment, FileSystemLoader, Template
+from typing import Any, Dict, FrozenSet, Optional
+from jinja2 import Environment, FileSystemLoader, Template, meta
 from src.domain.repositories.template_repository import TemplateRepository
 from src.infrastructure.enumerators.template_type import TemplateType
+from src.infrastructure.observability.metrics import CACHE_REQUESTS
+from src.infrastructure.observability.tracing import span
+
+_template_hits = CACHE_REQUESTS.labels("template", "hit")
+_template_misses = CACHE_REQUESTS.labels("template", "miss")
 
 
 class JinjaTemplateRepository(TemplateRepository):
@@ -13,6 +19,9 @@ class JinjaTemplateRepository(TemplateRepository):
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        self._templates: Dict[str, Template] = {}
+        self._variables: Dict[str, FrozenSet[str]] = {}
+        self._tree_digest: Optional[str] = None
 
     def get_template_files(self, template_type: str) -> Dict[str, str]:
         template_dir = template_type.lower()
@@ -27,4 +36,48 @@ class JinjaTemplateRepository(TemplateRepository):
         return template_mapping.get(template_type.lower(), {})
 
     def get_template_content(self, template_path: str) -> Template:
-        return self.env.get_template(template_path)
+        template = self._templates.get(template_path)
+        if template is None:
+            _template_misses.inc()
+            template = self.env.get_template(template_path)
+            self._templates[template_path] = template
+        else:
+            _template_hits.inc()
+        return template
+
+    def referenced_variables(self, template_path: str) -> FrozenSet[str]:
+        variables = self._variables.get(template_path)
+        if variables is None:
+            source, _, _ = self.env.loader.get_source(self.env, template_path)
+            variables = frozenset(
+                meta.find_undeclared_variables(self.env.parse(source))
+            )
+            self._variables[template_path] = variables
+        return variables
+
+    def preload(self) -> int:
+        """Load and compile every template up front; returns how many"""
+        for path in sorted(self.template_dir.rglob("*.jinja")):
+            template_path = path.relative_to(self.template_dir).as_posix()
+            if template_path not in self._templates:
+                self._templates[template_path] = self.env.get_template(template_path)
+        return len(self._templates)
+
+    def tree_digest(self) -> str:
+        """Digest of every file under the template directory, computed once"""
+        if self._tree_digest is None:
+            digest = blake2b(digest_size=16)
+            for path in sorted(self.template_dir.rglob("*")):
+                if path.is_file():
+                    digest.update(
+                        path.relative_to(self.template_dir).as_posix().encode()
+                    )
+                    digest.update(b"\0")
+                    digest.update(path.read_bytes())
+                    digest.update(b"\0")
+            self._tree_digest = digest.hexdigest()
+        return self._tree_digest
+
+    def render_template(self, template_path: str, context: Dict[str, Any]) -> str:
+        with span("render"):
+            return self.get_template_content(template_path).render(**context)
@@ -0,0 +1,98 @@
+"""Builds the local package index used to generate lock files.
+
+Collects package metadata from PyPI JSON API documents saved to disk
+(``https://pypi.org/pypi/<name>/<version>/json``), which carry the sha256 of
+every distribution file, and/or from the distributions installed in the
+current environment, which carry no hashes. Releases already in the output
+file are kept unless they are found again.
+
+Run with ``python -m src.infrastructure.resolvers.build_index``.
+"""
+
+import argparse
+import json
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from packaging.utils import canonicalize_name
+
+from src.infrastructure.resolvers.package_index import INDEX_FORMAT
+
+Entry = Tuple[str, str, Dict]
+
+
+def _from_pypi_json(paths: Iterable[Path]) -> Iterator[Entry]:
+    for path in paths:
+        files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for file in files:
+            document = json.loads(file.read_text())
+            info = document["info"]
+            yield info["name"], info["version"], {
+                "requires_python": info.get("requires_python") or None,
+                "requires_dist": info.get("requires_dist") or [],
+                "hashes": sorted(
+                    f"sha256:{url['digests']['sha256']}"
+                    for url in document.get("urls", [])
+                    if url.get("digests", {}).get("sha256")
+                ),
+            }
+
+
+def _from_environment() -> Iterator[Entry]:
+    for distribution in metadata.distributions():
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        yield name, distribution.version, {
+            "requires_python": distribution.metadata["Requires-Python"],
+            "requires_dist": distribution.requires or [],
+            "hashes": [],
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=Path, help="Index file to create or update")
+    parser.add_argument(
+        "--pypi-json",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="PyPI JSON release documents, or directories of them",
+    )
+    parser.add_argument(
+        "--from-environment",
+        action="store_true",
+        help="Add the distributions installed in this environment (no hashes)",
+    )
+    args = parser.parse_args()
+
+    packages: Dict[str, Dict[str, Dict]] = {}
+    if args.output.exists():
+        packages = json.loads(args.output.read_text())["packages"]
+
+    added = 0
+    sources = [_from_pypi_json(args.pypi_json)]
+    if args.from_environment:
+        sources.insert(0, _from_environment())
+    for source in sources:
+        for name, version, release in source:
+            packages.setdefault(canonicalize_name(name), {})[version] = release
+            added += 1
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps(
+            {"format": INDEX_FORMAT, "packages": packages}, indent=1, sort_keys=True
+        )
+        + "\n"
+    )
+    print(
+        f"{added} releases added; {len(packages)} packages, "
+        f"{sum(map(len, packages.values()))} releases in {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from packaging.markers import default_environment
+from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+
+from src.domain.entities.locked_dependency import LockedDependency
+from src.domain.services.dependency_resolver import DependencyResolver
+from src.infrastructure.exceptions.dependency_resolution import (
+    DependencyResolutionError,
+)
+from src.infrastructure.observability.metrics import CACHE_REQUESTS
+from src.infrastructure.resolvers.package_index import PackageIndex, Release
+
+_resolution_hits = CACHE_REQUESTS.labels("lockfile", "hit")
+_resolution_misses = CACHE_REQUESTS.labels("lockfile", "miss")
+
+Pins = Dict[str, Tuple[Release, FrozenSet[str]]]
+
+
+class IndexDependencyResolver(DependencyResolver):
+    """Pins requirements against a local ``PackageIndex``, without network.
+
+    Picks the newest release satisfying every specifier and the target
+    Python version, backtracking on conflicts, and evaluates environment
+    markers for CPython on Linux (the platform of the generated Dockerfiles).
+    Resolutions are memoised by (Python version, requirement set), so
+    generating the same dependency set again is a dictionary lookup.
+    """
+
+    def __init__(
+        self, index: PackageIndex, *, max_cached: int = 256, max_attempts: int = 10000
+    ):
+        self.index = index
+        self.max_cached = max_cached
+        self.max_attempts = max_attempts
+        self._cache: (
+            "OrderedDict[Tuple[str, FrozenSet[str]], Tuple[LockedDependency, ...]]"
+        ) = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _requirement_key(requirement: Requirement) -> str:
+        extras = ",".join(sorted(canonicalize_name(e) for e in requirement.extras))
+        marker = f";{requirement.marker}" if requirement.marker else ""
+        return (
+            f"{canonicalize_name(requirement.name)}[{extras}]"
+            f"{requirement.specifier}{marker}"
+        )
+
+    def resolve(
+        self, requirements: Iterable[str], python_version: str
+    ) -> Tuple[LockedDependency, ...]:
+        parsed = [Requirement(requirement) for requirement in requirements]
+        key = (python_version, frozenset(map(self._requirement_key, parsed)))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                _resolution_hits.inc()
+                return cached
+        _resolution_misses.inc()
+
+        resolution = self._solve(parsed, python_version)
+        with self._lock:
+            self._cache[key] = resolution
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return resolution
+
+    @staticmethod
+    def _environment(python_version: str) -> Dict[str, str]:
+        full_version = python_version
+        if full_version.count(".") < 2:
+            full_version += ".0"
+        environment = default_environment()
+        environment.update(
+            python_version=".".join(full_version.split(".")[:2]),
+            python_full_version=full_version,
+            implementation_name="cpython",
+            platform_python_implementation="CPython",
+            os_name="posix",
+            sys_platform="linux",
+            platform_system="Linux",
+        )
+        return environment
+
+    def _solve(
+        self, requirements: List[Requirement], python_version: str
+    ) -> Tuple[LockedDependency, ...]:
+        environment = self._environment(python_version)
+        requirements = [
+            requirement
+            for requirement in requirements
+            if self._applies(requirement, environment, ())
+        ]
+        attempts = [self.max_attempts]
+        pins = self._backtrack(requirements, {}, environment, attempts)
+        if pins is None:
+            raise DependencyResolutionError(
+                f"No combination of indexed releases satisfies "
+                f"{', '.join(map(str, requirements))} on Python {python_version}"
+            )
+        return tuple(
+            LockedDependency(
+                name=name, version=str(release.version), hashes=release.hashes
+            )
+            for name, (release, _) in sorted(pins.items())
+        )
+
+    @staticmethod
+    def _applies(
+        requirement: Requirement, environment: Dict[str, str], extras: Iterable[str]
+    ) -> bool:
+        if requirement.marker is None:
+            return True
+        return any(
+            requirement.marker.evaluate({**environment, "extra": extra})
+            for extra in ("", *extras)
+        )
+
+    def _dependencies(
+        self,
+        release: Release,
+        extras: FrozenSet[str],
+        environment: Dict[str, str],
+        previous_extras: Optional[FrozenSet[str]] = None,
+    ) -> List[Requirement]:
+        """Requirements of ``release`` with ``extras``; only the ones the extras
+        add on top of ``previous_extras`` when those are given"""
+        dependencies = [
+            requirement
+            for requirement in release.requires
+            if self._applies(requirement, environment, extras)
+        ]
+        if previous_extras is None:
+            return dependencies
+        return [
+            requirement
+            for requirement in dependencies
+            if not self._applies(requirement, environment, previous_extras)
+        ]
+
+    def _candidates(
+        self, name: str, specifier: SpecifierSet, environment: Dict[str, str]
+    ) -> List[Release]:
+        python = environment["python_full_version"]
+        return [
+            release
+            for release in self.index.releases(name)
+            if specifier.contains(release.version)
+            and (
+                release.requires_python is None
+                or release.requires_python.contains(python, prereleases=True)
+            )
+        ]
+
+    def _backtrack(
+        self,
+        pending: List[Requirement],
+        pins: Pins,
+        environment: Dict[str, str],
+        attempts: List[int],
+    ) -> Optional[Pins]:
+        pending = list(pending)
+        while pending:
+            requirement = pending.pop(0)
+            name = canonicalize_name(requirement.name)
+            if name not in self.index:
+                raise DependencyResolutionError(f"{name} is not in the package index")
+            extras = frozenset(canonicalize_name(e) for e in requirement.extras)
+
+            pinned = pins.get(name)
+            if pinned is not None:
+                release, pinned_extras = pinned
+                if not requirement.specifier.contains(
+                    release.version, prereleases=True
+                ):
+                    return None
+                if not extras <= pinned_extras:
+                    all_extras = pinned_extras | extras
+                    pins = {**pins, name: (release, all_extras)}
+                    pending += self._dependencies(
+                        release, all_extras, environment, pinned_extras
+                    )
+                continue
+
+            for release in self._candidates(name, requirement.specifier, environment):
+                attempts[0] -= 1
+                if attempts[0] < 0:
+                    raise DependencyResolutionError(
+                        f"Gave up after {self.max_attempts} attempts resolving "
+                        f"{requirement}"
+                    )
+                resolved = self._backtrack(
+                    pending + self._dependencies(release, extras, environment),
+                    {**pins, name: (release, extras)},
+                    environment,
+                    attempts,
+                )
+                if resolved is not None:
+                    return resolved
+            return None
+        return pins
@@ -0,0 +1,81 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+INDEX_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class Release:
+    name: str
+    version: Version
+    requires_python: Optional[SpecifierSet]
+    requires: Tuple[Requirement, ...]
+    hashes: Tuple[str, ...]
+
+
+class PackageIndex:
+    """Package metadata read from a local JSON index, newest release first.
+
+    The index holds, per package and version, the same fields PyPI's JSON
+    API publishes: ``requires_python``, ``requires_dist`` and the
+    ``sha256:`` hashes of the distribution files::
+
+        {"format": 1, "packages": {"fastapi": {"0.100.0": {
+            "requires_python": ">=3.7",
+            "requires_dist": ["starlette<0.28.0,>=0.27.0", ...],
+            "hashes": ["sha256:..."]}}}}
+
+    Build one with ``python -m src.infrastructure.resolvers.build_index``.
+    """
+
+    def __init__(self, packages: Dict[str, Dict[str, Dict]]):
+        self._releases: Dict[str, List[Release]] = {}
+        for name, versions in packages.items():
+            releases = []
+            for version, metadata in versions.items():
+                try:
+                    parsed = Version(version)
+                except InvalidVersion:
+                    continue
+                requires_python = metadata.get("requires_python")
+                releases.append(
+                    Release(
+                        name=canonicalize_name(name),
+                        version=parsed,
+                        requires_python=(
+                            SpecifierSet(requires_python) if requires_python else None
+                        ),
+                        requires=tuple(
+                            Requirement(requirement)
+                            for requirement in metadata.get("requires_dist") or ()
+                        ),
+                        hashes=tuple(metadata.get("hashes") or ()),
+                    )
+                )
+            releases.sort(key=lambda release: release.version, reverse=True)
+            self._releases[canonicalize_name(name)] = releases
+
+    @classmethod
+    def load(cls, path: str) -> "PackageIndex":
+        data = json.loads(Path(path).read_text())
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(
+                f"Unsupported package index format {data.get('format')!r} in {path}"
+            )
+        return cls(data["packages"])
+
+    def __contains__(self, name: str) -> bool:
+        return canonicalize_name(name) in self._releases
+
+    def __len__(self) -> int:
+        return len(self._releases)
+
+    def releases(self, name: str) -> List[Release]:
+        return self._releases.get(canonicalize_name(name), [])
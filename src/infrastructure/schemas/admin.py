@@ -0,0 +1,84 @@
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RateLimitOffender(BaseModel):
+    client: str
+    estimated_requests: int
+
+
+class TopOffendersResponse(BaseModel):
+    window_seconds: int
+    offenders: List[RateLimitOffender]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "window_seconds": 60,
+                "offenders": [
+                    {"client": "203.0.113.7", "estimated_requests": 1840},
+                    {"client": "198.51.100.23", "estimated_requests": 312},
+                ],
+            }
+        }
+    )
+
+
+class BlockedCallbackInfo(BaseModel):
+    detected_at: str
+    blocked_ms: float
+    stack: List[str]
+
+
+class BlockedCallbacksResponse(BaseModel):
+    total: int
+    recent: List[BlockedCallbackInfo]
+
+
+class PhaseAllocationInfo(BaseModel):
+    phase: str
+    calls: int
+    mean_net_bytes: float
+    mean_peak_bytes: float
+    max_peak_bytes: int
+
+
+class AllocationReport(BaseModel):
+    active: bool
+    sample_rate: float
+    frames: int
+    requests_traced: int
+    traced_bytes: int
+    traced_peak_bytes: int
+    phases: List[PhaseAllocationInfo]
+
+
+class AllocationSiteInfo(BaseModel):
+    location: List[str]
+    size_bytes: int
+    count: int
+    size_diff_bytes: int
+    count_diff: int
+
+
+class AllocationSitesResponse(BaseModel):
+    group_by: str
+    sites: List[AllocationSiteInfo]
+
+
+class ProfiledFunction(BaseModel):
+    function: str
+    self_samples: int
+    self_percent: float
+    total_samples: int
+    total_percent: float
+
+
+class ProfileResponse(BaseModel):
+    duration_s: float
+    interval_ms: float
+    samples: int
+    idle_samples: int
+    top_functions: List[ProfiledFunction]
+    collapsed_stacks: str
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -21,6 +23,15 @@ class MemoryInfo(BaseModel):
     used_percent: float
 
 
+class EventLoopInfo(BaseModel):
+    lag_p50_ms: float
+    lag_p90_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    blocked_callbacks: int
+    ready: bool
+
+
 class HealthResponse(BaseModel):
     status: str
     environment: str
@@ -30,6 +41,7 @@ class HealthResponse(BaseModel):
     python_info: PythonInfo
     system_info: SystemInfo
     memory_usage: MemoryInfo
+    event_loop: Optional[EventLoopInfo] = None
 
     class Config:
         json_schema_extra = {
@@ -56,5 +68,13 @@ class HealthResponse(BaseModel):
                     "available": 8388608000,
                     "used_percent": 50.0,
                 },
+                "event_loop": {
+                    "lag_p50_ms": 0.4,
+                    "lag_p90_ms": 1.1,
+                    "lag_p99_ms": 12.5,
+                    "lag_max_ms": 48.0,
+                    "blocked_callbacks": 0,
+                    "ready": True,
+                },
             }
         }
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from src.domain.entities.project import Project
 from src.infrastructure.enumerators.dependency_manager import DependencyManager
 from src.infrastructure.enumerators.template_type import TemplateType
 
@@ -29,3 +30,50 @@ class ProjectSchema(BaseModel):
     include_flake8: bool = Field(
         default=False, description="Include Flake8 configuration"
     )
+    include_lockfile: bool = Field(
+        default=False,
+        description="Include a requirements.lock pinned from the server's "
+        "package index",
+    )
+
+    def to_project(self) -> Project:
+        return Project(
+            name=self.project_name,
+            description=self.description,
+            template_type=self.template_type,
+            python_version=self.python_version,
+            author=self.author,
+            dependency_manager=self.dependency_manager,
+            dependencies=(
+                ("fastapi", self.fastapi_version),
+                ("uvicorn", self.uvicorn_version),
+            ),
+            include_dockerfile=self.include_dockerfile,
+            include_docker_compose=self.include_docker_compose,
+            include_black=self.include_black,
+            include_conventional_commit=self.include_conventional_commit,
+            include_pre_commit=self.include_pre_commit,
+            include_flake8=self.include_flake8,
+            include_lockfile=self.include_lockfile,
+        )
+
+    @classmethod
+    def from_project(cls, project: Project) -> "ProjectSchema":
+        """Schema spelling of a (normalised) project, without re-validation"""
+        return cls.model_construct(
+            project_name=project.name,
+            description=project.description,
+            template_type=project.template_type,
+            python_version=project.python_version,
+            author=project.author or "",
+            dependency_manager=project.dependency_manager,
+            fastapi_version=project.dependency_version("fastapi"),
+            uvicorn_version=project.dependency_version("uvicorn"),
+            include_dockerfile=project.include_dockerfile,
+            include_docker_compose=project.include_docker_compose,
+            include_black=project.include_black,
+            include_conventional_commit=project.include_conventional_commit,
+            include_pre_commit=project.include_pre_commit,
+            include_flake8=project.include_flake8,
+            include_lockfile=project.include_lockfile,
+        )
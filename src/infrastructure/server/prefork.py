@@ -0,0 +1,203 @@
+import asyncio
+import gc
+import math
+import os
+import random
+import signal
+import socket
+import time
+from importlib.util import find_spec
+from typing import Dict, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI
+from loguru import logger
+
+from src.infrastructure.observability.metrics import registry
+
+MIN_WORKER_LIFETIME = 1.0
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring affinity and cgroup v2 quotas"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def fastest_loop() -> str:
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def fastest_http() -> str:
+    return "httptools" if find_spec("httptools") else "h11"
+
+
+class RecyclingServer(uvicorn.Server):
+    """Uvicorn server that exits gracefully once its RSS has grown too much"""
+
+    def __init__(
+        self,
+        config: uvicorn.Config,
+        *,
+        max_rss_growth: Optional[int],
+        check_interval: float = 10.0,
+    ):
+        super().__init__(config)
+        self.max_rss_growth = max_rss_growth
+        self.check_interval = check_interval
+
+    async def main_loop(self) -> None:
+        if self.max_rss_growth is None:
+            await super().main_loop()
+            return
+        watcher = asyncio.create_task(self._watch_rss())
+        try:
+            await super().main_loop()
+        finally:
+            watcher.cancel()
+
+    async def _watch_rss(self) -> None:
+        import psutil
+
+        process = psutil.Process()
+        baseline = process.memory_info().rss
+        while not self.should_exit:
+            await asyncio.sleep(self.check_interval)
+            growth = process.memory_info().rss - baseline
+            if growth > self.max_rss_growth:
+                logger.info(
+                    f"Worker {os.getpid()} grew by {growth // 2**20} MiB, recycling"
+                )
+                self.should_exit = True
+
+
+class PreforkServer:
+    """Runs the application in forked uvicorn workers sharing one socket.
+
+    The master builds and warms the application before forking, so compiled
+    templates and imported modules are shared copy-on-write, then supervises
+    the workers: a worker that exits (after ``max_requests`` requests, too
+    much RSS growth, or a crash) is replaced. SIGTERM/SIGINT are forwarded to
+    the workers, which stop accepting connections and drain in-flight
+    requests for up to ``graceful_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        *,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        max_requests_jitter: int = 0,
+        max_rss_growth: Optional[int] = None,
+        graceful_timeout: int = 30,
+    ):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers or available_cpus()
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.max_rss_growth = max_rss_growth
+        self.graceful_timeout = graceful_timeout
+        self._children: Dict[int, Tuple[int, float]] = {}
+        self._stopping = False
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _worker_config(self) -> uvicorn.Config:
+        limit = self.max_requests
+        if limit and self.max_requests_jitter:
+            # Spread restarts so workers do not all recycle at the same time.
+            limit += random.randint(0, self.max_requests_jitter)
+        return uvicorn.Config(
+            self.app,
+            loop=fastest_loop(),
+            http=fastest_http(),
+            lifespan="on",
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=self.graceful_timeout,
+            access_log=False,
+        )
+
+    def _spawn(self, sock: socket.socket, slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            random.seed()
+            server = RecyclingServer(
+                self._worker_config(), max_rss_growth=self.max_rss_growth
+            )
+            server.run(sockets=[sock])
+            os._exit(0)
+        self._children[pid] = (slot, time.monotonic())
+
+    def _stop(self, signum, frame) -> None:
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        self.app.state.builder.warm_up()
+        gc.collect()
+        # Keep the warmed-up objects out of the collector, so that collections
+        # in the workers do not touch (and un-share) their pages.
+        gc.freeze()
+
+        sock = self._bind()
+        logger.info(
+            f"Master {os.getpid()} listening on {self.host}:{self.port} with "
+            f"{self.workers} workers ({fastest_loop()}, {fastest_http()})"
+        )
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        registry.clear_multiprocess_dir()
+        for slot in range(self.workers):
+            self._spawn(sock, slot)
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:  # pragma: no cover - retried by PEP 475
+                continue
+            child = self._children.pop(pid, None)
+            if child is not None:
+                registry.mark_process_dead(pid)
+            if child is None or self._stopping:
+                continue
+            slot, started_at = child
+            logger.info(
+                f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, "
+                f"starting a replacement"
+            )
+            if time.monotonic() - started_at < MIN_WORKER_LIFETIME:
+                # Do not spin when workers die during startup.
+                time.sleep(MIN_WORKER_LIFETIME)
+            self._spawn(sock, slot)
+
+        sock.close()
+        logger.info("All workers stopped")
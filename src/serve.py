@@ -0,0 +1,19 @@
+from src.infrastructure.config.settings import settings
+from src.infrastructure.server.prefork import PreforkServer
+from src.main import app
+
+if __name__ == "__main__":
+    PreforkServer(
+        app,
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.WEB_CONCURRENCY,
+        max_requests=settings.WORKER_MAX_REQUESTS,
+        max_requests_jitter=settings.WORKER_MAX_REQUESTS_JITTER,
+        max_rss_growth=(
+            settings.WORKER_MAX_RSS_GROWTH_MB * 2**20
+            if settings.WORKER_MAX_RSS_GROWTH_MB
+            else None
+        ),
+        graceful_timeout=settings.GRACEFUL_TIMEOUT_SECONDS,
+    ).run()
@@ -0,0 +1,75 @@
+import pytest
+
+from src.domain.entities.project import Project
+from src.infrastructure.enumerators.dependency_manager import DependencyManager
+from src.infrastructure.enumerators.template_type import TemplateType
+
+
+def _project(**overrides) -> Project:
+    spec = {
+        "name": "demo",
+        "description": "A demo project",
+        "template_type": TemplateType.BASIC,
+        "python_version": "3.10",
+        "author": "Jane Doe",
+        "dependencies": (("fastapi", "0.111.0"), ("uvicorn", "0.30.1")),
+    }
+    spec.update(overrides)
+    return Project(**spec)
+
+
+class TestNormalisePythonVersion:
+    @pytest.mark.parametrize(
+        "version, expected",
+        [
+            ("3.10", "3.10"),
+            ("3.10.0", "3.10"),
+            (" 3.11.00 ", "3.11"),
+            ("3.10.12", "3.10.12"),
+            ("3.12.1", "3.12.1"),
+            ("3.13-rc", "3.13-rc"),
+        ],
+    )
+    def test_only_a_zero_patch_is_dropped(self, version, expected):
+        assert Project.normalise_python_version(version) == expected
+
+
+class TestEquality:
+    def test_equivalent_spellings_are_one_spec(self):
+        first = _project(python_version="3.10.0")
+        second = _project(
+            name=" demo ",
+            template_type="basic",
+            author=" Jane Doe ",
+            dependencies={"Uvicorn": "0.30.1", "fastapi": "0.111.0"},
+            dependency_manager="pip",
+        )
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_patch_releases_are_different_specs(self):
+        first = _project(python_version="3.10.12")
+        second = _project(python_version="3.10")
+        assert first.python_version == "3.10.12"
+        assert first != second
+        assert first.fingerprint() != second.fingerprint()
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"description": "Another project"},
+            {"template_type": TemplateType.FULL},
+            {"dependency_manager": DependencyManager.POETRY},
+            {"include_dockerfile": True},
+            {"include_lockfile": True},
+            {"dependencies": (("fastapi", "0.110.0"), ("uvicorn", "0.30.1"))},
+        ],
+    )
+    def test_any_other_difference_changes_the_fingerprint(self, change):
+        assert _project().fingerprint() != _project(**change).fingerprint()
+
+    def test_fingerprint_is_cached_and_not_compared(self):
+        project = _project()
+        assert project.fingerprint() is project.fingerprint()
+        assert project == _project()
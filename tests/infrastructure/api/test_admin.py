@@ -0,0 +1,36 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.observability.loop_monitor import BlockedCallback, loop_monitor
+from src.main import app
+
+TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", TOKEN)
+    return TestClient(app)
+
+
+class TestBlockedCallbacks:
+    @pytest.fixture(autouse=True)
+    def blocked(self):
+        loop_monitor.blocked.append(
+            BlockedCallback(detected_at=0.0, blocked_ms=250.0, stack=["frame\n"])
+        )
+        yield
+        loop_monitor.blocked.clear()
+
+    def test_detection_time_is_utc(self, client):
+        response = client.get(
+            "/admin/event-loop/blocked", headers={"X-Admin-Token": TOKEN}
+        )
+        assert response.status_code == 200
+        (recent,) = response.json()["recent"]
+        assert recent["detected_at"] == "1970-01-01T00:00:00+00:00"
+        assert recent["blocked_ms"] == 250.0
+
+    def test_token_is_required(self, client):
+        assert client.get("/admin/event-loop/blocked").status_code == 401
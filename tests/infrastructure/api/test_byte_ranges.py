@@ -0,0 +1,68 @@
+import pytest
+
+from src.infrastructure.api.byte_ranges import if_range_matches, parse_byte_range
+from src.infrastructure.exceptions.range_not_satisfiable import RangeNotSatisfiable
+
+
+class TestParseByteRange:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=10-10", (10, 10)),
+            ("bytes=90-500", (90, 99)),
+            ("BYTES = 5-9", (5, 9)),
+            ("bytes=40-", (40, 99)),
+            ("bytes=99-", (99, 99)),
+            ("bytes=-10", (90, 99)),
+            ("bytes=-500", (0, 99)),
+        ],
+    )
+    def test_single_ranges(self, header, expected):
+        assert parse_byte_range(header, 100) == expected
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            None,
+            "",
+            "items=0-9",
+            "bytes=abc",
+            "bytes=-",
+            "bytes=1-2-3",
+            "bytes=20-10",  # reversed
+            "bytes=0-9,20-29",  # multiple ranges
+            "bytes=0-9, -5",
+        ],
+    )
+    def test_whole_content_is_sent_instead(self, header):
+        assert parse_byte_range(header, 100) is None
+
+    @pytest.mark.parametrize(
+        "header, length",
+        [
+            ("bytes=100-", 100),
+            ("bytes=100-200", 100),
+            ("bytes=-0", 100),
+            ("bytes=0-", 0),
+            ("bytes=-5", 0),
+        ],
+    )
+    def test_unsatisfiable_ranges(self, header, length):
+        with pytest.raises(RangeNotSatisfiable) as raised:
+            parse_byte_range(header, length)
+        assert raised.value.length == length
+
+
+class TestIfRangeMatches:
+    def test_absent_if_range_allows_the_range(self):
+        assert if_range_matches(None, '"abc"')
+
+    def test_current_strong_etag_matches(self):
+        assert if_range_matches(' "abc" ', '"abc"')
+
+    @pytest.mark.parametrize(
+        "if_range", ['"other"', 'W/"abc"', "Wed, 21 Oct 2015 07:28:00 GMT", ""]
+    )
+    def test_anything_else_sends_the_whole_content(self, if_range):
+        assert not if_range_matches(if_range, '"abc"')
@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+ORIGIN = "https://example.com"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _exhaust_budget(client_ip: str) -> None:
+    app.state.builder.rate_limit_store.increment(client_ip, 100)
+
+
+class TestCorsAndRateLimiting:
+    def test_preflights_do_not_spend_the_budget(self, client):
+        client_ip = "192.0.2.10"
+        headers = {
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "X-Forwarded-For": client_ip,
+        }
+        for _ in range(150):
+            response = client.options("/generator/create", headers=headers)
+            assert response.status_code == 200
+            assert "access-control-allow-origin" in response.headers
+
+        response = client.get("/openapi.json", headers={"X-Forwarded-For": client_ip})
+        assert response.status_code == 200
+        assert response.headers["x-ratelimit-remaining"] == "99"
+
+    def test_rejections_carry_cors_headers(self, client):
+        client_ip = "192.0.2.11"
+        _exhaust_budget(client_ip)
+        response = client.get(
+            "/openapi.json", headers={"Origin": ORIGIN, "X-Forwarded-For": client_ip}
+        )
+        assert response.status_code == 429
+        assert "access-control-allow-origin" in response.headers
@@ -0,0 +1,155 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.repositories.archive_store import ArchiveStore
+from src.main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def archive_store(tmp_path, monkeypatch):
+    store = ArchiveStore(ttl_seconds=60, max_bytes=1 << 20, directory=tmp_path)
+    monkeypatch.setattr(app.state.builder.generator_api, "archive_store", store)
+    return store
+
+
+class TestLockfileWithoutIndex:
+    @pytest.fixture(autouse=True)
+    def no_index(self, monkeypatch):
+        monkeypatch.setattr(settings, "LOCKFILE_INDEX_PATH", None)
+
+    def test_post_is_rejected_before_generation(self, client):
+        response = client.post(
+            "/generator/create",
+            json={"project_name": "demo", "include_lockfile": True},
+        )
+        assert response.status_code == 501
+        detail = response.json()["detail"]
+        assert "LOCKFILE_INDEX_PATH" in detail
+        assert "Failed to generate project" not in detail
+
+    def test_get_is_rejected_before_generation(self, client):
+        response = client.get(
+            "/generator/create?include_lockfile=true&project_name=demo",
+            follow_redirects=False,
+        )
+        assert response.status_code == 501
+
+    def test_without_lockfile_the_project_is_generated(self, client):
+        response = client.post("/generator/create", json={"project_name": "demo"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+
+
+def test_generation_errors_are_reported_once(client, monkeypatch):
+    service = app.state.builder.generator_api.project_service
+
+    async def failing_generate(project):
+        raise RuntimeError("Failed to generate project: disk full")
+
+    monkeypatch.setattr(service, "generate_project", failing_generate)
+    response = client.post("/generator/create", json={"project_name": "demo"})
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to generate project: disk full"
+
+
+class TestDownloadArchive:
+    CONTENT = bytes(range(256)) * 4
+
+    @pytest.fixture
+    def archive(self, archive_store):
+        return archive_store.put(self.CONTENT, "demo.zip")
+
+    def test_whole_archive(self, client, archive):
+        response = client.get(f"/generator/archives/{archive.digest}")
+        assert response.status_code == 200
+        assert response.content == self.CONTENT
+        assert response.headers["etag"] == archive.etag
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_single_range(self, client, archive):
+        response = client.get(
+            f"/generator/archives/{archive.digest}", headers={"Range": "bytes=10-19"}
+        )
+        assert response.status_code == 206
+        assert response.content == self.CONTENT[10:20]
+        assert response.headers["content-range"] == "bytes 10-19/1024"
+
+    def test_unsatisfiable_range(self, client, archive):
+        response = client.get(
+            f"/generator/archives/{archive.digest}", headers={"Range": "bytes=2000-"}
+        )
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */1024"
+
+    def test_range_is_honoured_only_for_the_current_etag(self, client, archive):
+        url = f"/generator/archives/{archive.digest}"
+        matching = client.get(
+            url, headers={"Range": "bytes=-4", "If-Range": archive.etag}
+        )
+        assert matching.status_code == 206
+        assert matching.content == self.CONTENT[-4:]
+
+        stale = client.get(url, headers={"Range": "bytes=-4", "If-Range": '"old"'})
+        assert stale.status_code == 200
+        assert stale.content == self.CONTENT
+
+    def test_head_sends_the_headers_only(self, client, archive):
+        url = f"/generator/archives/{archive.digest}"
+        response = client.head(url)
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["content-length"] == "1024"
+        assert response.headers["etag"] == archive.etag
+
+        partial = client.head(url, headers={"Range": "bytes=0-99"})
+        assert partial.status_code == 206
+        assert partial.headers["content-length"] == "100"
+        assert partial.headers["content-range"] == "bytes 0-99/1024"
+
+    def test_unknown_digest(self, client):
+        assert client.get("/generator/archives/0").status_code == 404
+        assert client.head("/generator/archives/0").status_code == 404
+
+
+class TestGetETag:
+    URL = "/generator/create?project_name=etag-demo"
+
+    def test_etag_covers_the_template_tree(self, client, monkeypatch):
+        api = app.state.builder.generator_api
+        first = client.get(self.URL)
+        assert first.status_code == 200
+        assert api.templates_digest in first.headers["etag"]
+
+        repository = api._template_repository
+        monkeypatch.setattr(repository, "_tree_digest", "0" * 32)
+        second = client.get(self.URL, headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+
+    def test_unchanged_templates_revalidate(self, client):
+        etag = client.get(self.URL).headers["etag"]
+        response = client.get(self.URL, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestContentLocation:
+    PROJECT = {"project_name": "located"}
+
+    def test_points_at_the_stored_archive(self, client):
+        response = client.post("/generator/create", json=self.PROJECT)
+        location = response.headers["content-location"]
+        again = client.get(location)
+        assert again.status_code == 200
+        assert again.content == response.content
+
+    def test_omitted_when_the_archive_is_not_kept(self, client, archive_store):
+        archive_store.max_bytes = 0
+        response = client.post("/generator/create", json=self.PROJECT)
+        assert response.status_code == 200
+        assert "content-location" not in response.headers
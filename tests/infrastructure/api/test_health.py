@@ -0,0 +1,89 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.health import HealthAPI
+from src.infrastructure.observability.system import PlatformInfo, SystemSnapshot
+from src.infrastructure.schemas.health import HealthResponse
+
+
+class FakeSampler:
+    platform = PlatformInfo(
+        python_version="3.11.7",
+        python_implementation="CPython",
+        python_compiler="GCC 12.2.0",
+        platform="Linux",
+        architecture="x86_64",
+        processor="x86_64",
+        cpu_count=4,
+    )
+
+    def __init__(self):
+        self.snapshot = SystemSnapshot(
+            taken_at=0.0,
+            cpu_percent=12.5,
+            memory_total=1024,
+            memory_available=512,
+            memory_used_percent=50.0,
+        )
+
+
+class FakeLoopMonitor:
+    def __init__(self):
+        self.running = True
+        self.lag = 0.001
+        self.blocked_total = 0
+
+    def percentiles(self):
+        return {"0.5": self.lag, "0.9": self.lag, "0.99": self.lag, "max": self.lag}
+
+    def is_ready(self):
+        return self.lag < 0.5
+
+
+def _client(sampler, loop_monitor) -> TestClient:
+    app = FastAPI()
+    HealthAPI(app, sampler=sampler, loop_monitor=loop_monitor)
+    return TestClient(app)
+
+
+class TestHealthCheck:
+    def test_body_is_a_valid_health_response(self):
+        body = _client(FakeSampler(), FakeLoopMonitor()).get("/health").json()
+        response = HealthResponse.model_validate(body)
+        assert response.timestamp == "1970-01-01T00:00:00+00:00"
+        assert response.system_info.cpu_usage == 12.5
+        assert response.event_loop.lag_p99_ms == 1.0
+
+    def test_event_loop_section_is_fresh_between_system_samples(self):
+        loop_monitor = FakeLoopMonitor()
+        client = _client(FakeSampler(), loop_monitor)
+        assert client.get("/health").json()["event_loop"]["ready"] is True
+
+        loop_monitor.lag = 2.0
+        loop_monitor.blocked_total = 3
+        event_loop = client.get("/health").json()["event_loop"]
+        assert event_loop["lag_max_ms"] == 2000.0
+        assert event_loop["blocked_callbacks"] == 3
+        assert event_loop["ready"] is False
+
+    def test_system_section_follows_the_sampler(self):
+        sampler = FakeSampler()
+        client = _client(sampler, FakeLoopMonitor())
+        client.get("/health")
+        sampler.snapshot = SystemSnapshot(
+            taken_at=60.0,
+            cpu_percent=90.0,
+            memory_total=1024,
+            memory_available=256,
+            memory_used_percent=75.0,
+        )
+        body = client.get("/health").json()
+        assert body["system_info"]["cpu_usage"] == 90.0
+        assert body["memory_usage"]["available"] == 256
+
+    def test_without_loop_monitor_the_section_is_null(self):
+        loop_monitor = FakeLoopMonitor()
+        loop_monitor.running = False
+        body = _client(FakeSampler(), loop_monitor).get("/health").json()
+        assert body["event_loop"] is None
+        HealthResponse.model_validate(body)
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from src.infrastructure.middleware.logging.body_capture import BodyCapturePolicy
+from src.infrastructure.middleware.logging.utils import (
+    SensitiveDataMasker,
+    mask_sensitive_data,
+)
+
+MASK = SensitiveDataMasker.MASK
+
+
+@pytest.fixture
+def masker():
+    return SensitiveDataMasker({"Password", "token"})
+
+
+class TestSensitiveDataMasker:
+    def test_masks_nested_keys_case_insensitively(self, masker):
+        data = {
+            "user": {"name": "a", "PASSWORD": "secret"},
+            "sessions": [{"Token": "t1", "id": 1}, {"id": 2, "meta": {"token": "t2"}}],
+        }
+        assert masker.mask(data) == {
+            "user": {"name": "a", "PASSWORD": MASK},
+            "sessions": [{"Token": MASK, "id": 1}, {"id": 2, "meta": {"token": MASK}}],
+        }
+
+    def test_masks_whole_value_of_sensitive_container(self, masker):
+        assert masker.mask({"token": {"access": "x"}}) == {"token": MASK}
+
+    def test_leaves_scalars_and_non_string_keys_alone(self, masker):
+        assert masker.mask("password") == "password"
+        assert masker.mask({1: "password"}) == {1: "password"}
+
+    def test_does_not_modify_the_input(self, masker):
+        data = {"password": "secret"}
+        masker.mask(data)
+        assert data == {"password": "secret"}
+
+    def test_mask_headers(self, masker):
+        headers = {"token": "abc", "accept": "*/*"}
+        assert masker.mask_headers(headers) == {"token": MASK, "accept": "*/*"}
+
+    def test_mask_sensitive_data_helper(self):
+        assert mask_sensitive_data({"cookie": "c"}, {"cookie"}) == {"cookie": MASK}
+
+
+class TestBodyCapturePolicy:
+    @pytest.mark.parametrize(
+        "content_type",
+        ["application/zip", "image/png", "application/octet-stream"],
+    )
+    def test_binary_bodies_are_described_not_decoded(self, content_type):
+        policy = BodyCapturePolicy()
+        body = b"\x00\xff" * 10
+        assert policy.capture(body, content_type) == (
+            f"<{content_type} body omitted, 20 bytes>"
+        )
+        assert not policy.should_read(content_type, "20")
+
+    @pytest.mark.parametrize(
+        "content_type",
+        [
+            "text/plain; charset=utf-8",
+            "application/json",
+            "application/vnd.api+json",
+            "application/x-www-form-urlencoded",
+            None,
+        ],
+    )
+    def test_textual_bodies_are_read(self, content_type):
+        assert BodyCapturePolicy().should_read(content_type, "10")
+
+    def test_empty_bodies_are_not_read(self):
+        policy = BodyCapturePolicy()
+        assert not policy.should_read("application/json", "0")
+        assert policy.capture(b"", "application/json") is None
+        assert policy.describe_skipped("application/json", "0") is None
+
+    def test_skipped_body_size_is_left_out_when_unknown(self):
+        policy = BodyCapturePolicy()
+        assert policy.describe_skipped("application/zip", "2048") == (
+            "<application/zip body omitted, 2048 bytes>"
+        )
+        assert policy.describe_skipped("application/zip", None) == (
+            "<application/zip body omitted>"
+        )
+        assert policy.describe_skipped(None, "bogus") == "<unknown body omitted>"
+
+    def test_text_is_truncated_at_the_byte_cap(self):
+        policy = BodyCapturePolicy(max_body_bytes=10)
+        captured = policy.capture(b"x" * 25, "text/plain")
+        assert captured == "x" * 10 + "...<truncated 15 bytes>"
+
+    def test_body_at_the_cap_is_kept_whole(self):
+        policy = BodyCapturePolicy(max_body_bytes=10)
+        assert policy.capture(b"x" * 10, "text/plain") == "x" * 10
+
+    def test_oversized_json_is_not_logged_when_masking(self, masker):
+        policy = BodyCapturePolicy(max_body_bytes=10, masker=masker)
+        body = json.dumps({"password": "secret-value"}).encode()
+        captured = policy.capture(body, "application/json")
+        assert captured == f"<application/json body over limit, {len(body)} bytes>"
+        assert "secret" not in captured
+
+    def test_json_is_parsed_and_masked(self, masker):
+        policy = BodyCapturePolicy(masker=masker)
+        body = json.dumps({"login": {"password": "p"}, "n": 1}).encode()
+        assert policy.capture(body, "application/json") == {
+            "login": {"password": MASK},
+            "n": 1,
+        }
+
+    def test_invalid_json_falls_back_to_text(self, masker):
+        policy = BodyCapturePolicy(masker=masker)
+        assert policy.capture(b"{not json", "application/json") == "{not json"
+
+    def test_invalid_utf8_is_replaced(self):
+        captured = BodyCapturePolicy().capture(b"ok \xff", "text/plain")
+        assert captured == "ok �"
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from src.infrastructure.middleware.logging.sampling import SamplingPolicy
+
+
+class TestRateFor:
+    def test_default_rate_without_overrides(self):
+        assert SamplingPolicy(sample_rate=0.3).rate_for("/anything") == 0.3
+
+    def test_longest_prefix_wins(self):
+        policy = SamplingPolicy(
+            sample_rate=1.0,
+            route_overrides={"/generator": 0.5, "/generator/create": 0.1},
+        )
+        assert policy.rate_for("/generator/create") == 0.1
+        assert policy.rate_for("/generator/create/") == 0.1
+        assert policy.rate_for("/generator/archives/abc") == 0.5
+        assert policy.rate_for("/generator") == 0.5
+
+    def test_prefix_matches_whole_segments_only(self):
+        policy = SamplingPolicy(sample_rate=1.0, route_overrides={"/docs": 0.0})
+        assert policy.rate_for("/docs/oauth2-redirect") == 0.0
+        assert policy.rate_for("/docsearch") == 1.0
+
+    def test_root_override_applies_to_root_only(self):
+        policy = SamplingPolicy(sample_rate=1.0, route_overrides={"/": 0.2})
+        assert policy.rate_for("/") == 0.2
+        assert policy.rate_for("/health") == 1.0
+
+    def test_rates_are_clamped(self):
+        policy = SamplingPolicy(sample_rate=3.0, route_overrides={"/a": -1})
+        assert policy.sample_rate == 1.0
+        assert policy.rate_for("/a") == 0.0
+
+
+class TestShouldSample:
+    def test_full_and_zero_rates_do_not_draw(self, monkeypatch):
+        def fail():
+            raise AssertionError("random drawn for a deterministic rate")
+
+        monkeypatch.setattr(random, "random", fail)
+        policy = SamplingPolicy(sample_rate=1.0, route_overrides={"/docs": 0.0})
+        assert policy.should_sample("/generator/create")
+        assert not policy.should_sample("/docs")
+
+    def test_fractional_rate_is_reproducible_with_a_seed(self):
+        policy = SamplingPolicy(sample_rate=0.25)
+        random.seed(1234)
+        first = [policy.should_sample("/x") for _ in range(2000)]
+        random.seed(1234)
+        second = [policy.should_sample("/x") for _ in range(2000)]
+        assert first == second
+        assert sum(first) / len(first) == pytest.approx(0.25, abs=0.03)
+
+
+class TestShouldKeep:
+    @pytest.mark.parametrize("status_code", [400, 404, 429, 500, 503])
+    def test_errors_are_always_kept(self, status_code):
+        assert SamplingPolicy(sample_rate=0.0).should_keep(status_code, 0.1)
+
+    @pytest.mark.parametrize("status_code", [200, 204, 301, 304])
+    def test_fast_successes_are_dropped(self, status_code):
+        policy = SamplingPolicy(sample_rate=0.0, slow_request_threshold_ms=500)
+        assert not policy.should_keep(status_code, 10.0)
+
+    def test_slow_requests_are_kept(self):
+        policy = SamplingPolicy(sample_rate=0.0, slow_request_threshold_ms=500)
+        assert policy.should_keep(200, 500.0)
+        assert policy.should_keep(200, 1200.0)
+        assert not policy.should_keep(200, 499.9)
+
+    def test_no_threshold_never_keeps_successes(self):
+        assert not SamplingPolicy(sample_rate=0.0).should_keep(200, 10_000.0)
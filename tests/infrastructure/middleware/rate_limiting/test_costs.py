@@ -0,0 +1,66 @@
+import pytest
+
+from src.infrastructure.middleware.rate_limiting.costs import RouteCostModel
+
+
+class TestStaticCosts:
+    def test_longest_prefix_wins(self):
+        model = RouteCostModel(
+            static_costs={"/": 2, "/generator": 5, "/generator/create/": 10}
+        )
+        assert model.cost_for("/generator/create") == 10
+        assert model.cost_for("/generator/create/") == 10
+        assert model.cost_for("/generator/archives/abc") == 5
+        assert model.cost_for("/generatorx") == 2
+        assert model.cost_for("/health") == 2
+
+    def test_unknown_route_costs_one(self):
+        assert RouteCostModel().cost_for("/anything") == 1
+
+    def test_static_routes_are_not_measured(self):
+        model = RouteCostModel(static_costs={"/docs": 0}, cost_unit_ms=10)
+        model.observe("/docs", 200, 1000)
+        assert model.cost_for("/docs") == 0
+        assert model._average_ms == {}
+
+
+class TestMeasuredCosts:
+    def test_first_observation_sets_the_cost(self):
+        model = RouteCostModel(cost_unit_ms=10, max_cost=20)
+        model.observe("/generator/create", 200, 45)
+        assert model.cost_for("/generator/create") == 5
+        assert model.cost_for("/generator/create/") == 5
+
+    def test_cost_is_clamped(self):
+        model = RouteCostModel(cost_unit_ms=10, max_cost=20)
+        model.observe("/fast", 200, 0.1)
+        model.observe("/slow", 200, 10_000)
+        assert model.cost_for("/fast") == 1
+        assert model.cost_for("/slow") == 20
+
+    def test_average_converges_to_the_new_handling_time(self):
+        model = RouteCostModel(cost_unit_ms=10, max_cost=100, smoothing=0.2)
+        model.observe("/route", 200, 100)
+        for step in range(1, 30):
+            model.observe("/route", 200, 500)
+            # The gap to the new time shrinks by (1 - smoothing) per sample.
+            assert model._average_ms["/route"] == pytest.approx(500 - 400 * 0.8**step)
+        assert model.cost_for("/route") == 50
+
+    def test_errors_and_disabled_measuring_are_ignored(self):
+        model = RouteCostModel(cost_unit_ms=10)
+        model.observe("/route", 500, 1000)
+        model.observe("/route", 429, 1000)
+        assert model.cost_for("/route") == 1
+        disabled = RouteCostModel()
+        disabled.observe("/route", 200, 1000)
+        assert disabled.cost_for("/route") == 1
+
+    def test_number_of_measured_routes_is_bounded(self):
+        model = RouteCostModel(cost_unit_ms=10, max_routes=2)
+        for path in ("/a", "/b", "/c"):
+            model.observe(path, 200, 50)
+        assert model.cost_for("/b") == 5
+        assert model.cost_for("/c") == 1
+        model.observe("/a", 200, 100)
+        assert model.cost_for("/a") == 6  # ceil(60 / 10)
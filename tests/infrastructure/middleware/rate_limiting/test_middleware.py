@@ -0,0 +1,38 @@
+from src.infrastructure.middleware.rate_limiting.middleware import (
+    RateLimitingMiddleware,
+)
+from src.infrastructure.middleware.rate_limiting.store import (
+    SlidingWindowStore,
+    TokenBucketStore,
+)
+
+
+async def _app(scope, receive, send):
+    pass
+
+
+class TestRateLimitingMiddleware:
+    def test_uses_the_given_store_even_while_empty(self):
+        store = TokenBucketStore(10, 60)
+        assert len(store) == 0
+        assert RateLimitingMiddleware(_app, store=store).store is store
+
+    def test_defaults_to_a_sliding_window(self):
+        middleware = RateLimitingMiddleware(_app, window_seconds=30)
+        assert isinstance(middleware.store, SlidingWindowStore)
+        assert middleware.store.window_seconds == 30
+
+
+async def test_options_requests_are_not_counted():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["method"])
+
+    store = SlidingWindowStore(60)
+    middleware = RateLimitingMiddleware(app, requests_limit=1, store=store)
+    scope = {"type": "http", "method": "OPTIONS", "path": "/x", "headers": []}
+    for _ in range(3):
+        await middleware(scope, None, None)
+    assert calls == ["OPTIONS"] * 3
+    assert len(store) == 0
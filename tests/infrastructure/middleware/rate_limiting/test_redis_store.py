@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from benchmarks.redis_standin import RedisStandInServer
+from src.infrastructure.middleware.rate_limiting.redis_store import (
+    RedisRateLimitStore,
+)
+from src.infrastructure.middleware.rate_limiting.resp import RespConnection
+from src.infrastructure.middleware.rate_limiting.store import SlidingWindowStore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+async def server(clock):
+    server = await RedisStandInServer(port=0, clock=clock).start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def pipelines(monkeypatch):
+    """Sizes of the pipelines sent to the server"""
+    sizes = []
+    pipeline = RespConnection.pipeline
+
+    async def counting_pipeline(self, commands, timeout=None):
+        sizes.append(len(commands))
+        return await pipeline(self, commands, timeout)
+
+    monkeypatch.setattr(RespConnection, "pipeline", counting_pipeline)
+    return sizes
+
+
+def _store(url: str, **kwargs) -> RedisRateLimitStore:
+    kwargs.setdefault("timeout", 1.0)
+    kwargs.setdefault("clock", FakeClock())
+    return RedisRateLimitStore(url, 10, **kwargs)
+
+
+class TestRedisRateLimitStore:
+    async def test_counts_are_shared_and_atomic_across_clients(self, server):
+        stores = [_store(server.url, pool_size=2) for _ in range(3)]
+        await asyncio.gather(
+            *(store.check("client") for store in stores for _ in range(20))
+        )
+        assert await stores[0].check("client") == (60, 10)
+        for store in stores:
+            await store.close()
+
+    async def test_previous_window_is_weighted(self, server, clock):
+        store = _store(server.url, clock=clock)
+        await store.check("client", cost=10)
+        clock.now = 1012.5
+        assert await store.check("client") == (7, 7.5)
+        await store.close()
+
+    async def test_window_keys_are_declared_and_share_a_slot(self, server, clock):
+        store = _store(server.url, clock=clock)
+        assert store.window_keys("10.0.0.1", 100) == (
+            "ratelimit:{10.0.0.1}:100",
+            "ratelimit:{10.0.0.1}:99",
+        )
+        await store.check("10.0.0.1", cost=2)
+        assert server._get(b"ratelimit:{10.0.0.1}:100") == b"2"
+        await store.close()
+
+    async def test_checks_of_one_tick_are_pipelined(self, server, pipelines):
+        store = _store(server.url, max_batch=16)
+        await store.check("warm-up")  # loads the script
+        pipelines.clear()
+
+        results = await asyncio.gather(*(store.check("client") for _ in range(50)))
+        assert sorted(pipelines) == [2, 16, 16, 16]
+        assert sorted(count for count, _ in results) == list(range(50))
+        await store.close()
+
+    async def test_noscript_loads_the_script_and_retries(self, server, pipelines):
+        store = _store(server.url)
+        assert await store.check("client", cost=2) == (0, 10)
+        # The first pipeline got NOSCRIPT, then SCRIPT LOAD, then the retry.
+        assert pipelines == [1, 1, 1]
+
+        connection = await store.pool._connect()
+        await connection.execute("SCRIPT", "FLUSH")
+        connection.close()
+        assert await store.check("client") == (2, 10)
+        await store.close()
+
+    async def test_falls_back_to_the_local_store_when_down(self, clock):
+        server = await RedisStandInServer(port=0, clock=clock).start()
+        url = server.url
+        await server.stop()
+
+        fallback = SlidingWindowStore(10, clock=clock)
+        store = _store(url, fallback=fallback)
+        assert await store.check("client", cost=3) == (0, 10)
+        assert store._degraded_until
+        assert await store.check("client") == (3, 10)
+        assert len(fallback) == 1
+        await store.close()
+
+    async def test_slow_pipeline_drops_its_connection(self, server, clock):
+        server.latency = 0.5
+        fallback = SlidingWindowStore(10, clock=clock)
+        store = _store(server.url, timeout=0.05, pool_size=1, fallback=fallback)
+
+        assert await store.check("client") == (0, 10)
+        await asyncio.gather(*store._batches)
+        assert store.pool._idle.empty()
+        assert not store.pool._slots.locked()
+        assert len(fallback) == 1
+        await store.close()
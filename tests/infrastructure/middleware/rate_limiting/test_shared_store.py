@@ -0,0 +1,130 @@
+import multiprocessing
+
+import pytest
+
+from src.infrastructure.middleware.rate_limiting.shared_store import (
+    HEADER,
+    SLOT,
+    SharedMemoryStore,
+)
+
+fork = multiprocessing.get_context("fork")
+
+
+def _clock() -> float:
+    return 1000.0
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """Keys named ``h<n>`` hash to n, so tests can place them in the table"""
+    monkeypatch.setattr(
+        SharedMemoryStore, "_hash", staticmethod(lambda key: int(key[1:]))
+    )
+
+
+@pytest.fixture
+def segment(tmp_path):
+    return str(tmp_path / "segment")
+
+
+def _slot(store: SharedMemoryStore, index: int):
+    return SLOT.unpack_from(store._map, HEADER.size + index * SLOT.size)
+
+
+class TestOpenAddressing:
+    async def test_colliding_keys_probe_and_wrap_around(self, hashed, segment):
+        store = SharedMemoryStore(10, path=segment, slots=4, stripes=1, clock=_clock)
+        for key, cost in (("h3", 1), ("h7", 2), ("h11", 3)):
+            store.increment(key, cost)
+
+        assert [_slot(store, index)[0] for index in range(4)] == [7, 11, 0, 3]
+        assert store.increment("h3") == (1, 10)
+        assert store.increment("h7") == (2, 10)
+        assert store.increment("h11") == (3, 10)
+        await store.close()
+
+    async def test_keys_stay_within_their_stripe(self, hashed, segment):
+        store = SharedMemoryStore(10, path=segment, slots=8, stripes=2, clock=_clock)
+        store.increment("h1")  # stripe 1, slots 4-7
+        store.increment("h2")  # stripe 0, slots 0-3
+        assert _slot(store, 4)[0] == 1
+        assert _slot(store, 1)[0] == 2
+        await store.close()
+
+    async def test_expired_slots_are_reused(self, hashed, segment):
+        clock = FakeClock()
+        store = SharedMemoryStore(10, path=segment, slots=2, stripes=1, clock=clock)
+        store.increment("h2", 5)
+        store.increment("h4", 5)
+
+        clock.now += 20  # two windows later both slots are reclaimable
+        assert store.increment("h6") == (0, 10)
+        assert _slot(store, 0) == (6, 102, 1, 0)
+        assert _slot(store, 1) == (4, 100, 5, 0)
+        await store.close()
+
+    async def test_previous_window_slot_is_not_reused(self, hashed, segment):
+        clock = FakeClock()
+        store = SharedMemoryStore(10, path=segment, slots=2, stripes=1, clock=clock)
+        store.increment("h2", 10)
+        store.increment("h4", 10)
+
+        clock.now += 15
+        store.increment("h6")  # full: both keys still count via the previous window
+        assert store.increment("h2") == (5, 5)  # int(0 + 10 * 0.5)
+        await store.close()
+
+    async def test_full_table_falls_back_to_a_local_store(self, hashed, segment):
+        store = SharedMemoryStore(10, path=segment, slots=2, stripes=1, clock=_clock)
+        store.increment("h2")
+        store.increment("h4")
+
+        assert store.increment("h6", 2) == (0, 10)
+        assert store.increment("h6") == (2, 10)
+        assert {_slot(store, index)[0] for index in range(2)} == {2, 4}
+        await store.close()
+
+
+class TestSharedSegment:
+    async def test_stores_on_the_same_segment_share_counts(self, segment):
+        first = SharedMemoryStore(10, path=segment, slots=64, clock=_clock)
+        second = SharedMemoryStore(10, path=segment, slots=64, clock=_clock)
+        first.increment("client", 3)
+        assert second.increment("client") == (3, 10)
+        assert first.increment("client") == (4, 10)
+        await first.close()
+        await second.close()
+
+    async def test_incompatible_layout_is_rejected(self, segment):
+        store = SharedMemoryStore(10, path=segment, slots=64, stripes=8)
+        with pytest.raises(ValueError, match="incompatible layout"):
+            SharedMemoryStore(10, path=segment, slots=64, stripes=4)
+        await store.close()
+
+    async def test_processes_share_counts(self, segment):
+        requests = 500
+
+        def worker() -> None:
+            store = SharedMemoryStore(10, path=segment, slots=64, clock=_clock)
+            for _ in range(requests):
+                store.increment("client")
+
+        workers = [fork.Process(target=worker) for _ in range(2)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+            assert process.exitcode == 0
+
+        store = SharedMemoryStore(10, path=segment, slots=64, clock=_clock)
+        assert store.increment("client") == (2 * requests, 10)
+        await store.close()
@@ -0,0 +1,138 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from src.infrastructure.middleware.rate_limiting.sketch import (
+    CountMinSketch,
+    HeavyHitterStore,
+    TopK,
+)
+
+KEYS = [f"10.0.{i // 256}.{i % 256}" for i in range(2000)]
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def stream():
+    """A few heavy clients over a long tail, reproducibly"""
+    rng = random.Random(1234)
+    heavy = [KEYS[min(int(rng.paretovariate(1.1)) - 1, 1999)] for _ in range(20000)]
+    return heavy + [rng.choice(KEYS) for _ in range(20000)]
+
+
+class TestCountMinSketch:
+    def test_estimates_are_bounded_overestimates(self, stream):
+        width = 272
+        sketch = CountMinSketch(width=width, depth=4)
+        for key in stream:
+            sketch.add(key)
+
+        true_counts = Counter(stream)
+        error_bound = math.e / width * len(stream)
+        for key, count in true_counts.items():
+            assert count <= sketch.estimate(key) <= count + error_bound
+
+    def test_unseen_key_estimates_zero_in_an_empty_sketch(self):
+        assert CountMinSketch(width=64, depth=4).estimate("nobody") == 0
+
+    def test_add_returns_estimates_before_and_after(self):
+        sketch = CountMinSketch(width=1024, depth=4)
+        assert sketch.add("a", 3) == (0, 3)
+        assert sketch.add("a", 2) == (3, 5)
+
+    def test_conservative_update_never_exceeds_a_plain_update(self, stream):
+        sketch = CountMinSketch(width=64, depth=4)
+        plain = [0] * (64 * 4)
+        for key in stream:
+            sketch.add(key)
+            for i in sketch._indexes(key):
+                plain[i] += 1
+
+        overestimates = []
+        for key in set(stream):
+            plain_estimate = min(plain[i] for i in sketch._indexes(key))
+            assert sketch.estimate(key) <= plain_estimate
+            overestimates.append(plain_estimate - sketch.estimate(key))
+        assert sum(overestimates) > 0
+
+    def test_conservative_update_only_raises_the_lowest_counters(self):
+        sketch = CountMinSketch(width=1, depth=2)
+        # With one column every key shares every counter; skew one row.
+        sketch._counters[0] = 5
+        sketch.add("a", 2)
+        assert list(sketch._counters) == [5, 2]
+        sketch.add("a", 4)
+        assert list(sketch._counters) == [6, 6]
+
+
+class TestTopK:
+    def test_keeps_the_k_largest(self):
+        top = TopK(2)
+        top.offer("a", 5)
+        top.offer("b", 3)
+        top.offer("c", 4)
+        assert top.counts == {"a": 5, "c": 4}
+
+    def test_counts_at_or_below_the_smallest_do_not_displace(self):
+        top = TopK(2)
+        top.offer("a", 5)
+        top.offer("b", 3)
+        top.offer("c", 3)
+        top.offer("d", 1)
+        assert top.counts == {"a": 5, "b": 3}
+
+    def test_known_keys_are_updated_in_place(self):
+        top = TopK(2)
+        top.offer("a", 1)
+        top.offer("b", 2)
+        top.offer("a", 7)
+        top.offer("c", 2)
+        assert top.counts == {"a": 7, "b": 2}
+        top.offer("c", 3)
+        assert top.counts == {"a": 7, "c": 3}
+
+
+class TestHeavyHitterStore:
+    def test_previous_window_decays_with_its_overlap(self, clock):
+        store = HeavyHitterStore(10, width=1024, depth=4, clock=clock)
+        for _ in range(100):
+            store.increment("a")
+
+        clock.now = 1012.5
+        assert store.increment("a") == (75, 7.5)
+        clock.now = 1017.5
+        assert store.increment("a") == (26, 2.5)  # int(1 + 100 * 0.25)
+        clock.now = 1030.0
+        assert store.increment("a") == (0, 10)
+
+    def test_top_offenders(self, clock, stream):
+        store = HeavyHitterStore(10, width=1024, depth=4, top_k=8, clock=clock)
+        for key in stream:
+            store.increment(key)
+
+        true_counts = Counter(stream)
+        offenders = store.top_offenders(limit=3)
+        assert [key for key, _ in offenders] == [
+            key for key, _ in true_counts.most_common(3)
+        ]
+        for key, estimate in offenders:
+            assert estimate >= true_counts[key]
+
+        clock.now = 1015.0  # half of the previous window still counts
+        assert [key for key, _ in store.top_offenders(limit=3)] == [
+            key for key, _ in offenders
+        ]
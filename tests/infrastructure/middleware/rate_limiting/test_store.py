@@ -0,0 +1,138 @@
+import pytest
+
+from src.infrastructure.middleware.rate_limiting.store import (
+    SlidingWindowStore,
+    TokenBucketStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestSlidingWindowStore:
+    def test_counts_within_one_window(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        assert store.increment("a") == (0, 10)
+        clock.now += 4
+        assert store.increment("a") == (1, 6)
+        assert store.increment("a", cost=3) == (2, 6)
+        assert store.increment("a") == (5, 6)
+
+    def test_previous_window_is_weighted_by_its_overlap(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        for _ in range(10):
+            store.increment("a")
+
+        clock.now = 1012.5  # a quarter into the next window
+        assert store.increment("a") == (7, 7.5)  # int(0 + 10 * 0.75)
+        clock.now = 1017.5
+        assert store.increment("a") == (3, 2.5)  # int(1 + 10 * 0.25)
+        clock.now = 1019.99
+        assert store.increment("a")[0] == 2  # int(2 + 10 * 0.001)
+
+    def test_skipped_window_forgets_everything(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        for _ in range(10):
+            store.increment("a")
+        clock.now = 1020.0
+        assert store.increment("a") == (0, 10)
+
+    def test_idle_keys_are_evicted_on_rollover(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        store.increment("idle")
+        store.increment("busy")
+        assert len(store) == 2
+
+        clock.now = 1010.0
+        store.increment("busy")
+        assert len(store) == 2  # "idle" still counts through the previous window
+
+        clock.now = 1020.0
+        store.increment("busy")
+        assert len(store) == 1
+
+        clock.now = 1040.0
+        store.increment("other")
+        assert len(store) == 1
+
+    def test_keys_are_kept_as_their_hash(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        key = "203.0.113.7:/generator/create"
+        store.increment(key, cost=2)
+        store.increment("198.51.100.1")
+        assert store._current == {hash(key): 2, hash("198.51.100.1"): 1}
+        assert key not in store._current
+        assert store.increment(key) == (2, 10)
+
+    async def test_check_is_increment(self, clock):
+        store = SlidingWindowStore(window_seconds=10, clock=clock)
+        await store.check("a", cost=4)
+        assert await store.check("a") == (4, 10)
+
+
+class TestTokenBucketStore:
+    def test_full_bucket_allows_a_burst_of_its_capacity(self, clock):
+        store = TokenBucketStore(capacity=5, window_seconds=10, clock=clock)
+        used = [store.increment("a")[0] for _ in range(6)]
+        assert used == [0, 1, 2, 3, 4, 5]
+        # The sixth request did not fit and was not charged.
+        assert store.increment("a")[0] == 5
+
+    def test_refills_at_fractional_rates(self, clock):
+        store = TokenBucketStore(capacity=3, window_seconds=4, clock=clock)
+        assert store.refill_rate == 0.75
+        for _ in range(3):
+            store.increment("a")
+
+        clock.now += 1  # 0.75 tokens back, not enough for one request
+        used, wait = store.increment("a")
+        assert used == 3  # rounded up while rejected
+        assert wait == pytest.approx(0.25 / 0.75)
+
+        clock.now += 1  # 1.5 tokens: one request fits
+        used, wait = store.increment("a")
+        assert used == 1  # 1.5 in use, rounded down once accepted
+        assert wait == pytest.approx(2.5 / 0.75)
+
+    def test_cost_weighted_consumption(self, clock):
+        store = TokenBucketStore(capacity=10, window_seconds=10, clock=clock)
+        assert store.increment("a", cost=4) == (0, 4)
+        assert store.increment("a", cost=5) == (4, 9)
+        # Only one token is left: a request costing 3 is rejected whole.
+        used, wait = store.increment("a", cost=3)
+        assert used == 9
+        assert wait == pytest.approx(2)
+        assert store.increment("a", cost=1) == (9, 10)
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        store = TokenBucketStore(capacity=4, window_seconds=4, clock=clock)
+        store.increment("a", cost=4)
+        clock.now += 100
+        assert store.increment("a", cost=4) == (0, 4)
+        assert store.increment("a")[0] == 4
+
+    def test_clients_have_separate_buckets(self, clock):
+        store = TokenBucketStore(capacity=2, window_seconds=10, clock=clock)
+        store.increment("a", cost=2)
+        assert store.increment("b") == (0, 5)
+
+    def test_full_buckets_are_pruned(self, clock):
+        store = TokenBucketStore(capacity=2, window_seconds=10, clock=clock)
+        store.increment("idle")
+        clock.now += 9
+        store.increment("busy", cost=2)
+        assert len(store) == 2
+
+        clock.now += 1  # "idle" is full again, "busy" is not
+        store.increment("busy")
+        assert len(store) == 1
@@ -0,0 +1,95 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.infrastructure.observability.metrics import MERGED_SNAPSHOT, MetricsRegistry
+
+fork = multiprocessing.get_context("fork")
+
+
+def _registry(path) -> MetricsRegistry:
+    registry = MetricsRegistry(multiprocess_dir=str(path))
+    registry.counter("requests_total", "Requests", labels=("route",))
+    registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    registry.gauge("in_flight", "In flight")
+    return registry
+
+
+def _work(registry: MetricsRegistry, requests: int) -> None:
+    registry._metrics["requests_total"].labels("/a").inc(requests)
+    registry._metrics["latency_seconds"].observe(0.5)
+    registry._metrics["in_flight"].set(7)
+    registry.flush()
+
+
+def _run_worker(registry: MetricsRegistry, requests: int) -> int:
+    """Flush ``requests`` from a forked worker; returns its (reaped) pid"""
+    worker = fork.Process(target=_work, args=(registry, requests))
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    return worker.pid
+
+
+def _samples(collected, name):
+    return {tuple(labels): value for labels, value in collected[name]["samples"]}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return _registry(tmp_path)
+
+
+class TestClearMultiprocessDir:
+    def test_removes_snapshots_of_earlier_runs(self, registry, tmp_path):
+        (tmp_path / "12345.json").write_text("{}")
+        (tmp_path / "12345.tmp").write_text("{}")
+        (tmp_path / MERGED_SNAPSHOT).write_text("{}")
+        registry.clear_multiprocess_dir()
+        assert list(tmp_path.glob("*.json")) == []
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_without_directory_is_a_no_op(self):
+        MetricsRegistry().clear_multiprocess_dir()
+
+
+class TestMarkProcessDead:
+    def test_folds_counters_and_histograms_and_drops_gauges(self, registry, tmp_path):
+        pid = _run_worker(registry, 3)
+        registry.mark_process_dead(pid)
+
+        assert not (tmp_path / f"{pid}.json").exists()
+        merged = json.loads((tmp_path / MERGED_SNAPSHOT).read_text())
+        assert "in_flight" not in merged
+        assert _samples(merged, "requests_total") == {("/a",): 3}
+        assert _samples(merged, "latency_seconds") == {(): [0, 1, 0, 0.5]}
+
+    def test_reaped_workers_accumulate(self, registry):
+        for requests in (3, 4):
+            registry.mark_process_dead(_run_worker(registry, requests))
+
+        collected = registry.collect()
+        assert _samples(collected, "requests_total") == {("/a",): 7}
+        assert _samples(collected, "latency_seconds") == {(): [0, 2, 0, 1.0]}
+        # Only this (live) process contributes a gauge.
+        assert _samples(collected, "in_flight") == {(): 0}
+
+    def test_reused_pid_starts_from_an_empty_file(self, registry, tmp_path):
+        pid = _run_worker(registry, 3)
+        registry.mark_process_dead(pid)
+        # A later worker with the same pid flushes only its own counts.
+        snapshot = registry.snapshot()["requests_total"]
+        snapshot["samples"] = [[["/a"], 5]]
+        (tmp_path / f"{pid}.json").write_text(json.dumps({"requests_total": snapshot}))
+        assert _samples(registry.collect(), "requests_total") == {("/a",): 8}
+
+    def test_unknown_pid_is_ignored(self, registry, tmp_path):
+        registry.mark_process_dead(os.getpid() + 100000)
+        assert not (tmp_path / MERGED_SNAPSHOT).exists()
+
+    def test_unreadable_snapshot_is_dropped(self, registry, tmp_path):
+        (tmp_path / "4242.json").write_text("{not json")
+        registry.mark_process_dead(4242)
+        assert not (tmp_path / "4242.json").exists()
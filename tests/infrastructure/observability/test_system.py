@@ -0,0 +1,22 @@
+from src.infrastructure.observability.system import SystemMetricsSampler
+
+
+class TestSystemMetricsSampler:
+    def test_stale_snapshot_is_refreshed_while_not_running(self):
+        sampler = SystemMetricsSampler(interval=5.0)
+        first = sampler.snapshot
+        assert sampler.snapshot is first
+
+        sampler._snapshot = first.__class__(
+            **{**first.__dict__, "taken_at": first.taken_at - 10}
+        )
+        assert sampler.snapshot.taken_at >= first.taken_at
+
+    def test_running_sampler_snapshot_is_served_as_is(self):
+        sampler = SystemMetricsSampler(interval=3600.0)
+        sampler.start()
+        try:
+            snapshot = sampler.snapshot
+            assert sampler.snapshot is snapshot
+        finally:
+            sampler.stop()
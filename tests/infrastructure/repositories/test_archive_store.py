@@ -0,0 +1,107 @@
+import multiprocessing
+
+import pytest
+
+from src.infrastructure.repositories.archive_store import ArchiveStore
+
+fork = multiprocessing.get_context("fork")
+
+CONTENT = b"PK" + bytes(range(256))
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return ArchiveStore(ttl_seconds=60, max_bytes=1024, directory=tmp_path, clock=clock)
+
+
+def _put(directory, content: bytes, alias: str) -> None:
+    ArchiveStore(ttl_seconds=60, max_bytes=1024, directory=directory).put(
+        content, "demo.zip", alias=alias
+    )
+
+
+class TestSharedAcrossWorkers:
+    def test_archive_stored_by_another_process_is_served(self, tmp_path):
+        worker = fork.Process(target=_put, args=(tmp_path, CONTENT, '"etag"'))
+        worker.start()
+        worker.join()
+        assert worker.exitcode == 0
+
+        store = ArchiveStore(ttl_seconds=60, max_bytes=1024, directory=tmp_path)
+        by_alias = store.get_by_alias('"etag"')
+        assert by_alias is not None
+        assert by_alias.content == CONTENT
+        assert by_alias.filename == "demo.zip"
+        assert store.get(by_alias.digest) == by_alias
+
+
+class TestPut:
+    def test_round_trip(self, store, clock):
+        archive = store.put(CONTENT, "demo.zip")
+        assert archive.kept
+        assert store.get(archive.digest) == archive
+        assert archive.expires_at == clock.now + 60
+
+    def test_archive_larger_than_the_store_is_not_kept(self, store):
+        archive = store.put(b"x" * 2048, "big.zip", alias="big")
+        assert not archive.kept
+        assert archive.content == b"x" * 2048
+        assert store.get(archive.digest) is None
+        assert store.get_by_alias("big") is None
+
+    def test_oldest_archives_are_dropped_past_max_bytes(self, store, clock):
+        first = store.put(b"a" * 400, "a.zip")
+        clock.now += 1
+        second = store.put(b"b" * 400, "b.zip")
+        clock.now += 1
+        third = store.put(b"c" * 400, "c.zip")
+        assert store.get(first.digest) is None
+        assert store.get(second.digest) is not None
+        assert store.get(third.digest) is not None
+        assert store.size <= 1024
+
+    def test_storing_again_refreshes_the_ttl(self, store, clock):
+        archive = store.put(CONTENT, "demo.zip")
+        clock.now += 50
+        store.put(CONTENT, "demo.zip")
+        clock.now += 50
+        assert store.get(archive.digest) is not None
+
+
+class TestExpiry:
+    def test_expired_archive_and_alias_miss(self, store, clock):
+        archive = store.put(CONTENT, "demo.zip", alias="etag")
+        clock.now += 60
+        assert store.get(archive.digest) is None
+        assert store.get_by_alias("etag") is None
+
+    def test_put_sweeps_expired_files(self, store, clock, tmp_path):
+        store.put(CONTENT, "demo.zip", alias="etag")
+        clock.now += 61
+        fresh = store.put(b"fresh", "fresh.zip")
+        assert len(store) == 1
+        assert [path.name for path in tmp_path.iterdir()] == [f"{fresh.digest}.archive"]
+
+    def test_unrelated_files_are_left_alone(self, store, clock, tmp_path):
+        (tmp_path / "notes.txt").write_text("keep me")
+        clock.now += 3600
+        store.put(CONTENT, "demo.zip")
+        assert (tmp_path / "notes.txt").exists()
+
+
+@pytest.mark.parametrize("digest", ["0", "../secret", "A" * 64])
+def test_malformed_digest_misses(store, digest):
+    assert store.get(digest) is None
@@ -0,0 +1,33 @@
+from src.infrastructure.repositories.jinja_template_repository import (
+    JinjaTemplateRepository,
+)
+
+
+def _tree(tmp_path):
+    (tmp_path / "basic").mkdir()
+    (tmp_path / "basic" / "main.py.jinja").write_text("print({{ name }})\n")
+    (tmp_path / "common.jinja").write_text("# common\n")
+    return tmp_path
+
+
+class TestTreeDigest:
+    def test_same_tree_same_digest(self, tmp_path):
+        first = JinjaTemplateRepository(str(_tree(tmp_path)))
+        second = JinjaTemplateRepository(str(tmp_path))
+        assert first.tree_digest() == second.tree_digest()
+
+    def test_edited_template_changes_the_digest(self, tmp_path):
+        before = JinjaTemplateRepository(str(_tree(tmp_path))).tree_digest()
+        (tmp_path / "basic" / "main.py.jinja").write_text("print({{ name }}!)\n")
+        assert JinjaTemplateRepository(str(tmp_path)).tree_digest() != before
+
+    def test_renamed_template_changes_the_digest(self, tmp_path):
+        before = JinjaTemplateRepository(str(_tree(tmp_path))).tree_digest()
+        (tmp_path / "common.jinja").rename(tmp_path / "shared.jinja")
+        assert JinjaTemplateRepository(str(tmp_path)).tree_digest() != before
+
+    def test_digest_is_computed_once(self, tmp_path):
+        repository = JinjaTemplateRepository(str(_tree(tmp_path)))
+        digest = repository.tree_digest()
+        (tmp_path / "common.jinja").write_text("# changed after loading\n")
+        assert repository.tree_digest() == digest
@@ -0,0 +1,128 @@
+import pytest
+
+from src.domain.entities.locked_dependency import LockedDependency
+from src.infrastructure.exceptions.dependency_resolution import (
+    DependencyResolutionError,
+)
+from src.infrastructure.resolvers.index_resolver import IndexDependencyResolver
+from src.infrastructure.resolvers.package_index import PackageIndex
+
+
+def _release(*requires_dist, requires_python=None):
+    return {
+        "requires_python": requires_python,
+        "requires_dist": list(requires_dist),
+        "hashes": ["sha256:00"],
+    }
+
+
+def _pins(resolution):
+    return {dependency.name: dependency.version for dependency in resolution}
+
+
+@pytest.fixture
+def resolver():
+    index = PackageIndex(
+        {
+            # The newest "app" needs an old "core" that "plugin" rejects.
+            "app": {"2.0": _release("core<2"), "1.0": _release("core>=1")},
+            "plugin": {"1.0": _release("core>=2")},
+            "core": {"1.0": _release(), "2.0": _release()},
+            "web": {
+                "1.0": _release(
+                    "backport; python_version < '3.11'",
+                    "winhelper; sys_platform == 'win32'",
+                    "speedups; extra == 'fast'",
+                )
+            },
+            "backport": {"1.0": _release()},
+            "winhelper": {"1.0": _release()},
+            "speedups": {
+                "1.1": _release(requires_python=">=3.11"),
+                "1.0": _release(),
+            },
+            "broken": {"1.0": _release("core>=3")},
+        }
+    )
+    return IndexDependencyResolver(index)
+
+
+class TestResolve:
+    def test_newest_release_is_picked(self, resolver):
+        assert resolver.resolve(["core"], "3.10") == (
+            LockedDependency(name="core", version="2.0", hashes=("sha256:00",)),
+        )
+
+    def test_backtracks_out_of_a_conflict(self, resolver):
+        assert _pins(resolver.resolve(["app", "plugin"], "3.10")) == {
+            "app": "1.0",
+            "core": "2.0",
+            "plugin": "1.0",
+        }
+
+    def test_environment_markers_follow_the_python_version(self, resolver):
+        assert _pins(resolver.resolve(["web"], "3.10")) == {
+            "backport": "1.0",
+            "web": "1.0",
+        }
+        assert _pins(resolver.resolve(["web"], "3.12")) == {"web": "1.0"}
+
+    def test_top_level_markers_are_evaluated(self, resolver):
+        assert resolver.resolve(["winhelper; sys_platform == 'win32'"], "3.10") == ()
+
+    def test_extras_pull_in_their_dependencies(self, resolver):
+        assert _pins(resolver.resolve(["web[fast]"], "3.12")) == {
+            "speedups": "1.1",
+            "web": "1.0",
+        }
+        # requires_python keeps the newest speedups off Python 3.10.
+        assert _pins(resolver.resolve(["web[fast]"], "3.10"))["speedups"] == "1.0"
+
+    def test_extras_requested_after_pinning_are_added(self, resolver):
+        assert "speedups" in _pins(resolver.resolve(["web", "web[fast]"], "3.12"))
+
+
+class TestMemoisation:
+    def test_same_requirement_set_is_solved_once(self, resolver, monkeypatch):
+        solves = []
+        solve = resolver._solve
+        monkeypatch.setattr(
+            resolver, "_solve", lambda *args: solves.append(args) or solve(*args)
+        )
+
+        first = resolver.resolve(["app", "plugin"], "3.10")
+        assert resolver.resolve(["Plugin", "app"], "3.10") is first
+        assert len(solves) == 1
+        resolver.resolve(["app", "plugin"], "3.11")
+        assert len(solves) == 2
+
+    def test_cache_is_bounded(self, resolver):
+        resolver.max_cached = 2
+        for requirement in ("core", "app", "plugin"):
+            resolver.resolve([requirement], "3.10")
+        assert len(resolver._cache) == 2
+        assert ("3.10", frozenset({"core[]"})) not in resolver._cache
+
+
+class TestResolutionErrors:
+    def test_unknown_package(self, resolver):
+        with pytest.raises(DependencyResolutionError, match="nothere is not in"):
+            resolver.resolve(["nothere"], "3.10")
+
+    def test_no_solution(self, resolver):
+        with pytest.raises(DependencyResolutionError, match="No combination"):
+            resolver.resolve(["broken"], "3.10")
+
+    def test_no_release_for_the_python_version(self, resolver):
+        with pytest.raises(DependencyResolutionError, match="on Python 3.10"):
+            resolver.resolve(["speedups>1.0"], "3.10")
+
+    def test_gives_up_after_max_attempts(self, resolver):
+        resolver.max_attempts = 2
+        with pytest.raises(DependencyResolutionError, match="Gave up after 2"):
+            resolver.resolve(["app", "plugin"], "3.10")
+
+    def test_failures_are_not_memoised(self, resolver):
+        with pytest.raises(DependencyResolutionError):
+            resolver.resolve(["broken"], "3.10")
+        assert resolver._cache == {}
@@ -0,0 +1,12 @@
+import pytest
+
+from benchmarks.startup import median_cold_start_ms
+from src.infrastructure.config.settings import settings
+
+
+@pytest.mark.perf
+def test_cold_start_is_within_budget():
+    median = median_cold_start_ms(runs=5)
+    assert (
+        median <= settings.STARTUP_BUDGET_MS
+    ), f"cold start median {median:.0f} ms exceeds {settings.STARTUP_BUDGET_MS} ms"